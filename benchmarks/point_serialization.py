@@ -0,0 +1,37 @@
+"""
+Micro benchmark of per geometry serialization overhead for points, run with
+python -m benchmarks.point_serialization
+"""
+import timeit
+
+from shapely.geometry import Point
+
+from geo_pyspark.sql.geometry import GeometryFactory
+from geo_pyspark.utils.binary_parser import BinaryParser
+
+NUMBER_OF_POINTS = 100000
+
+
+def point_bytes() -> bytes:
+    return bytes(bytearray(value & 0xFF for value in GeometryFactory.to_bytes(Point(21.0, 52.0))))
+
+
+def decode_points(data: bytes):
+    for _ in range(NUMBER_OF_POINTS):
+        GeometryFactory.geometry_from_bytes(BinaryParser(data))
+
+
+def encode_points(point: Point):
+    for _ in range(NUMBER_OF_POINTS):
+        GeometryFactory.to_bytes(point)
+
+
+def report(name: str, seconds: float):
+    print(f"{name}: {seconds / NUMBER_OF_POINTS * 1e6:.2f} us per point")
+
+
+if __name__ == "__main__":
+    data = point_bytes()
+    point = Point(21.0, 52.0)
+    report("decode", min(timeit.repeat(lambda: decode_points(data), number=1, repeat=3)))
+    report("encode", min(timeit.repeat(lambda: encode_points(point), number=1, repeat=3)))
@@ -3,8 +3,12 @@ from pyspark import SparkContext, StorageLevel, RDD
 from geo_pyspark.core.SpatialRDD.spatial_rdd import SpatialRDD, JvmSpatialRDD
 from geo_pyspark.core.SpatialRDD.spatial_rdd_factory import SpatialRDDFactory
 from geo_pyspark.core.enums.file_data_splitter import FileSplitterJvm, FileDataSplitter
-from geo_pyspark.core.utils import JvmStorageLevel
+from geo_pyspark.core.utils import JvmStorageLevel, require
+from geo_pyspark.register.java_libs import GeoSparkLib
 from geo_pyspark.utils.meta import MultipleMeta
+from geo_pyspark.utils.rdd_pickling import GeoSparkPickler
+
+MAX_POINTS_PER_RECORD = 65536
 
 
 class PointRDD(SpatialRDD, metaclass=MultipleMeta):
@@ -384,6 +388,20 @@ class PointRDD(SpatialRDD, metaclass=MultipleMeta):
     def MinimumBoundingRectangle(self):
         raise NotImplementedError("PointRDD has not MinimumBoundingRectangle method.")
 
+    @require([GeoSparkLib.PointArraySerializer])
+    def getRawPointArrays(self, withUserData: bool = False, maxPointsPerRecord: int = MAX_POINTS_PER_RECORD) -> RDD:
+        """
+        Transfers raw points as packed x, y arrays instead of GeoData objects, each record is PointArray
+        with at most maxPointsPerRecord points.
+        :param withUserData: bool, transfer user data as well
+        :param maxPointsPerRecord: int
+        :return: RDD of PointArray
+        """
+        serialized_points = self._jvm.PointArraySerializer.serializePointsToPython(
+            self._srdd.getRawSpatialRDD(), withUserData, maxPointsPerRecord
+        )
+        return RDD(serialized_points, self._sc, GeoSparkPickler())
+
     @property
     def _jvm_spatial_rdd(self):
         spatial_factory = SpatialRDDFactory(self._sc)
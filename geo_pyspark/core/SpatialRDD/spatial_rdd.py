@@ -1,9 +1,10 @@
 import pickle
-from typing import Optional, List, Union
+import struct
+from typing import Optional, List, Union, Tuple
 
 import attr
-from py4j.java_gateway import get_field
-from pyspark import SparkContext, RDD
+from py4j.java_gateway import get_field, set_field
+from pyspark import SparkContext, RDD, StorageLevel
 from pyspark.sql import SparkSession
 
 from geo_pyspark.core.SpatialRDD.spatial_rdd_factory import SpatialRDDFactory
@@ -12,10 +13,37 @@ from geo_pyspark.core.enums.index_type import IndexTypeJvm, IndexType
 from geo_pyspark.core.enums.spatial import SpatialType
 from geo_pyspark.core.geom_types import Envelope
 from geo_pyspark.core.jvm.partitioner import JvmPartitioner
+from geo_pyspark.core.space_filling_curve import validate as validate_curve
+from geo_pyspark.core.spatial_statistics import SpatialRDDStatistics, PartitionStatsReport, PartitionStatistics
+from geo_pyspark.core.utils import require, JvmStorageLevel, ImportedJvmLib
+from geo_pyspark.register.java_libs import GeoSparkLib
 from geo_pyspark.utils.rdd_pickling import GeoSparkPickler
 from geo_pyspark.utils.types import crs
 
 
+COMPRESSION_CODECS = {
+    "gzip": "org.apache.hadoop.io.compress.GzipCodec",
+    "bzip2": "org.apache.hadoop.io.compress.BZip2Codec",
+    "deflate": "org.apache.hadoop.io.compress.DefaultCodec",
+    "snappy": "org.apache.hadoop.io.compress.SnappyCodec",
+    "lz4": "org.apache.hadoop.io.compress.Lz4Codec",
+    "zstd": "org.apache.hadoop.io.compress.ZStandardCodec"
+}
+
+
+def codec_class_name(codec: str) -> str:
+    """
+    Hadoop codec class name for short codec name, class names are returned unchanged. bzip2 output is
+    splittable, snappy, lz4 and zstd require hadoop native libraries.
+    """
+    if "." in codec:
+        return codec
+    try:
+        return COMPRESSION_CODECS[codec.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown compression codec {codec}, use one of {list(COMPRESSION_CODECS)} or codec class name")
+
+
 @attr.s
 class SpatialPartitioner:
     name = attr.ib()
@@ -32,6 +60,28 @@ class SpatialPartitioner:
 
         return cls(partitioner, jvm_partitioner)
 
+    @require([GeoSparkLib.SpatialPartitionerSerializer])
+    def save(self, path: str):
+        """
+        Saves partitioner (grids and partitioning tree) to file, so next runs can pass it to spatialPartitioning
+        without analyzing and sampling data again.
+        :param path: str, file location, any file system supported by hadoop can be used
+        """
+        if self.jvm_partitioner is None:
+            raise AttributeError("Please run spatial partitioning before")
+        SparkContext._jvm.SpatialPartitionerSerializer.save(self.jvm_partitioner, path)
+
+    @classmethod
+    @require([GeoSparkLib.SpatialPartitionerSerializer])
+    def load(cls, path: str) -> 'SpatialPartitioner':
+        """
+        Loads partitioner saved with SpatialPartitioner.save. Spatial RDDs partitioned with the same loaded
+        partitioner are co-partitioned.
+        :param path: str, file location
+        :return: SpatialPartitioner
+        """
+        return cls.from_java_class_name(SparkContext._jvm.SpatialPartitionerSerializer.load(path))
+
 
 class SpatialValidator:
 
@@ -78,6 +128,10 @@ class GeoDataSerializer:
 
 class SpatialRDD:
 
+    _partitioner_grid_bounds = None
+    _statistics = None
+    _partition_stats = None
+
     def __init__(self, sparkContext: Optional[SparkContext] = None):
         self._sc = sparkContext
         self._srdd = None
@@ -105,13 +159,62 @@ class SpatialRDD:
 
     def analyze(self) -> bool:
         """
-        Analyze SpatialRDD
+        Analyze SpatialRDD, boundary, count and per partition statistics are computed in one pass and cached,
+        so next calls do not scan data again until it is changed. When SpatialStatistics is not available in
+        installed jar GeoSpark analyze is used and statistics hold one entry for whole SpatialRDD.
         :return: bool,
         """
-        self._srdd.analyze()
+        if self._statistics is None:
+            if ImportedJvmLib.has_library(GeoSparkLib.SpatialStatistics):
+                self._statistics = SpatialRDDStatistics.from_bytes(self._jvm.SpatialStatistics.analyze(self._srdd))
+            else:
+                self._srdd.analyze()
+                self._statistics = self._jvm_statistics()
         self._is_analyzed = True
         return self._is_analyzed
 
+    def _jvm_statistics(self) -> SpatialRDDStatistics:
+        count = get_field(self._srdd, "approximateTotalCount")
+        jvm_boundary = get_field(self._srdd, "boundaryEnvelope")
+        boundary = Envelope.from_jvm_instance(jvm_boundary) if count > 0 and jvm_boundary is not None else None
+        return SpatialRDDStatistics([PartitionStatistics(0, count, boundary)])
+
+    @property
+    def statistics(self) -> SpatialRDDStatistics:
+        """
+        Cached analyze statistics, analyze is run when they are not available.
+        :return: SpatialRDDStatistics
+        """
+        self.analyze()
+        return self._statistics
+
+    def saveStatistics(self, path: str):
+        """
+        Saves analyze statistics as json text file, so they can be loaded together with saved data.
+        :param path: str, output location
+        """
+        self._sc.parallelize([self.statistics.to_json()], 1).saveAsTextFile(path)
+
+    def loadStatistics(self, path: str) -> bool:
+        """
+        Loads statistics saved with saveStatistics instead of running analyze, statistics have to describe
+        current data.
+        :param path: str, statistics location
+        :return: bool
+        """
+        statistics = SpatialRDDStatistics.from_json("".join(self._sc.textFile(path).collect()))
+        boundary = statistics.boundary
+        set_field(self._srdd, "boundaryEnvelope", boundary.create_jvm_instance(self._jvm) if boundary is not None else None)
+        set_field(self._srdd, "approximateTotalCount", statistics.count)
+        self._statistics = statistics
+        self._is_analyzed = True
+        return self._is_analyzed
+
+    def _invalidate_statistics(self):
+        self._statistics = None
+        self._partition_stats = None
+        self._is_analyzed = False
+
     def CRSTransform(self, sourceEpsgCRSCode: crs, targetEpsgCRSCode: crs) -> bool:
         """
         Function transforms coordinates from one crs to another one
@@ -119,6 +222,7 @@ class SpatialRDD:
         :param targetEpsgCRSCode: crs, Coordinate Reference System to transform to
         :return: bool, True if transforming was correct
         """
+        self._invalidate_statistics()
         return self._srdd.CRSTransform(sourceEpsgCRSCode, targetEpsgCRSCode)
 
     def MinimumBoundingRectangle(self):
@@ -176,6 +280,66 @@ class SpatialRDD:
         else:
             raise AttributeError("Please run spatial partitioning before")
 
+    @require([GeoSparkLib.IndexedRDDPersistence])
+    def saveIndexed(self, path: str):
+        """
+        Saves built index, index on spatially partitioned RDD is saved together with partitioner, otherwise
+        index on raw RDD is saved.
+        :param path: str, output directory on any file system supported by hadoop
+        """
+        self._jvm.IndexedRDDPersistence.save(self._srdd, path)
+
+    @classmethod
+    @require([GeoSparkLib.IndexedRDDPersistence])
+    def loadIndexed(cls, sc: SparkContext, path: str, newLevel: StorageLevel = StorageLevel.MEMORY_ONLY) -> 'SpatialRDD':
+        """
+        Loads SpatialRDD saved with saveIndexed without building index again. When index was built on spatially
+        partitioned RDD, partitioner, spatially partitioned RDD and indexed RDD are restored.
+        :param sc: SparkContext
+        :param path: str, location used in saveIndexed
+        :param newLevel: StorageLevel, storage level of loaded indexes
+        :return: SpatialRDD
+        """
+        spatial_rdd = SpatialRDD(sc)
+        new_level_jvm = JvmStorageLevel(sc._jvm, newLevel).jvm_instance
+        spatial_rdd._spatial_partitioned = sc._jvm.IndexedRDDPersistence.load(spatial_rdd._srdd, path, new_level_jvm)
+        return spatial_rdd
+
+    @require([GeoSparkLib.PartitionedDataset])
+    def savePartitioned(self, path: str):
+        """
+        Saves each spatial partition as separate WKB file together with manifest of file envelopes and counts,
+        so loadPartitioned opens only files intersecting query window.
+        :param path: str, output directory on any file system supported by hadoop
+        """
+        self._jvm.PartitionedDataset.save(self._srdd, path)
+
+    @classmethod
+    @require([GeoSparkLib.PartitionedDataset])
+    def loadPartitioned(cls, sc: SparkContext, path: str, queryWindow: Optional[Envelope] = None) -> 'SpatialRDD':
+        """
+        Loads SpatialRDD saved with savePartitioned, only files which envelopes intersect query window are read.
+        :param sc: SparkContext
+        :param path: str, location used in savePartitioned
+        :param queryWindow: Envelope, geometries which envelopes intersect query window are loaded, all when None
+        :return: SpatialRDD
+        """
+        spatial_rdd = SpatialRDD(sc)
+        jvm_window = queryWindow.create_jvm_instance(sc._jvm) if queryWindow is not None else None
+        sc._jvm.PartitionedDataset.load(spatial_rdd._srdd, path, jvm_window)
+        return spatial_rdd
+
+    @classmethod
+    @require([GeoSparkLib.PartitionedDataset])
+    def readManifest(cls, sc: SparkContext, path: str) -> SpatialRDDStatistics:
+        """
+        Count and envelope of each file saved with savePartitioned.
+        :param sc: SparkContext
+        :param path: str, location used in savePartitioned
+        :return: SpatialRDDStatistics
+        """
+        return SpatialRDDStatistics.from_bytes(sc._jvm.PartitionedDataset.manifest(path))
+
     def countWithoutDuplicates(self) -> int:
         """
 
@@ -209,6 +373,21 @@ class SpatialRDD:
         """
         return self._srdd.getCRStransformation()
 
+    @require([GeoSparkLib.SpatialStatistics])
+    def partitionStats(self) -> PartitionStatsReport:
+        """
+        Count, envelope, number of vertices and serialized size per partition computed in one job, spatially
+        partitioned RDD is used when available, raw RDD otherwise. Report is cached like analyze statistics
+        until data or partitioning changes.
+        :return: PartitionStatsReport, with skew summary
+        """
+        if self._partition_stats is None:
+            jrdd = get_field(self._srdd, "spatialPartitionedRDD")
+            if jrdd is None:
+                jrdd = self._srdd.getRawSpatialRDD()
+            self._partition_stats = PartitionStatsReport.from_bytes(self._jvm.SpatialStatistics.partitionReport(jrdd))
+        return self._partition_stats
+
     def getPartitioner(self) -> SpatialPartitioner:
         """
 
@@ -216,6 +395,37 @@ class SpatialRDD:
         """
         return SpatialPartitioner.from_java_class_name(self._srdd.getPartitioner())
 
+    @require([GeoSparkLib.RangeQueryPruning])
+    def getOverlappingPartitionIds(self, queryWindow: Envelope) -> Optional[List[int]]:
+        """
+        Returns ids of spatially partitioned RDD partitions which grids intersect query window. Partitions not
+        described by partitioner grids (overflow partition) are always returned.
+        :param queryWindow: Envelope, query window
+        :return: List[int], partition ids or None if SpatialRDD is not spatially partitioned
+        """
+        spatial_partitioned_rdd = get_field(self._srdd, "spatialPartitionedRDD")
+        if spatial_partitioned_rdd is None:
+            return None
+
+        grid_bounds = self._get_partitioner_grid_bounds()
+        number_of_partitions = spatial_partitioned_rdd.getNumPartitions()
+
+        partition_ids = [
+            partition_id for partition_id, (minx, maxx, miny, maxy) in enumerate(grid_bounds)
+            if minx <= queryWindow.maxx and queryWindow.minx <= maxx and
+            miny <= queryWindow.maxy and queryWindow.miny <= maxy
+        ]
+        partition_ids.extend(range(len(grid_bounds), number_of_partitions))
+
+        return partition_ids
+
+    def _get_partitioner_grid_bounds(self) -> List[Tuple[float, float, float, float]]:
+        if self._partitioner_grid_bounds is None:
+            jvm_grids = self._srdd.getPartitioner().getGrids()
+            serialized_grids = self._jvm.RangeQueryPruning.serializeEnvelopes(jvm_grids)
+            self._partitioner_grid_bounds = list(struct.iter_unpack("<4d", serialized_grids))
+        return self._partitioner_grid_bounds
+
     def getRawSpatialRDD(self):
         """
 
@@ -309,11 +519,15 @@ class SpatialRDD:
     @property
     def partitionTree(self) -> JvmPartitioner:
         """
-
-        :return:
+        Returns quad tree used for partitioning, for other grid types partitioner itself is wrapped, so its
+        tree (KDB tree or flat grids) can be inspected from Python.
+        :return: JvmPartitioner
         """
+        partition_tree = get_field(self._srdd, "partitionTree")
+        if partition_tree is None:
+            partition_tree = self._srdd.getPartitioner()
 
-        return JvmPartitioner(get_field(self._srdd, "partitionTree"))
+        return JvmPartitioner(partition_tree)
 
     @property
     def rawSpatialRDD(self):
@@ -330,38 +544,83 @@ class SpatialRDD:
             self._sc = spatial_rdd._sc
             self._jvm = spatial_rdd._jvm
             self._spatial_partitioned = spatial_rdd._spatial_partitioned
+            self._partitioner_grid_bounds = None
+            self._statistics = spatial_rdd._statistics
+            self._partition_stats = spatial_rdd._partition_stats
+            self._is_analyzed = spatial_rdd._is_analyzed
         else:
-            self._srdd.setRawSpatialRDD(spatial_rdd)
+            self.setRawSpatialRDD(spatial_rdd)
 
-    def saveAsGeoJSON(self, path: str):
+    def saveAsGeoJSON(self, path: str, codec: Optional[str] = None):
         """
+        Output written with codec (requires SpatialRDDWriter from geo_wrapper jar) is the same as GeoSpark one.
 
-        :param path:
+        :param path: str, output location
+        :param codec: str, compression codec, one of COMPRESSION_CODECS or hadoop codec class name
         :return:
         """
-        return self._srdd.saveAsGeoJSON(path)
+        if codec is None:
+            return self._srdd.saveAsGeoJSON(path)
+        save = require([GeoSparkLib.SpatialRDDWriter])(self._jvm.SpatialRDDWriter.saveAsGeoJSON)
+        return save(self._srdd, path, codec_class_name(codec))
 
-    def saveAsWKB(self, path: str):
+    def saveAsWKB(self, path: str, codec: Optional[str] = None):
         """
+        Output written with codec (requires SpatialRDDWriter from geo_wrapper jar) is the same as GeoSpark one.
 
-        :param path:
+        :param path: str, output location
+        :param codec: str, compression codec, one of COMPRESSION_CODECS or hadoop codec class name
         :return:
         """
-        return self._srdd.saveAsWKB(path)
+        if codec is None:
+            return self._srdd.saveAsWKB(path)
+        save = require([GeoSparkLib.SpatialRDDWriter])(self._jvm.SpatialRDDWriter.saveAsWKB)
+        return save(self._srdd, path, codec_class_name(codec))
 
-    def saveAsWKT(self, path: str):
+    def saveAsWKT(self, path: str, codec: Optional[str] = None):
         """
+        Output written with codec (requires SpatialRDDWriter from geo_wrapper jar) is the same as GeoSpark one.
 
-        :param path:
+        :param path: str, output location
+        :param codec: str, compression codec, one of COMPRESSION_CODECS or hadoop codec class name
         :return:
         """
-        return self._srdd.saveAsWKT(path)
+        if codec is None:
+            return self._srdd.saveAsWKT(path)
+        save = require([GeoSparkLib.SpatialRDDWriter])(self._jvm.SpatialRDDWriter.saveAsWKT)
+        return save(self._srdd, path, codec_class_name(codec))
+
+    @require([GeoSparkLib.SpatialRDDWriter])
+    def saveAsWKBSequenceFile(self, path: str, codec: Optional[str] = None):
+        """
+        Saves geometries as sequence file of WKB and user data records, compressed in blocks when codec is given.
+        Reading it back with loadWKBSequenceFile does not parse text.
+        :param path: str, output location
+        :param codec: str, compression codec, one of COMPRESSION_CODECS or hadoop codec class name
+        """
+        self._jvm.SpatialRDDWriter.saveAsWKBSequenceFile(
+            self._srdd, path, codec_class_name(codec) if codec is not None else None
+        )
+
+    @classmethod
+    @require([GeoSparkLib.SpatialRDDWriter])
+    def loadWKBSequenceFile(cls, sc: SparkContext, path: str) -> 'SpatialRDD':
+        """
+        Loads SpatialRDD saved with saveAsWKBSequenceFile, compression codec is detected by hadoop.
+        :param sc: SparkContext
+        :param path: str, location used in saveAsWKBSequenceFile
+        :return: SpatialRDD
+        """
+        spatial_rdd = SpatialRDD(sc)
+        sc._jvm.SpatialRDDWriter.readWKBSequenceFile(spatial_rdd._srdd, path)
+        return spatial_rdd
 
     def setRawSpatialRDD(self, jrdd):
         """
 
         :return:
         """
+        self._invalidate_statistics()
         return self._srdd.setRawSpatialRDD(jrdd)
 
     def setSampleNumber(self, sampleNumber: int) -> bool:
@@ -402,12 +661,40 @@ class SpatialRDD:
         else:
             raise TypeError("Grid does not have correct type")
         self._spatial_partitioned = True
+        self._partitioner_grid_bounds = None
+        self._statistics = None
+        self._partition_stats = None
         return self._srdd.spatialPartitioning(
             grid
         )
 
+    @require([GeoSparkLib.SpaceFillingCurve])
+    def sortWithinPartitions(self, curve: str = "hilbert", precision: int = 16) -> bool:
+        """
+        Sorts geometries within partitions by Hilbert or Z-order key of their envelope center, extent is
+        boundary from analyze. Spatially partitioned RDD is sorted when available, raw RDD otherwise.
+        :param curve: str, hilbert or zorder
+        :param precision: int, bits per dimension
+        :return: bool, False when SpatialRDD is empty
+        """
+        validate_curve(curve, precision)
+        extent = self.statistics.boundary
+        if extent is None:
+            return False
+
+        jvm_extent = extent.create_jvm_instance(self._jvm)
+        spatial_partitioned_rdd = get_field(self._srdd, "spatialPartitionedRDD")
+        field_name = "spatialPartitionedRDD" if spatial_partitioned_rdd is not None else "rawSpatialRDD"
+        jrdd = get_field(self._srdd, field_name)
+        set_field(
+            self._srdd, field_name, self._jvm.SpaceFillingCurve.sortWithinPartitions(jrdd, curve, precision, jvm_extent)
+        )
+        return True
+
     def set_srdd(self, srdd):
         self._srdd = srdd
+        self._partitioner_grid_bounds = None
+        self._invalidate_statistics()
 
     def get_srdd(self):
         return self._srdd
@@ -1,5 +1,7 @@
 from copy import copy
+from typing import List, Optional
 
+import numpy as np
 from shapely.geometry.base import BaseGeometry
 
 
@@ -40,3 +42,38 @@ class GeoData:
 
     def __repr__(self):
         return f"Geometry: {str(self.geom)} userData: {self.userData}"
+
+
+class PointArray:
+    """
+    Packed points transferred from jvm, coordinates is numpy array of shape (number of points, 2) with x and y
+    columns, userData is list of strings or None when user data was not requested.
+    """
+
+    def __init__(self, coordinates: np.ndarray, userData: Optional[List[str]] = None):
+        self._coordinates = coordinates
+        self._userData = userData
+
+    @property
+    def coordinates(self) -> np.ndarray:
+        return self._coordinates
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._coordinates[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._coordinates[:, 1]
+
+    @property
+    def userData(self) -> Optional[List[str]]:
+        return self._userData
+
+    def __len__(self):
+        return self._coordinates.shape[0]
+
+    __slots__ = ("_coordinates", "_userData")
+
+    def __repr__(self):
+        return f"PointArray: {len(self)} points"
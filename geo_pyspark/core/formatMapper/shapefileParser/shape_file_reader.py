@@ -1,9 +1,12 @@
+from typing import Union, List, Tuple
+
 import attr
 from pyspark import SparkContext
 
 from geo_pyspark.core.SpatialRDD import PolygonRDD, PointRDD, LineStringRDD
 from geo_pyspark.core.SpatialRDD.spatial_rdd import SpatialRDD
 from geo_pyspark.core.formatMapper.geo_reader import GeoDataReader
+from geo_pyspark.core.geom_types import Envelope
 from geo_pyspark.core.utils import require
 from geo_pyspark.register.java_libs import GeoSparkLib
 from geo_pyspark.utils.meta import MultipleMeta
@@ -37,6 +40,41 @@ class ShapefileReader(GeoDataReader, metaclass=MultipleMeta):
         spatial_rdd.set_srdd(srdd)
         return spatial_rdd
 
+    @classmethod
+    @require([GeoSparkLib.ParallelShapefileReader])
+    def readToGeometryRDD(cls, sc: SparkContext, inputPath: str, queryWindow: Envelope) -> SpatialRDD:
+        """
+        Reads only records which bounding boxes intersect query window, other records are skipped using .shx
+        offsets and record headers without decoding geometry and reading .dbf attributes. Records of large
+        files are read by several tasks.
+        :param sc: SparkContext
+        :param inputPath: str, .shp file or directory with shapefiles
+        :param queryWindow: Envelope, query window
+        :return: SpatialRDD
+        """
+        srdd = sc._jvm.ParallelShapefileReader.readToGeometryRDD(
+            sc._jsc, inputPath, queryWindow.create_jvm_instance(sc._jvm)
+        )
+        spatial_rdd = SpatialRDD(sparkContext=sc)
+        spatial_rdd.set_srdd(srdd)
+        return spatial_rdd
+
+    @classmethod
+    @require([GeoSparkLib.ParallelShapefileReader])
+    def readFilesToGeometryRDD(cls, sc: SparkContext, inputPaths: Union[str, List[str], Tuple[str, ...]]) -> SpatialRDD:
+        """
+        Reads many shapefiles in parallel, each .shp file is read by separate task. Path of source .shp file
+        is added to user data as last attribute named source_file.
+        :param sc: SparkContext
+        :param inputPaths: str or sequence of str, .shp files, directories with shapefiles or glob patterns
+        :return: SpatialRDD
+        """
+        paths = [inputPaths] if isinstance(inputPaths, str) else list(inputPaths)
+        srdd = sc._jvm.ParallelShapefileReader.readToGeometryRDD(sc._jsc, paths)
+        spatial_rdd = SpatialRDD(sparkContext=sc)
+        spatial_rdd.set_srdd(srdd)
+        return spatial_rdd
+
     @classmethod
     def readToPolygonRDD(cls, sc: SparkContext, inputPath: str) -> PolygonRDD:
         """
@@ -1,9 +1,35 @@
+from typing import List, Optional
+
 import attr
+from pyspark import SparkContext
+from shapely.geometry.base import BaseGeometry
+
+from geo_pyspark.core.geom_types import Envelope
+from geo_pyspark.core.partition_tree import PartitionTree
+from geo_pyspark.core.utils import require
+from geo_pyspark.register.java_libs import GeoSparkLib
 
 
 @attr.s
 class JvmPartitioner:
     jpart = attr.ib()
+    _partition_tree = attr.ib(init=False, default=None, repr=False, eq=False)
+
+    @property
+    def partition_tree(self) -> PartitionTree:
+        """
+        Whole partitioning tree transferred from jvm in one call, cached after first usage.
+        :return: PartitionTree
+        """
+        if self._partition_tree is None:
+            self._partition_tree = PartitionTree.from_bytes(self._serialize_tree())
+        return self._partition_tree
+
+    @require([GeoSparkLib.PartitionTreeSerializer])
+    def _serialize_tree(self) -> bytes:
+        if self.jpart is None:
+            raise AttributeError("Please run spatial partitioning before")
+        return SparkContext._jvm.PartitionTreeSerializer.serialize(self.jpart)
 
     def assignPartitionIds(self):
         raise NotImplementedError("Currently not supported")
@@ -14,17 +40,23 @@ class JvmPartitioner:
     def dropElements(self):
         raise NotImplementedError("Currently not supported")
 
-    def equals(self):
-        raise NotImplementedError("Currently not supported")
+    def equals(self, other: 'JvmPartitioner') -> bool:
+        return isinstance(other, JvmPartitioner) and self.partition_tree == other.partition_tree
 
-    def findZone(self):
-        raise NotImplementedError("Currently not supported")
+    def findZone(self, geometry: BaseGeometry) -> List[int]:
+        """
+        Finds partition ids for geometry locally, using partitioning tree copied from jvm.
+        :param geometry: shapely geometry
+        :return: List[int], partition ids
+        """
+        return self.partition_tree.find_partition_ids(geometry)
 
     def forceGrowUp(self):
         raise NotImplementedError("Currently not supported")
 
-    def getAllZones(self):
-        raise NotImplementedError("Currently not supported")
+    def getAllZones(self) -> List[Envelope]:
+        tree = self.partition_tree
+        return [tree.zone(index) for index in range(len(tree.envelopes))]
 
     def getClass(self):
         raise NotImplementedError("Currently not supported")
@@ -32,17 +64,21 @@ class JvmPartitioner:
     def getElements(self):
         raise NotImplementedError("Currently not supported")
 
-    def getLeafZones(self):
-        raise NotImplementedError("Currently not supported")
+    def getLeafZones(self) -> List[Envelope]:
+        tree = self.partition_tree
+        return [tree.zone(index) for index in tree.leaf_indices]
 
-    def getParentZone(self):
-        raise NotImplementedError("Currently not supported")
+    def getParentZone(self, x: float, y: float, minLevel: int) -> Optional[Envelope]:
+        tree = self.partition_tree
+        index = tree.find_parent_zone(x, y, minLevel)
+        return tree.zone(index) if index is not None else None
 
-    def getTotalNumLeafNode(self):
-        raise NotImplementedError("Currently not supported")
+    def getTotalNumLeafNode(self) -> int:
+        return len(self.partition_tree.leaf_indices)
 
-    def getZone(self):
-        raise NotImplementedError("Currently not supported")
+    def getZone(self) -> Optional[Envelope]:
+        tree = self.partition_tree
+        return tree.zone(tree.roots[0]) if len(tree.roots) == 1 else None
 
     def hashCode(self):
         raise NotImplementedError("Currently not supported")
@@ -50,8 +86,9 @@ class JvmPartitioner:
     def insert(self):
         raise NotImplementedError("Currently not supported")
 
-    def isLeaf(self):
-        raise NotImplementedError("Currently not supported")
+    def isLeaf(self) -> bool:
+        tree = self.partition_tree
+        return len(tree.roots) == 1 and tree.is_leaf(tree.roots[0])
 
     def notify(self):
         raise NotImplementedError("Currently not supported")
@@ -59,8 +96,8 @@ class JvmPartitioner:
     def notifyAll(self):
         raise NotImplementedError("Currently not supported")
 
-    def toString(self):
-        raise NotImplementedError("Currently not supported")
+    def toString(self) -> str:
+        return self.jpart.toString()
 
     def wait(self):
         raise NotImplementedError("Currently not supported")
@@ -0,0 +1,6 @@
+from .local_spatial_rdd import LocalSpatialRDD
+from .spatial_operator import RangeQuery, KNNQuery, JoinQuery
+
+__all__ = [
+    "LocalSpatialRDD", "RangeQuery", "KNNQuery", "JoinQuery"
+]
@@ -0,0 +1,82 @@
+from typing import List, Iterable
+
+from shapely.geometry.base import BaseGeometry
+from shapely.strtree import STRtree
+
+from geo_pyspark.core.data import GeoData
+from geo_pyspark.core.geom_types import Envelope
+from geo_pyspark.utils.shapely_version import SHAPELY_2
+
+
+class LocalSpatialRDD:
+    """
+    In memory counterpart of SpatialRDD for small layers, geometries are kept as GeoData list on the driver and
+    queried with shapely STRtree built on first use.
+    """
+
+    def __init__(self, geoData: Iterable[GeoData]):
+        self.geo_data = list(geoData)
+        self._index = None
+        self._boundary = None
+
+    @classmethod
+    def from_spatial_rdd(cls, spatialRDD) -> 'LocalSpatialRDD':
+        """
+        Collects raw geometries of SpatialRDD to the driver.
+        :param spatialRDD: SpatialRDD
+        :return: LocalSpatialRDD
+        """
+        return cls(spatialRDD.rawSpatialRDD.collect())
+
+    @classmethod
+    def from_geodataframe(cls, geoDataFrame, geometryColumn: str = "geometry") -> 'LocalSpatialRDD':
+        """
+        Remaining columns are stored as tab separated user data, in the same way Adapter.toDf splits them.
+        :param geoDataFrame: geopandas.GeoDataFrame
+        :param geometryColumn: str
+        :return: LocalSpatialRDD
+        """
+        columns = [column for column in geoDataFrame.columns if column != geometryColumn]
+        return cls(
+            GeoData(geom=row[geometryColumn], userData="\t".join(str(row[column]) for column in columns))
+            for _, row in geoDataFrame.iterrows()
+        )
+
+    @property
+    def approximateTotalCount(self) -> int:
+        return len(self.geo_data)
+
+    def __len__(self) -> int:
+        return len(self.geo_data)
+
+    def boundary(self) -> Envelope:
+        if self._boundary is None:
+            bounds = [geo_data.geom.bounds for geo_data in self.geo_data]
+            self._boundary = Envelope(
+                minx=min(bound[0] for bound in bounds),
+                maxx=max(bound[2] for bound in bounds),
+                miny=min(bound[1] for bound in bounds),
+                maxy=max(bound[3] for bound in bounds)
+            )
+        return self._boundary
+
+    @property
+    def index(self) -> STRtree:
+        if self._index is None:
+            geometries = [geo_data.geom for geo_data in self.geo_data]
+            self._index = STRtree(geometries) if SHAPELY_2 else STRtree(geometries, range(len(geometries)))
+        return self._index
+
+    def candidates(self, geometry: BaseGeometry, useIndex: bool = True) -> List[GeoData]:
+        """
+        Geometries which envelopes intersect geometry envelope, all geometries when index is not used.
+        """
+        if not useIndex:
+            return self.geo_data
+        if not self.geo_data:
+            return []
+        if SHAPELY_2:
+            positions = self.index.query(geometry)
+        else:
+            positions = self.index.query_items(geometry)
+        return [self.geo_data[position] for position in positions]
@@ -0,0 +1,127 @@
+import math
+from typing import List
+
+from shapely.geometry import Point
+from shapely.geometry.base import BaseGeometry
+
+from geo_pyspark.core.data import GeoData
+from geo_pyspark.core.geom_types import Envelope
+from geo_pyspark.core.local.local_spatial_rdd import LocalSpatialRDD
+
+
+def matches(queryGeometry: BaseGeometry, geometry: BaseGeometry, considerBoundaryIntersection: bool) -> bool:
+    if considerBoundaryIntersection:
+        return queryGeometry.intersects(geometry)
+    return queryGeometry.covers(geometry)
+
+
+class RangeQuery:
+    """
+    Same signatures as geo_pyspark.core.spatialOperator.RangeQuery, results are lists instead of RDDs.
+    """
+
+    @classmethod
+    def SpatialRangeQuery(cls, spatialRDD: LocalSpatialRDD, rangeQueryWindow: Envelope,
+                          considerBoundaryIntersection: bool, usingIndex: bool) -> List[GeoData]:
+        """
+
+        :param spatialRDD: LocalSpatialRDD
+        :param rangeQueryWindow:
+        :param considerBoundaryIntersection:
+        :param usingIndex:
+        :return: List[GeoData]
+        """
+        return [
+            geo_data for geo_data in spatialRDD.candidates(rangeQueryWindow, usingIndex)
+            if matches(rangeQueryWindow, geo_data.geom, considerBoundaryIntersection)
+        ]
+
+
+class KNNQuery:
+    """
+    Same signatures as geo_pyspark.core.spatialOperator.KNNQuery.
+    """
+
+    @classmethod
+    def SpatialKnnQuery(cls, spatialRDD: LocalSpatialRDD, originalQueryPoint: Point, k: int,
+                        useIndex: bool) -> List[GeoData]:
+        """
+        With index, square window around query point is doubled until it contains k geometries within its
+        half width, these are exact k nearest neighbours.
+
+        :param spatialRDD: LocalSpatialRDD
+        :param originalQueryPoint: shapely.geometry.Point
+        :param k: int
+        :param useIndex: bool
+        :return: List[GeoData], sorted by distance
+        """
+        if k <= 0 or not spatialRDD.geo_data:
+            return []
+
+        if useIndex and k < len(spatialRDD):
+            boundary = spatialRDD.boundary()
+            extent = max(boundary.maxx - boundary.minx, boundary.maxy - boundary.miny)
+            radius = max(extent * math.sqrt(k / len(spatialRDD)) / 2, 1e-9)
+            while True:
+                window = Envelope(
+                    originalQueryPoint.x - radius, originalQueryPoint.x + radius,
+                    originalQueryPoint.y - radius, originalQueryPoint.y + radius
+                )
+                if window.covers(boundary):
+                    candidates = spatialRDD.geo_data
+                    break
+                candidates = [
+                    geo_data for geo_data in spatialRDD.candidates(window)
+                    if originalQueryPoint.distance(geo_data.geom) <= radius
+                ]
+                if len(candidates) >= k:
+                    break
+                radius *= 2
+        else:
+            candidates = spatialRDD.geo_data
+
+        return sorted(candidates, key=lambda geo_data: originalQueryPoint.distance(geo_data.geom))[:k]
+
+
+class JoinQuery:
+    """
+    Same signatures as geo_pyspark.core.spatialOperator.JoinQuery, results are lists instead of RDDs.
+    """
+
+    @classmethod
+    def SpatialJoinQuery(cls, spatialRDD: LocalSpatialRDD, queryRDD: LocalSpatialRDD, useIndex: bool,
+                         considerBoundaryIntersection: bool) -> List[list]:
+        """
+
+        :param spatialRDD: LocalSpatialRDD
+        :param queryRDD: LocalSpatialRDD
+        :param useIndex:
+        :param considerBoundaryIntersection:
+        :return: List of [query GeoData, List[GeoData]], query geometries without matches are skipped
+        """
+        result = []
+        for query in queryRDD.geo_data:
+            matched = [
+                geo_data for geo_data in spatialRDD.candidates(query.geom, useIndex)
+                if matches(query.geom, geo_data.geom, considerBoundaryIntersection)
+            ]
+            if matched:
+                result.append([query, matched])
+        return result
+
+    @classmethod
+    def SpatialJoinQueryFlat(cls, spatialRDD: LocalSpatialRDD, queryRDD: LocalSpatialRDD, useIndex: bool,
+                             considerBoundaryIntersection: bool) -> List[list]:
+        """
+
+        :param spatialRDD: LocalSpatialRDD
+        :param queryRDD: LocalSpatialRDD
+        :param useIndex:
+        :param considerBoundaryIntersection:
+        :return: List of [query GeoData, spatial GeoData]
+        """
+        return [
+            [query, geo_data]
+            for query, matched in cls.SpatialJoinQuery(spatialRDD, queryRDD, useIndex, considerBoundaryIntersection)
+            for geo_data in matched
+        ]
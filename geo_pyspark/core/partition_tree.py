@@ -0,0 +1,145 @@
+import struct
+from typing import List, Tuple, Optional
+
+import attr
+from shapely.geometry import Point
+from shapely.geometry.base import BaseGeometry
+
+from geo_pyspark.core.geom_types import Envelope
+
+TREE_PARTITIONER = 0
+FLAT_PARTITIONER = 1
+
+NO_PARENT = -1
+NO_PARTITION = -1
+
+bounds = Tuple[float, float, float, float]
+
+
+def intersects(first: bounds, second: bounds) -> bool:
+    return first[0] <= second[1] and second[0] <= first[1] and first[2] <= second[3] and second[2] <= first[3]
+
+
+def covers(first: bounds, second: bounds) -> bool:
+    return first[0] <= second[0] and second[1] <= first[1] and first[2] <= second[2] and second[3] <= first[3]
+
+
+def half_open_contains(envelope: bounds, x: float, y: float) -> bool:
+    return envelope[0] <= x < envelope[1] and envelope[2] <= y < envelope[3]
+
+
+@attr.s
+class PartitionTree:
+    """
+    Python copy of GeoSpark partitioning tree (KDB tree, quad tree or flat grids). Nodes are stored in pre order
+    as arrays of envelopes (minx, maxx, miny, maxy), parent indices and partition ids (-1 for not leaf nodes).
+    """
+    kind = attr.ib(type=int)
+    number_of_partitions = attr.ib(type=int)
+    envelopes = attr.ib(type=List[bounds])
+    parents = attr.ib(type=List[int])
+    partition_ids = attr.ib(type=List[int])
+
+    def __attrs_post_init__(self):
+        self.children = [[] for _ in self.parents]
+        self.roots = []
+        self.levels = []
+        for index, parent in enumerate(self.parents):
+            if parent == NO_PARENT:
+                self.roots.append(index)
+                self.levels.append(0)
+            else:
+                self.children[parent].append(index)
+                self.levels.append(self.levels[parent] + 1)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'PartitionTree':
+        kind, number_of_partitions, number_of_nodes = struct.unpack_from("<3i", data, 0)
+        offset = 3 * 4
+        envelopes = list(struct.iter_unpack("<4d", data[offset: offset + number_of_nodes * 4 * 8]))
+        offset += number_of_nodes * 4 * 8
+        parents = list(struct.unpack_from(f"<{number_of_nodes}i", data, offset))
+        offset += number_of_nodes * 4
+        partition_ids = list(struct.unpack_from(f"<{number_of_nodes}i", data, offset))
+
+        return cls(kind, number_of_partitions, envelopes, parents, partition_ids)
+
+    def to_bytes(self) -> bytes:
+        number_of_nodes = len(self.envelopes)
+        return b"".join([
+            struct.pack("<3i", self.kind, self.number_of_partitions, number_of_nodes),
+            b"".join(struct.pack("<4d", *envelope) for envelope in self.envelopes),
+            struct.pack(f"<{number_of_nodes}i", *self.parents),
+            struct.pack(f"<{number_of_nodes}i", *self.partition_ids)
+        ])
+
+    def is_leaf(self, index: int) -> bool:
+        return self.partition_ids[index] != NO_PARTITION
+
+    @property
+    def leaf_indices(self) -> List[int]:
+        leaves = [index for index, partition_id in enumerate(self.partition_ids) if partition_id != NO_PARTITION]
+        return sorted(leaves, key=lambda index: self.partition_ids[index])
+
+    def zone(self, index: int) -> Envelope:
+        minx, maxx, miny, maxy = self.envelopes[index]
+        return Envelope(minx, maxx, miny, maxy)
+
+    def find_partition_ids(self, geometry: BaseGeometry) -> List[int]:
+        """
+        Routes geometry to partition ids in the same way as GeoSpark partitioner does, without calling jvm.
+        :param geometry: shapely geometry
+        :return: List[int], partition ids
+        """
+        minx, miny, maxx, maxy = geometry.bounds
+        point = (minx, miny) if isinstance(geometry, Point) else None
+        return self.find_partition_ids_by_bounds((minx, maxx, miny, maxy), point)
+
+    def find_partition_ids_by_bounds(self, envelope: bounds, point: Optional[Tuple[float, float]] = None) -> List[int]:
+        if self.kind == FLAT_PARTITIONER:
+            return self._find_flat_partition_ids(envelope)
+
+        partition_ids = []
+        nodes = list(self.roots)
+        while nodes:
+            index = nodes.pop()
+            node_envelope = self.envelopes[index]
+            if not intersects(node_envelope, envelope):
+                continue
+            if self.is_leaf(index):
+                if point is None or half_open_contains(node_envelope, *point):
+                    partition_ids.append(self.partition_ids[index])
+            else:
+                nodes.extend(self.children[index])
+
+        return sorted(partition_ids)
+
+    def _find_flat_partition_ids(self, envelope: bounds) -> List[int]:
+        partition_ids = []
+        is_contained = False
+        for index in self.roots:
+            grid = self.envelopes[index]
+            if covers(grid, envelope):
+                partition_ids.append(self.partition_ids[index])
+                is_contained = True
+            elif intersects(grid, envelope):
+                partition_ids.append(self.partition_ids[index])
+
+        if not is_contained:
+            partition_ids.append(len(self.roots))
+
+        return partition_ids
+
+    def find_parent_zone(self, x: float, y: float, min_level: int) -> Optional[int]:
+        candidates = [index for index in self.roots if half_open_contains(self.envelopes[index], x, y)]
+        if not candidates:
+            return None
+
+        index = candidates[0]
+        while self.levels[index] < min_level and not self.is_leaf(index):
+            children = [child for child in self.children[index] if half_open_contains(self.envelopes[child], x, y)]
+            if not children:
+                break
+            index = children[0]
+
+        return index
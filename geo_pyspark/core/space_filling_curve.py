@@ -0,0 +1,76 @@
+import numpy as np
+
+from geo_pyspark.core.geom_types import Envelope
+
+MAX_PRECISION = 31
+CURVES = ("hilbert", "zorder")
+
+
+def validate(curve: str, precision: int):
+    if curve not in CURVES:
+        raise ValueError(f"Unknown space filling curve {curve}, use one of {CURVES}")
+    if not 1 <= precision <= MAX_PRECISION:
+        raise ValueError(f"precision should be between 1 and {MAX_PRECISION}")
+
+
+def cells(values: np.ndarray, minimum: float, maximum: float, precision: int) -> np.ndarray:
+    number_of_cells = 1 << precision
+    values = np.asarray(values, dtype=np.float64)
+    if maximum > minimum:
+        positions = np.floor((values - minimum) / (maximum - minimum) * number_of_cells)
+    else:
+        positions = np.zeros(values.shape)
+    return np.clip(positions, 0, number_of_cells - 1).astype(np.int64)
+
+
+def hilbert_key(x: np.ndarray, y: np.ndarray, extent: Envelope, precision: int = 16) -> np.ndarray:
+    """
+    Hilbert curve distance of cells containing points, the same as ST_HilbertKey SQL function.
+    :param x: np.ndarray of x coordinates
+    :param y: np.ndarray of y coordinates
+    :param extent: Envelope, divided into 2 ** precision by 2 ** precision cells
+    :param precision: int, bits per dimension
+    :return: np.ndarray of int64 keys
+    """
+    validate("hilbert", precision)
+    n = 1 << precision
+    cell_x = cells(x, extent.minx, extent.maxx, precision)
+    cell_y = cells(y, extent.miny, extent.maxy, precision)
+    d = np.zeros(cell_x.shape, dtype=np.int64)
+
+    s = n >> 1
+    while s > 0:
+        rx = ((cell_x & s) > 0).astype(np.int64)
+        ry = ((cell_y & s) > 0).astype(np.int64)
+        d += s * s * ((3 * rx) ^ ry)
+
+        flip = (ry == 0) & (rx == 1)
+        cell_x = np.where(flip, n - 1 - cell_x, cell_x)
+        cell_y = np.where(flip, n - 1 - cell_y, cell_y)
+        swap = ry == 0
+        cell_x, cell_y = np.where(swap, cell_y, cell_x), np.where(swap, cell_x, cell_y)
+        s >>= 1
+    return d
+
+
+def _spread(values: np.ndarray) -> np.ndarray:
+    v = values.astype(np.uint64) & np.uint64(0xFFFFFFFF)
+    for shift, mask in ((16, 0x0000FFFF0000FFFF), (8, 0x00FF00FF00FF00FF), (4, 0x0F0F0F0F0F0F0F0F),
+                        (2, 0x3333333333333333), (1, 0x5555555555555555)):
+        v = (v | (v << np.uint64(shift))) & np.uint64(mask)
+    return v
+
+
+def zorder_key(x: np.ndarray, y: np.ndarray, extent: Envelope, precision: int = 16) -> np.ndarray:
+    """
+    Z-order (Morton) key of cells containing points, the same as ST_ZOrderKey SQL function.
+    :param x: np.ndarray of x coordinates
+    :param y: np.ndarray of y coordinates
+    :param extent: Envelope, divided into 2 ** precision by 2 ** precision cells
+    :param precision: int, bits per dimension
+    :return: np.ndarray of int64 keys
+    """
+    validate("zorder", precision)
+    cell_x = cells(x, extent.minx, extent.maxx, precision)
+    cell_y = cells(y, extent.miny, extent.maxy, precision)
+    return (_spread(cell_x) | (_spread(cell_y) << np.uint64(1))).astype(np.int64)
@@ -1,8 +1,26 @@
+import math
+from typing import Optional
+
 import attr
 
 from geo_pyspark.core.enums import IndexType
 from geo_pyspark.core.enums.join_build_side import JoinBuildSide
 from geo_pyspark.core.jvm.abstract import JvmObject
+from geo_pyspark.core.spatial_statistics import PartitionStatsReport
+
+
+@attr.s
+class JoinDecision:
+    """
+    Join strategy chosen by JoinParams.fromStatistics together with estimated costs, reason is human readable
+    summary which can be logged.
+    """
+    useIndex = attr.ib(type=bool)
+    indexType = attr.ib(type=str)
+    joinBuildSide = attr.ib(type=str)
+    nestedLoopCost = attr.ib(type=float)
+    indexCost = attr.ib(type=float)
+    reason = attr.ib(type=str)
 
 
 @attr.s
@@ -10,10 +28,65 @@ class JoinParams:
     useIndex = attr.ib(type=bool, default=True)
     indexType = attr.ib(type=str, default=IndexType.RTREE)
     joinBuildSide = attr.ib(type=str, default=JoinBuildSide.LEFT)
+    auto = attr.ib(type=bool, default=False)
+    decision = attr.ib(type=Optional[JoinDecision], default=None)
 
     def jvm_instance(self, jvm):
         return JvmJoinParams(jvm, self.useIndex, self.indexType, self.joinBuildSide).jvm_instance
 
+    @classmethod
+    def fromStatistics(cls, queryWindowRDD: 'SpatialRDD', objectRDD: 'SpatialRDD') -> 'JoinParams':
+        """
+        Chooses build side and whether to use index at all from per partition statistics of spatially
+        partitioned RDDs, which are cached by SpatialRDD.partitionStats. Chosen strategy is available as
+        decision attribute of returned JoinParams.
+        :param queryWindowRDD: SpatialRDD, left side of the join
+        :param objectRDD: SpatialRDD, right side of the join
+        :return: JoinParams
+        """
+        decision = decide_join(queryWindowRDD.partitionStats(), objectRDD.partitionStats())
+        return cls(decision.useIndex, decision.indexType, decision.joinBuildSide, decision=decision)
+
+
+def decide_join(left: PartitionStatsReport, right: PartitionStatsReport) -> JoinDecision:
+    """
+    Both RDDs are partitioned with the same partitioner so partitions with the same id are joined together.
+    Nested loop compares every pair in a partition, index join builds tree over one side and probes it with
+    the other one, side with smaller partitions gives cheaper build and shallower tree. Index type is always
+    RTREE, GeoSpark default, partition counts say nothing about which tree fits the data better.
+    """
+    right_counts = {partition.partition_id: partition.count for partition in right.partitions}
+    nested_loop_cost = 0.0
+    left_build_cost = 0.0
+    right_build_cost = 0.0
+    for partition in left.partitions:
+        left_count = partition.count
+        right_count = right_counts.get(partition.partition_id, 0)
+        if left_count == 0 or right_count == 0:
+            continue
+        nested_loop_cost += left_count * right_count
+        left_build_cost += (left_count + right_count) * math.log2(left_count + 2)
+        right_build_cost += (left_count + right_count) * math.log2(right_count + 2)
+
+    if left_build_cost <= right_build_cost:
+        build_side, index_cost = JoinBuildSide.LEFT, left_build_cost
+    else:
+        build_side, index_cost = JoinBuildSide.RIGHT, right_build_cost
+
+    index_type = IndexType.RTREE
+    use_index = index_cost < nested_loop_cost
+
+    if use_index:
+        reason = "{} index on {} side, estimated cost {:.0f} vs nested loop {:.0f}".format(
+            index_type.name, build_side, index_cost, nested_loop_cost
+        )
+    else:
+        reason = "nested loop, estimated cost {:.0f} vs {} side index {:.0f}".format(
+            nested_loop_cost, build_side, index_cost
+        )
+
+    return JoinDecision(use_index, index_type, build_side, nested_loop_cost, index_cost, reason)
+
 
 @attr.s
 class JvmJoinParams(JvmObject):
@@ -1,60 +1,74 @@
+from typing import Optional, List
+
+from py4j.java_gateway import get_field
 from pyspark import RDD
 
 from geo_pyspark.core.SpatialRDD.spatial_rdd import SpatialRDD
+from geo_pyspark.core.spatial_statistics import JoinCardinalityEstimate
 from geo_pyspark.core.spatialOperator.join_params import JoinParams
-from geo_pyspark.core.utils import require
+from geo_pyspark.core.spatialOperator.spatial_pair_rdd import SpatialPairRDD
+from geo_pyspark.core.utils import require, ImportedJvmLib
 from geo_pyspark.register.java_libs import GeoSparkLib
 from geo_pyspark.utils.rdd_pickling import GeoSparkPickler
 
+BROADCAST_THRESHOLD_CONF = "geo_pyspark.join.broadcastThreshold"
+DEFAULT_BROADCAST_THRESHOLD = 0
+
 
 class JoinQuery:
 
     @classmethod
     @require([GeoSparkLib.JoinQuery])
-    def SpatialJoinQuery(cls, spatialRDD: SpatialRDD, queryRDD: SpatialRDD, useIndex: bool, considerBoundaryIntersection: bool) -> RDD:
+    def SpatialJoinQuery(cls, spatialRDD: SpatialRDD, queryRDD: SpatialRDD, useIndex: bool, considerBoundaryIntersection: bool,
+                         maxChunkSize: Optional[int] = None, referencePointDedup: bool = False) -> RDD:
         """
+        When maxChunkSize is given, matches of one query geometry are split into several records
+        [query geometry, chunk of matched geometries], each with at most maxChunkSize matched geometries
+        (requires ChunkedJoinSerializer from geo_wrapper jar).
 
         :param spatialRDD:
         :param queryRDD:
         :param useIndex:
         :param considerBoundaryIntersection:
+        :param maxChunkSize: Optional[int], maximum number of matched geometries in one record
+        :param referencePointDedup: bool, emit pair only in partition owning reference point of envelopes
+            intersection instead of removing duplicates afterwards, RDDs have to share the same partitioner
         :return:
         """
 
         jvm = spatialRDD._jvm
         sc = spatialRDD._sc
 
-        srdd = jvm.JoinQuery.SpatialJoinQuery(
-            spatialRDD._srdd,
-            queryRDD._srdd,
-            useIndex,
-            considerBoundaryIntersection
-        )
-        serlialized = jvm.GeoSerializerData.serializeToPythonHashSet(srdd)
+        srdd = cls._join(spatialRDD, queryRDD, useIndex, considerBoundaryIntersection, referencePointDedup)
+        serlialized = cls._serialize_hash_set(jvm, srdd, maxChunkSize)
 
         return RDD(serlialized, sc, GeoSparkPickler())
 
     @classmethod
     @require([GeoSparkLib.JoinQuery])
-    def DistanceJoinQuery(cls, spatialRDD: SpatialRDD, queryRDD: SpatialRDD, useIndex: bool, considerBoundaryIntersection: bool) -> RDD:
+    def DistanceJoinQuery(cls, spatialRDD: SpatialRDD, queryRDD: SpatialRDD, useIndex: bool, considerBoundaryIntersection: bool,
+                          maxChunkSize: Optional[int] = None, referencePointDedup: bool = False) -> RDD:
         """
+        When maxChunkSize is given, matches of one query geometry are split into several records
+        [query geometry, chunk of matched geometries], each with at most maxChunkSize matched geometries
+        (requires ChunkedJoinSerializer from geo_wrapper jar).
 
         :param spatialRDD:
         :param queryRDD:
         :param useIndex:
         :param considerBoundaryIntersection:
+        :param maxChunkSize: Optional[int], maximum number of matched geometries in one record
+        :param referencePointDedup: bool, emit pair only in partition owning reference point of envelopes
+            intersection instead of removing duplicates afterwards, RDDs have to share the same partitioner
         :return:
         """
 
         jvm = spatialRDD._jvm
         sc = spatialRDD._sc
-        srdd = jvm.JoinQuery.DistanceJoinQuery(
-            spatialRDD._srdd,
-            queryRDD._srdd,
-            useIndex,
-            considerBoundaryIntersection
+        srdd = cls._join(
+            spatialRDD, queryRDD, useIndex, considerBoundaryIntersection, referencePointDedup, distance=True
         )
-        serlialized = jvm.GeoSerializerData.serializeToPythonHashSet(srdd)
+        serlialized = cls._serialize_hash_set(jvm, srdd, maxChunkSize)
 
         return RDD(serlialized, sc, GeoSparkPickler())
 
@@ -62,6 +76,8 @@ class JoinQuery:
     @require([GeoSparkLib.JoinQuery])
     def spatialJoin(cls, queryWindowRDD: SpatialRDD, objectRDD: SpatialRDD, joinParams: JoinParams) -> RDD:
         """
+        When joinParams.auto is set, build side and use of index are chosen from partition statistics of both
+        RDDs, chosen strategy is available as joinDecision of returned SpatialPairRDD, joinParams are not modified.
 
         :param queryWindowRDD:
         :param objectRDD:
@@ -72,65 +88,285 @@ class JoinQuery:
         jvm = queryWindowRDD._jvm
         sc = queryWindowRDD._sc
 
+        if joinParams.auto:
+            joinParams = JoinParams.fromStatistics(queryWindowRDD, objectRDD)
+
         jvm_join_params = joinParams.jvm_instance(jvm)
 
         srdd = jvm.JoinQuery.spatialJoin(queryWindowRDD._srdd, objectRDD._srdd, jvm_join_params)
 
         serlialized = jvm.GeoSerializerData.serializeToPython(srdd)
 
-        return RDD(serlialized, sc, GeoSparkPickler())
+        return SpatialPairRDD(serlialized, sc, srdd, joinParams.decision)
 
     @classmethod
     @require([GeoSparkLib.JoinQuery])
-    def DistanceJoinQueryFlat(cls, spatialRDD: SpatialRDD, queryRDD: SpatialRDD, useIndex: bool, considerBoundaryIntersection: bool) -> RDD:
+    def DistanceJoinQueryFlat(cls, spatialRDD: SpatialRDD, queryRDD: SpatialRDD, useIndex: bool, considerBoundaryIntersection: bool,
+                              referencePointDedup: bool = False) -> RDD:
         """
 
         :param spatialRDD:
         :param queryRDD:
         :param useIndex:
         :param considerBoundaryIntersection:
+        :param referencePointDedup: bool, emit pair only in partition owning reference point of envelopes
+            intersection instead of removing duplicates afterwards, RDDs have to share the same partitioner
         :return:
         """
 
         jvm = spatialRDD._jvm
         sc = spatialRDD._sc
 
-        spatial_join = jvm.JoinQuery.DistanceJoinQueryFlat
-        srdd = spatial_join(
-            spatialRDD._srdd,
-            queryRDD._srdd,
-            useIndex,
-            considerBoundaryIntersection
+        srdd = cls._join(
+            spatialRDD, queryRDD, useIndex, considerBoundaryIntersection, referencePointDedup, flat=True, distance=True
         )
 
         serlialized = jvm.GeoSerializerData.serializeToPython(srdd)
 
-        return RDD(serlialized, sc, GeoSparkPickler())
+        return SpatialPairRDD(serlialized, sc, srdd)
 
     @classmethod
     @require([GeoSparkLib.JoinQuery])
     def SpatialJoinQueryFlat(cls, spatialRDD: SpatialRDD, queryRDD: SpatialRDD, useIndex: bool,
-                              considerBoundaryIntersection: bool) -> RDD:
+                              considerBoundaryIntersection: bool, referencePointDedup: bool = False) -> RDD:
         """
+        When geo_pyspark.join.broadcastThreshold spark configuration value is set to positive number, useIndex is set,
+        referencePointDedup is not set, none of RDDs is spatially partitioned and queryRDD count is not greater than
+        the threshold, BroadcastSpatialJoin is used. Count is taken from queryRDD statistics, which are computed once
+        and cached. The same applies to SpatialJoinQuery, DistanceJoinQuery, DistanceJoinQueryFlat and Ids variants.
 
         :param spatialRDD:
         :param queryRDD:
         :param useIndex:
         :param considerBoundaryIntersection:
+        :param referencePointDedup: bool, emit pair only in partition owning reference point of envelopes
+            intersection instead of removing duplicates afterwards, RDDs have to share the same partitioner
         :return:
         """
 
         jvm = spatialRDD._jvm
         sc = spatialRDD._sc
 
-        spatial_join = jvm.JoinQuery.SpatialJoinQueryFlat
-        srdd = spatial_join(
+        srdd = cls._join(spatialRDD, queryRDD, useIndex, considerBoundaryIntersection, referencePointDedup, flat=True)
+
+        serlialized = jvm.GeoSerializerData.serializeToPython(srdd)
+
+        return SpatialPairRDD(serlialized, sc, srdd)
+
+    @classmethod
+    @require([GeoSparkLib.JoinQuery, GeoSparkLib.UserDataSerializer])
+    def SpatialJoinQueryIds(cls, spatialRDD: SpatialRDD, queryRDD: SpatialRDD, useIndex: bool,
+                            considerBoundaryIntersection: bool, queryFields: Optional[List[int]] = None,
+                            spatialFields: Optional[List[int]] = None) -> RDD:
+        """
+        Same as SpatialJoinQuery, but only user data is transferred to Python, geometries are not serialized.
+
+        :param spatialRDD:
+        :param queryRDD:
+        :param useIndex:
+        :param considerBoundaryIntersection:
+        :param queryFields: indices of tab separated query user data fields to keep, whole user data by default
+        :param spatialFields: indices of tab separated spatial user data fields to keep, whole user data by default
+        :return: RDD of [query user data, list of spatial user data]
+        """
+
+        jvm = spatialRDD._jvm
+        sc = spatialRDD._sc
+
+        srdd = cls._join(spatialRDD, queryRDD, useIndex, considerBoundaryIntersection)
+        serialized = jvm.UserDataSerializer.serializeUserDataToPythonHashSet(
+            srdd, queryFields or [], spatialFields or []
+        )
+
+        return RDD(serialized, sc, GeoSparkPickler())
+
+    @classmethod
+    @require([GeoSparkLib.JoinQuery, GeoSparkLib.UserDataSerializer])
+    def SpatialJoinQueryFlatIds(cls, spatialRDD: SpatialRDD, queryRDD: SpatialRDD, useIndex: bool,
+                                considerBoundaryIntersection: bool, queryFields: Optional[List[int]] = None,
+                                spatialFields: Optional[List[int]] = None) -> RDD:
+        """
+        Same as SpatialJoinQueryFlat, but only user data is transferred to Python, geometries are not serialized.
+
+        :param spatialRDD:
+        :param queryRDD:
+        :param useIndex:
+        :param considerBoundaryIntersection:
+        :param queryFields: indices of tab separated query user data fields to keep, whole user data by default
+        :param spatialFields: indices of tab separated spatial user data fields to keep, whole user data by default
+        :return: RDD of [query user data, spatial user data]
+        """
+
+        jvm = spatialRDD._jvm
+        sc = spatialRDD._sc
+
+        srdd = cls._join(spatialRDD, queryRDD, useIndex, considerBoundaryIntersection, flat=True)
+        serialized = jvm.UserDataSerializer.serializeUserDataToPython(srdd, queryFields or [], spatialFields or [])
+
+        return RDD(serialized, sc, GeoSparkPickler())
+
+    @classmethod
+    @require([GeoSparkLib.JoinQuery, GeoSparkLib.UserDataSerializer])
+    def DistanceJoinQueryFlatIds(cls, spatialRDD: SpatialRDD, queryRDD: SpatialRDD, useIndex: bool,
+                                 considerBoundaryIntersection: bool, queryFields: Optional[List[int]] = None,
+                                 spatialFields: Optional[List[int]] = None) -> RDD:
+        """
+        Same as DistanceJoinQueryFlat, but only user data is transferred to Python, geometries are not serialized.
+
+        :param spatialRDD:
+        :param queryRDD:
+        :param useIndex:
+        :param considerBoundaryIntersection:
+        :param queryFields: indices of tab separated query user data fields to keep, whole user data by default
+        :param spatialFields: indices of tab separated spatial user data fields to keep, whole user data by default
+        :return: RDD of [query user data, spatial user data]
+        """
+
+        jvm = spatialRDD._jvm
+        sc = spatialRDD._sc
+
+        srdd = cls._join(spatialRDD, queryRDD, useIndex, considerBoundaryIntersection, flat=True, distance=True)
+        serialized = jvm.UserDataSerializer.serializeUserDataToPython(srdd, queryFields or [], spatialFields or [])
+
+        return RDD(serialized, sc, GeoSparkPickler())
+
+    @classmethod
+    @require([GeoSparkLib.BroadcastSpatialJoin])
+    def BroadcastSpatialJoin(cls, spatialRDD: SpatialRDD, queryRDD: SpatialRDD, considerBoundaryIntersection: bool) -> RDD:
+        """
+        Joins spatialRDD with small queryRDD without spatial partitioning and shuffle. STRtree of query geometries is
+        broadcast and probed with prepared geometries in each spatialRDD partition.
+
+        :param spatialRDD: large SpatialRDD
+        :param queryRDD: SpatialRDD small enough to be collected on driver
+        :param considerBoundaryIntersection:
+        :return: RDD of [query geometry, spatial geometry]
+        """
+
+        jvm = spatialRDD._jvm
+        sc = spatialRDD._sc
+
+        srdd = jvm.BroadcastSpatialJoin.join(spatialRDD._srdd, queryRDD._srdd, considerBoundaryIntersection)
+
+        serialized = jvm.GeoSerializerData.serializeToPython(srdd)
+
+        return SpatialPairRDD(serialized, sc, srdd)
+
+    @classmethod
+    @require([GeoSparkLib.GeodesicDistanceJoin])
+    def GeodesicDistanceJoinQueryFlat(cls, spatialRDD: SpatialRDD, queryRDD: SpatialRDD, distance: float) -> RDD:
+        """
+        Distance join for longitude, latitude coordinates with distance in meters, no CRSTransform is needed.
+        Query geometries are sent to spatialRDD partitions overlapping their envelope expanded by distance for
+        their latitude band and matches are filtered with haversine distance of centroids.
+
+        :param spatialRDD: spatially partitioned SpatialRDD
+        :param queryRDD: SpatialRDD, does not have to be partitioned
+        :param distance: float, distance in meters
+        :return: RDD of [query geometry, spatial geometry]
+        """
+
+        if get_field(spatialRDD._srdd, "spatialPartitionedRDD") is None:
+            raise AttributeError("Please run spatial partitioning on spatialRDD before geodesic distance join")
+        if distance < 0:
+            raise ValueError("distance should not be negative")
+
+        jvm = spatialRDD._jvm
+        sc = spatialRDD._sc
+
+        srdd = jvm.GeodesicDistanceJoin.joinFlat(spatialRDD._srdd, queryRDD._srdd, float(distance))
+
+        serialized = jvm.GeoSerializerData.serializeToPython(srdd)
+
+        return SpatialPairRDD(serialized, sc, srdd)
+
+    @classmethod
+    @require([GeoSparkLib.JoinCardinality])
+    def estimateJoinCardinality(cls, spatialRDD: SpatialRDD, queryRDD: SpatialRDD, considerBoundaryIntersection: bool,
+                                sampleFraction: float = 0.01, seed: int = 0) -> JoinCardinalityEstimate:
+        """
+        Estimates number of pairs returned by SpatialJoinQueryFlat without running the join. Query geometries of
+        each partition are sampled and matched against whole partition of spatialRDD, so cost is proportional to
+        sampleFraction plus building partition indexes.
+
+        :param spatialRDD: SpatialRDD partitioned with the same partitioner as queryRDD
+        :param queryRDD:
+        :param considerBoundaryIntersection:
+        :param sampleFraction: float, fraction of query geometries matched in each partition
+        :param seed: int
+        :return: JoinCardinalityEstimate, with estimated count and per partition skew
+        """
+        if not 0.0 < sampleFraction <= 1.0:
+            raise ValueError("sampleFraction should be in (0, 1]")
+        if get_field(spatialRDD._srdd, "spatialPartitionedRDD") is None or \
+                get_field(queryRDD._srdd, "spatialPartitionedRDD") is None:
+            raise AttributeError("Please run spatial partitioning before join cardinality estimation")
+
+        data = spatialRDD._jvm.JoinCardinality.estimate(
+            spatialRDD._srdd, queryRDD._srdd, considerBoundaryIntersection, float(sampleFraction), seed
+        )
+        return JoinCardinalityEstimate.from_bytes(data)
+
+    @classmethod
+    def _join(cls, spatialRDD: SpatialRDD, queryRDD: SpatialRDD, useIndex: bool, considerBoundaryIntersection: bool,
+              referencePointDedup: bool = False, flat: bool = False, distance: bool = False):
+        jvm = spatialRDD._jvm
+
+        if cls._use_broadcast_join(spatialRDD, queryRDD, useIndex, referencePointDedup):
+            broadcast_join = jvm.BroadcastSpatialJoin.join if flat else jvm.BroadcastSpatialJoin.joinGrouped
+            return broadcast_join(spatialRDD._srdd, queryRDD._srdd, considerBoundaryIntersection)
+
+        if referencePointDedup:
+            return cls._reference_point_join(spatialRDD, queryRDD, useIndex, considerBoundaryIntersection, flat)
+
+        join_name = ("DistanceJoinQuery" if distance else "SpatialJoinQuery") + ("Flat" if flat else "")
+        return getattr(jvm.JoinQuery, join_name)(
             spatialRDD._srdd,
             queryRDD._srdd,
             useIndex,
             considerBoundaryIntersection
         )
 
-        serlialized = jvm.GeoSerializerData.serializeToPython(srdd)
+    @classmethod
+    def _use_broadcast_join(cls, spatialRDD: SpatialRDD, queryRDD: SpatialRDD, useIndex: bool = True,
+                            referencePointDedup: bool = False) -> bool:
+        """
+        Broadcast join always probes an index of query geometries and needs RDDs which are not partitioned, so it is
+        not used when caller asks for join without index or for reference point deduplication.
+        """
+        if not useIndex or referencePointDedup:
+            return False
 
-        return RDD(serlialized, sc, GeoSparkPickler())
+        threshold = int(spatialRDD._sc.getConf().get(BROADCAST_THRESHOLD_CONF, str(DEFAULT_BROADCAST_THRESHOLD)))
+        if threshold <= 0 or not ImportedJvmLib.has_library(GeoSparkLib.BroadcastSpatialJoin):
+            return False
+
+        if get_field(spatialRDD._srdd, "spatialPartitionedRDD") is not None or \
+                get_field(queryRDD._srdd, "spatialPartitionedRDD") is not None:
+            return False
+
+        return queryRDD.statistics.count <= threshold
+
+    @classmethod
+    @require([GeoSparkLib.ReferencePointJoin])
+    def _reference_point_join(cls, spatialRDD: SpatialRDD, queryRDD: SpatialRDD, useIndex: bool,
+                              considerBoundaryIntersection: bool, flat: bool = False):
+        if get_field(spatialRDD._srdd, "spatialPartitionedRDD") is None or \
+                get_field(queryRDD._srdd, "spatialPartitionedRDD") is None:
+            raise AttributeError("Reference point deduplication requires spatially partitioned RDDs")
+
+        join = spatialRDD._jvm.ReferencePointJoin.joinFlat if flat else spatialRDD._jvm.ReferencePointJoin.join
+        return join(spatialRDD._srdd, queryRDD._srdd, useIndex, considerBoundaryIntersection)
+
+    @classmethod
+    def _serialize_hash_set(cls, jvm, srdd, maxChunkSize: Optional[int]):
+        if maxChunkSize is None:
+            return jvm.GeoSerializerData.serializeToPythonHashSet(srdd)
+        if maxChunkSize <= 0:
+            raise ValueError("maxChunkSize should be positive")
+        return cls._serialize_chunks(jvm, srdd, maxChunkSize)
+
+    @classmethod
+    @require([GeoSparkLib.ChunkedJoinSerializer])
+    def _serialize_chunks(cls, jvm, srdd, maxChunkSize: int):
+        return jvm.ChunkedJoinSerializer.serializeToPythonHashSet(srdd, maxChunkSize)
@@ -1,8 +1,13 @@
+from typing import Optional, List
+
+from py4j.java_gateway import get_field
 from pyspark import RDD
 
+from geo_pyspark.core.SpatialRDD import PointRDD
+from geo_pyspark.core.SpatialRDD.point_rdd import MAX_POINTS_PER_RECORD
 from geo_pyspark.core.SpatialRDD.spatial_rdd import SpatialRDD
 from geo_pyspark.core.geom_types import Envelope
-from geo_pyspark.core.utils import require
+from geo_pyspark.core.utils import require, ImportedJvmLib
 from geo_pyspark.register.java_libs import GeoSparkLib
 from geo_pyspark.utils.rdd_pickling import GeoSparkPickler
 
@@ -13,6 +18,8 @@ class RangeQuery:
     @require([GeoSparkLib.RangeQuery])
     def SpatialRangeQuery(self, spatialRDD: SpatialRDD, rangeQueryWindow: Envelope, considerBoundaryIntersection: bool, usingIndex: bool):
         """
+        When SpatialRDD is spatially partitioned, only partitions which grids intersect query window are scanned
+        (requires RangeQueryPruning from geo_wrapper jar, otherwise all partitions are scanned).
 
         :param spatialRDD:
         :param rangeQueryWindow:
@@ -24,9 +31,55 @@ class RangeQuery:
         jvm = spatialRDD._jvm
         sc = spatialRDD._sc
 
+        srdd = self._spatial_range_query(spatialRDD, rangeQueryWindow, considerBoundaryIntersection, usingIndex)
+
+        serlialized = jvm.GeoSerializerData.serializeToPython(srdd)
+
+        return RDD(serlialized, sc, GeoSparkPickler())
+
+    @classmethod
+    @require([GeoSparkLib.RangeQuery, GeoSparkLib.PointArraySerializer])
+    def SpatialRangeQueryPointArrays(self, spatialRDD: PointRDD, rangeQueryWindow: Envelope,
+                                     considerBoundaryIntersection: bool, usingIndex: bool,
+                                     withUserData: bool = False, maxPointsPerRecord: int = MAX_POINTS_PER_RECORD) -> RDD:
+        """
+        Range query on PointRDD which result is transferred as packed x, y arrays (PointArray records).
+
+        :param spatialRDD: PointRDD
+        :param rangeQueryWindow:
+        :param considerBoundaryIntersection:
+        :param usingIndex:
+        :param withUserData: bool, transfer user data as well
+        :param maxPointsPerRecord: int
+        :return: RDD of PointArray
+        """
+        jvm = spatialRDD._jvm
+        sc = spatialRDD._sc
+
+        srdd = self._spatial_range_query(spatialRDD, rangeQueryWindow, considerBoundaryIntersection, usingIndex)
+
+        serialized = jvm.PointArraySerializer.serializePointsToPython(srdd, withUserData, maxPointsPerRecord)
+
+        return RDD(serialized, sc, GeoSparkPickler())
+
+    @classmethod
+    def _spatial_range_query(cls, spatialRDD: SpatialRDD, rangeQueryWindow: Envelope,
+                             considerBoundaryIntersection: bool, usingIndex: bool):
+        jvm = spatialRDD._jvm
         jvm_envelope = rangeQueryWindow.create_jvm_instance(jvm)
 
-        srdd = jvm.\
+        partition_ids = cls._pruned_partition_ids(spatialRDD, rangeQueryWindow, usingIndex)
+
+        if partition_ids is not None:
+            return jvm.RangeQueryPruning.SpatialRangeQuery(
+                spatialRDD._srdd,
+                jvm_envelope,
+                considerBoundaryIntersection,
+                usingIndex,
+                partition_ids
+            )
+
+        return jvm.\
             RangeQuery.SpatialRangeQuery(
             spatialRDD._srdd,
             jvm_envelope,
@@ -34,6 +87,21 @@ class RangeQuery:
             usingIndex
         )
 
-        serlialized = jvm.GeoSerializerData.serializeToPython(srdd)
+    @classmethod
+    def _pruned_partition_ids(cls, spatialRDD: SpatialRDD, rangeQueryWindow: Envelope, usingIndex: bool) -> Optional[List[int]]:
+        if not ImportedJvmLib.has_library(GeoSparkLib.RangeQueryPruning):
+            return None
+        if spatialRDD.getCRStransformation():
+            return None
+        if usingIndex and get_field(spatialRDD._srdd, "indexedRDD") is None:
+            return None
 
-        return RDD(serlialized, sc, GeoSparkPickler())
+        partition_ids = spatialRDD.getOverlappingPartitionIds(rangeQueryWindow)
+        if partition_ids is None:
+            return None
+
+        number_of_partitions = get_field(spatialRDD._srdd, "spatialPartitionedRDD").getNumPartitions()
+        if len(partition_ids) >= number_of_partitions:
+            return None
+
+        return partition_ids
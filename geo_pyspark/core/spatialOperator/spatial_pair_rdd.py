@@ -0,0 +1,19 @@
+from typing import Optional
+
+from pyspark import RDD, SparkContext
+
+from geo_pyspark.core.spatialOperator.join_params import JoinDecision
+from geo_pyspark.utils.rdd_pickling import GeoSparkPickler
+
+
+class SpatialPairRDD(RDD):
+    """
+    RDD of join pairs which keeps reference to JVM JavaPairRDD, so Adapter.toDf can convert it to DataFrame
+    on JVM side. RDDs derived with map, filter, etc. are plain RDDs. Result of automatic spatialJoin keeps
+    chosen strategy as joinDecision.
+    """
+
+    def __init__(self, jrdd, ctx: SparkContext, jvm_pair_rdd, joinDecision: Optional[JoinDecision] = None):
+        super().__init__(jrdd, ctx, GeoSparkPickler())
+        self.jvm_pair_rdd = jvm_pair_rdd
+        self.joinDecision = joinDecision
@@ -0,0 +1,200 @@
+import json
+import statistics
+import struct
+from typing import List, Optional
+
+import attr
+
+from geo_pyspark.core.geom_types import Envelope
+
+
+@attr.s
+class PartitionStatistics:
+    partition_id = attr.ib(type=int)
+    count = attr.ib(type=int)
+    envelope = attr.ib(type=Optional[Envelope])
+
+    def to_dict(self) -> dict:
+        envelope = self.envelope
+        return dict(
+            partition_id=self.partition_id,
+            count=self.count,
+            envelope=[envelope.minx, envelope.maxx, envelope.miny, envelope.maxy] if envelope is not None else None
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PartitionStatistics':
+        envelope = data["envelope"]
+        return cls(
+            partition_id=data["partition_id"],
+            count=data["count"],
+            envelope=Envelope(*envelope) if envelope is not None else None
+        )
+
+
+@attr.s
+class SpatialRDDStatistics:
+    """
+    Statistics computed by SpatialRDD.analyze, boundary and count are derived from per partition values.
+    """
+    partitions = attr.ib(type=List[PartitionStatistics])
+
+    @property
+    def count(self) -> int:
+        return sum(partition.count for partition in self.partitions)
+
+    @property
+    def boundary(self) -> Optional[Envelope]:
+        envelopes = [partition.envelope for partition in self.partitions if partition.envelope is not None]
+        if not envelopes:
+            return None
+        return Envelope(
+            minx=min(envelope.minx for envelope in envelopes),
+            maxx=max(envelope.maxx for envelope in envelopes),
+            miny=min(envelope.miny for envelope in envelopes),
+            maxy=max(envelope.maxy for envelope in envelopes)
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'SpatialRDDStatistics':
+        number_of_partitions = struct.unpack_from("<i", data, 0)[0]
+        partitions = []
+        for partition_id, count, minx, maxx, miny, maxy in struct.iter_unpack("<iq4d", data[4:]):
+            envelope = Envelope(minx, maxx, miny, maxy) if count > 0 else None
+            partitions.append(PartitionStatistics(partition_id, count, envelope))
+
+        if len(partitions) != number_of_partitions:
+            raise ValueError("Statistics are corrupted")
+
+        return cls(partitions)
+
+    def to_json(self) -> str:
+        return json.dumps(dict(partitions=[partition.to_dict() for partition in self.partitions]))
+
+    @classmethod
+    def from_json(cls, data: str) -> 'SpatialRDDStatistics':
+        return cls([PartitionStatistics.from_dict(partition) for partition in json.loads(data)["partitions"]])
+
+
+@attr.s
+class PartitionReport:
+    partition_id = attr.ib(type=int)
+    count = attr.ib(type=int)
+    envelope = attr.ib(type=Optional[Envelope])
+    number_of_vertices = attr.ib(type=int)
+    serialized_size = attr.ib(type=int)
+
+
+def skew(values: List[int]) -> float:
+    if not values:
+        return 1.0
+    median = statistics.median(values)
+    maximum = max(values)
+    if median == 0:
+        return float("inf") if maximum > 0 else 1.0
+    return maximum / median
+
+
+@attr.s
+class PartitionStatsReport:
+    """
+    Result of SpatialRDD.partitionStats, skew is ratio of maximum and median value over partitions.
+    """
+    partitions = attr.ib(type=List[PartitionReport])
+
+    @property
+    def count_skew(self) -> float:
+        return skew([partition.count for partition in self.partitions])
+
+    @property
+    def vertices_skew(self) -> float:
+        return skew([partition.number_of_vertices for partition in self.partitions])
+
+    @property
+    def size_skew(self) -> float:
+        return skew([partition.serialized_size for partition in self.partitions])
+
+    def summary(self) -> dict:
+        return dict(
+            number_of_partitions=len(self.partitions),
+            count=sum(partition.count for partition in self.partitions),
+            max_count=max((partition.count for partition in self.partitions), default=0),
+            median_count=statistics.median([partition.count for partition in self.partitions] or [0]),
+            count_skew=self.count_skew,
+            vertices_skew=self.vertices_skew,
+            size_skew=self.size_skew
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'PartitionStatsReport':
+        number_of_partitions = struct.unpack_from("<i", data, 0)[0]
+        partitions = []
+        for partition_id, count, minx, maxx, miny, maxy, number_of_vertices, serialized_size in \
+                struct.iter_unpack("<iq4dqq", data[4:]):
+            envelope = Envelope(minx, maxx, miny, maxy) if count > 0 else None
+            partitions.append(PartitionReport(partition_id, count, envelope, number_of_vertices, serialized_size))
+
+        if len(partitions) != number_of_partitions:
+            raise ValueError("Partition statistics are corrupted")
+
+        return cls(partitions)
+
+
+@attr.s
+class PartitionCardinality:
+    partition_id = attr.ib(type=int)
+    query_count = attr.ib(type=int)
+    sampled_query_count = attr.ib(type=int)
+    sampled_matches = attr.ib(type=int)
+
+
+@attr.s
+class JoinCardinalityEstimate:
+    """
+    Result of JoinQuery.estimateJoinCardinality. Partitions without sampled query geometries are estimated with
+    average number of matches per sampled query geometry over all partitions.
+    """
+    partitions = attr.ib(type=List[PartitionCardinality])
+
+    @property
+    def matches_per_query(self) -> float:
+        sampled = sum(partition.sampled_query_count for partition in self.partitions)
+        if sampled == 0:
+            return 0.0
+        return sum(partition.sampled_matches for partition in self.partitions) / sampled
+
+    def partition_estimates(self) -> List[float]:
+        matches_per_query = self.matches_per_query
+        return [
+            partition.sampled_matches * partition.query_count / partition.sampled_query_count
+            if partition.sampled_query_count > 0 else partition.query_count * matches_per_query
+            for partition in self.partitions
+        ]
+
+    @property
+    def count(self) -> int:
+        return int(round(sum(self.partition_estimates())))
+
+    @property
+    def skew(self) -> float:
+        return skew(self.partition_estimates())
+
+    def summary(self) -> dict:
+        estimates = self.partition_estimates()
+        return dict(
+            number_of_partitions=len(self.partitions),
+            count=self.count,
+            max_count=int(round(max(estimates, default=0))),
+            sampled_query_count=sum(partition.sampled_query_count for partition in self.partitions),
+            skew=self.skew
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'JoinCardinalityEstimate':
+        number_of_partitions = struct.unpack_from("<i", data, 0)[0]
+        partitions = [PartitionCardinality(*values) for values in struct.iter_unpack("<iqqq", data[4:])]
+
+        if len(partitions) != number_of_partitions:
+            raise ValueError("Join cardinality estimate is corrupted")
+
+        return cls(partitions)
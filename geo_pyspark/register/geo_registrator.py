@@ -1,6 +1,7 @@
 import attr
 from pyspark.sql import SparkSession
 from py4j.java_gateway import java_import
+from py4j.protocol import Py4JError
 
 from geo_pyspark.register.java_libs import GeoSparkLib
 from geo_pyspark.utils.prep import assign_all
@@ -28,7 +29,12 @@ class GeoSparkRegistrator:
 
     @classmethod
     def register(cls, spark: SparkSession):
-        return spark._jvm.GeoSparkSQLRegistrator.registerAll(spark._jsparkSession)
+        from geo_pyspark.core.utils import ImportedJvmLib
+        registered = spark._jvm.GeoSparkSQLRegistrator.registerAll(spark._jsparkSession)
+        for lib in [GeoSparkLib.SpaceFillingCurve, GeoSparkLib.QuadKeyJoin, GeoSparkLib.GeoParquet]:
+            if ImportedJvmLib.has_library(lib):
+                getattr(spark._jvm, lib.name).registerFunctions(spark._jsparkSession)
+        return registered
 
 
 class PackageImporter:
@@ -43,6 +49,22 @@ class PackageImporter:
         """
         for lib in GeoSparkLib:
             java_import(jvm, lib.value)
-            ImportedJvmLib.import_lib(lib)
+            if PackageImporter.is_available(jvm, lib.value):
+                ImportedJvmLib.import_lib(lib)
+
+        return True
 
+    @staticmethod
+    def is_available(jvm, class_name: str) -> bool:
+        """
+        Checks if class can be loaded, so functions requiring classes missing in installed jars fail with clear
+        message instead of py4j error.
+        :param jvm: Jvm gateway from py4j
+        :param class_name: str, full class name
+        :return: bool
+        """
+        try:
+            jvm.py4j.reflection.ReflectionUtil.classForName(class_name)
+        except Py4JError:
+            return False
         return True
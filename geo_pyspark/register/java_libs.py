@@ -26,3 +26,22 @@ class GeoSparkLib(Enum):
     GridType = "org.datasyslab.geospark.enums.GridType"
     IndexType = "org.datasyslab.geospark.enums.IndexType"
     AdapterWrapper = "org.imbruced.geo_pyspark.AdapterWrapper"
+    RangeQueryPruning = "org.imbruced.geo_pyspark.RangeQueryPruning"
+    PartitionTreeSerializer = "org.imbruced.geo_pyspark.serializers.PartitionTreeSerializer"
+    SpatialPartitionerSerializer = "org.imbruced.geo_pyspark.serializers.SpatialPartitionerSerializer"
+    SpatialStatistics = "org.imbruced.geo_pyspark.SpatialStatistics"
+    BroadcastSpatialJoin = "org.imbruced.geo_pyspark.BroadcastSpatialJoin"
+    ReferencePointJoin = "org.imbruced.geo_pyspark.ReferencePointJoin"
+    GeodesicDistanceJoin = "org.imbruced.geo_pyspark.GeodesicDistanceJoin"
+    JoinCardinality = "org.imbruced.geo_pyspark.JoinCardinality"
+    PairRDDAdapter = "org.imbruced.geo_pyspark.PairRDDAdapter"
+    IndexedRDDPersistence = "org.imbruced.geo_pyspark.serializers.IndexedRDDPersistence"
+    PartitionedDataset = "org.imbruced.geo_pyspark.serializers.PartitionedDataset"
+    SpatialRDDWriter = "org.imbruced.geo_pyspark.serializers.SpatialRDDWriter"
+    ParallelShapefileReader = "org.imbruced.geo_pyspark.ParallelShapefileReader"
+    SpaceFillingCurve = "org.imbruced.geo_pyspark.SpaceFillingCurve"
+    QuadKeyJoin = "org.imbruced.geo_pyspark.QuadKeyJoin"
+    GeoParquet = "org.imbruced.geo_pyspark.GeoParquet"
+    PointArraySerializer = "org.imbruced.geo_pyspark.serializers.PointArraySerializer"
+    UserDataSerializer = "org.imbruced.geo_pyspark.serializers.UserDataSerializer"
+    ChunkedJoinSerializer = "org.imbruced.geo_pyspark.serializers.ChunkedJoinSerializer"
@@ -0,0 +1,115 @@
+import json
+from typing import Optional
+
+from pyspark.sql import DataFrame, SparkSession
+from pyspark.sql.functions import col, expr
+
+from geo_pyspark.core.geom_types import Envelope
+from geo_pyspark.core.utils import require
+from geo_pyspark.register.java_libs import GeoSparkLib
+
+BBOX_COLUMNS = ("xmin", "ymin", "xmax", "ymax")
+METADATA_KEY = "geo"
+
+
+class GeoParquet:
+    """
+    Parquet storage of DataFrames with geometry column. Geometry is stored as WKB together with xmin, ymin, xmax
+    and ymax columns, which Parquet min/max statistics use to skip row groups when reading by envelope. Rows are
+    sorted by Hilbert key within partitions so row groups cover compact areas. Bounding box of whole dataset is
+    kept in metadata of geometry column.
+
+    >> GeoParquet.write(counties_df, "counties.parquet", "geometry")
+    >> GeoParquet.read(spark, "counties.parquet", Envelope(1.0, 101.0, 100.0, 200.0))
+    """
+
+    @classmethod
+    @require([GeoSparkLib.GeoParquet, GeoSparkLib.SpaceFillingCurve])
+    def write(cls, dataFrame: DataFrame, path: str, geometryColumn: str = "geometry", mode: str = "error",
+              sort: bool = True, precision: int = 16):
+        """
+        Bounding box is computed by separate aggregation job before writing, it is both extent of Hilbert keys and
+        part of schema metadata, so it has to be known before any row is written. Input is evaluated twice,
+        cache dataFrame beforehand when it is expensive to compute.
+
+        :param dataFrame: DataFrame with geometry column
+        :param path: str, output location
+        :param geometryColumn: str, name of geometry column
+        :param mode: str, save mode used by DataFrameWriter
+        :param sort: bool, sort rows within partitions by Hilbert key of geometry envelope center
+        :param precision: int, Hilbert curve precision used for sorting
+        """
+        for name in BBOX_COLUMNS:
+            if name in dataFrame.columns:
+                raise ValueError(f"Column {name} is reserved for geometry bounding box")
+
+        geometry = f"`{geometryColumn}`"
+        bounded = dataFrame.\
+            withColumn("xmin", expr(f"ST_XMin({geometry})")).\
+            withColumn("ymin", expr(f"ST_YMin({geometry})")).\
+            withColumn("xmax", expr(f"ST_XMax({geometry})")).\
+            withColumn("ymax", expr(f"ST_YMax({geometry})"))
+
+        bbox = bounded.selectExpr("min(xmin)", "min(ymin)", "max(xmax)", "max(ymax)").first()
+        bbox = [float(value) for value in bbox] if bbox[0] is not None else None
+
+        if sort and bbox is not None:
+            bounded = bounded.sortWithinPartitions(expr(
+                f"ST_HilbertKey({geometry}, {precision}, {bbox[0]}, {bbox[2]}, {bbox[1]}, {bbox[3]})"
+            ))
+
+        metadata = {METADATA_KEY: json.dumps(dict(encoding="WKB", bbox=bbox))}
+        columns = [
+            expr(f"ST_AsBinary({geometry})").alias(geometryColumn, metadata=metadata)
+            if name == geometryColumn else col(f"`{name}`")
+            for name in bounded.columns
+        ]
+        bounded.select(*columns).write.mode(mode).parquet(path)
+
+    @classmethod
+    @require([GeoSparkLib.GeoParquet])
+    def read(cls, spark: SparkSession, path: str, queryWindow: Optional[Envelope] = None,
+             geometryColumn: str = "geometry") -> DataFrame:
+        """
+        :param spark: SparkSession
+        :param path: str, location used in write
+        :param queryWindow: Envelope, rows which geometry envelopes intersect query window are read, all when None
+        :param geometryColumn: str, name of geometry column
+        :return: DataFrame with geometry column decoded and without bounding box columns
+        """
+        data_frame = spark.read.parquet(path)
+        if queryWindow is not None:
+            bbox = cls._bbox_from_dataframe(data_frame, geometryColumn)
+            if bbox is not None and not bbox.intersects(queryWindow):
+                data_frame = data_frame.limit(0)
+            else:
+                data_frame = data_frame.where(
+                    (col("xmax") >= queryWindow.minx) & (col("xmin") <= queryWindow.maxx) &
+                    (col("ymax") >= queryWindow.miny) & (col("ymin") <= queryWindow.maxy)
+                )
+
+        return data_frame.\
+            withColumn(geometryColumn, expr(f"ST_GeomFromBinary(`{geometryColumn}`)")).\
+            drop(*BBOX_COLUMNS)
+
+    @classmethod
+    def bbox(cls, spark: SparkSession, path: str, geometryColumn: str = "geometry") -> Optional[Envelope]:
+        """
+        Bounding box stored by write, read from Parquet schema without scanning data.
+        :param spark: SparkSession
+        :param path: str, location used in write
+        :param geometryColumn: str, name of geometry column
+        :return: Envelope or None when data set was empty
+        """
+        return cls._bbox_from_dataframe(spark.read.parquet(path), geometryColumn)
+
+    @staticmethod
+    def _bbox_from_dataframe(dataFrame: DataFrame, geometryColumn: str) -> Optional[Envelope]:
+        metadata = dataFrame.schema[geometryColumn].metadata
+        if METADATA_KEY not in metadata:
+            return None
+        bbox = json.loads(metadata[METADATA_KEY])["bbox"]
+        if bbox is None:
+            return None
+        minx, miny, maxx, maxy = bbox
+        return Envelope(minx, maxx, miny, maxy)
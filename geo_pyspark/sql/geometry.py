@@ -5,9 +5,12 @@ from shapely.geometry.base import BaseGeometry
 
 from geo_pyspark.sql.enums import GeomEnum, ShapeEnum
 from geo_pyspark.sql.exceptions import GeometryUnavailableException
-from geo_pyspark.utils.abstract_parser import GeometryParser
 from geo_pyspark.utils.binary_parser import BinaryParser, BinaryBuffer
-from geo_pyspark.utils.parsers import CircleParser, PARSERS
+from geo_pyspark.utils.parsers import CircleParser, PointParser, DECODERS, ENCODERS
+
+SHAPE = ShapeEnum.shape.value
+CIRCLE = ShapeEnum.circle.value
+POINT = GeomEnum.point.value
 
 
 @attr.s
@@ -16,29 +19,26 @@ class GeometryFactory:
     @classmethod
     def geometry_from_bytes(cls, bin_parser: BinaryParser) -> BaseGeometry:
         g_type = bin_parser.read_byte()
-        shape_type = ShapeEnum.get_name(g_type)
-
-        if shape_type == ShapeEnum.circle.name:
-            return CircleParser.deserialize(bin_parser)
 
-        elif shape_type == ShapeEnum.shape.name:
+        if g_type == SHAPE:
             gm_type = bin_parser.read_byte()
-            if GeomEnum.has_value(gm_type):
-                name = GeomEnum.get_name(gm_type)
-                parser: GeometryParser = PARSERS[name]
-                geom = parser.deserialize(bin_parser)
-                return geom
-            else:
+            if gm_type == POINT:
+                return PointParser.deserialize(bin_parser)
+            try:
+                parser = DECODERS[gm_type]
+            except KeyError:
                 raise GeometryUnavailableException(f"Can not deserialize object")
+            return parser.deserialize(bin_parser)
+
+        elif g_type == CIRCLE:
+            return CircleParser.deserialize(bin_parser)
+
+        raise GeometryUnavailableException(f"Can not deserialize object")
 
     @classmethod
     def to_bytes(cls, geom: BaseGeometry) -> List[int]:
-        from geo_pyspark.sql.types import GeometryType
-        geom_name = str(geom.__class__.__name__).lower()
-
         try:
-            appr_parser = PARSERS[geom_name]
-            geom.__UDT__ = GeometryType()
+            appr_parser = ENCODERS[geom.__class__]
         except KeyError:
-            raise KeyError(f"Parser for geometry {geom_name} is not available")
+            raise KeyError(f"Parser for geometry {geom.__class__.__name__.lower()} is not available")
         return appr_parser.serialize(geom, BinaryBuffer())
@@ -0,0 +1,136 @@
+import uuid
+from collections import OrderedDict
+from typing import List, Any, Optional, Tuple
+
+import numpy as np
+from pyspark.sql.types import DataType, StringType
+from shapely import wkb
+from shapely.geometry import Point
+from shapely.geometry.base import BaseGeometry
+from shapely.prepared import prep
+from shapely.strtree import STRtree
+
+from geo_pyspark.utils.shapely_version import SHAPELY_2
+
+MAX_CACHED_INDEXES = 4
+_INDEXES = OrderedDict()
+
+
+class PreparedPolygonIndex:
+    """
+    STRtree over prepared polygons, built from broadcast WKB once per python worker.
+    """
+
+    def __init__(self, polygons: List[Tuple[Any, bytes]]):
+        self.ids = [polygon_id for polygon_id, _ in polygons]
+        self.geometries = [wkb.loads(bytes(data)) for _, data in polygons]
+        self.prepared = [prep(geometry) for geometry in self.geometries]
+        self.tree = STRtree(self.geometries) if SHAPELY_2 else STRtree(self.geometries, range(len(self.geometries)))
+
+    def lookup(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Id of the first polygon (in input order) containing each point, None when point is not covered.
+        """
+        result = np.full(len(x), None, dtype=object)
+        if not self.geometries:
+            return result
+
+        if SHAPELY_2:
+            import shapely
+            point_positions, polygon_positions = self.tree.query(shapely.points(x, y), predicate="within")
+            order = np.lexsort((polygon_positions, point_positions))
+            point_positions, polygon_positions = point_positions[order], polygon_positions[order]
+            first = np.unique(point_positions, return_index=True)[1]
+            result[point_positions[first]] = [self.ids[position] for position in polygon_positions[first]]
+            return result
+
+        for position, (point_x, point_y) in enumerate(zip(x, y)):
+            point = Point(point_x, point_y)
+            for polygon_position in sorted(self.tree.query_items(point)):
+                if self.prepared[polygon_position].contains(point):
+                    result[position] = self.ids[polygon_position]
+                    break
+        return result
+
+
+class PolygonLookup:
+    """
+    Broadcast polygon index for tagging points with id of polygon they fall in. Polygons are broadcast as WKB
+    and prepared index is built once per python worker and reused by following tasks and batches. Each python
+    process keeps at most MAX_CACHED_INDEXES most recently used indexes.
+
+    >> lookup = PolygonLookup.from_dataframe(polygon_df, "geometry", "county_id")
+    >> points_df.withColumn("county_id", lookup.udf()(col("x"), col("y")))
+    """
+
+    def __init__(self, sparkContext, polygons: List[Tuple[Any, BaseGeometry]], idType: Optional[DataType] = None):
+        self._key = uuid.uuid4().hex
+        self._id_type = idType if idType is not None else StringType()
+        self._broadcast = sparkContext.broadcast(
+            [(polygon_id, wkb.dumps(geometry)) for polygon_id, geometry in polygons]
+        )
+
+    @classmethod
+    def from_spatial_rdd(cls, spatialRDD, idField: Optional[int] = None) -> 'PolygonLookup':
+        """
+        :param spatialRDD: PolygonRDD or other SpatialRDD
+        :param idField: index of tab separated user data field used as id, whole user data by default
+        :return: PolygonLookup
+        """
+        def polygon_id(user_data: str):
+            return user_data if idField is None else user_data.split("\t")[idField]
+
+        polygons = spatialRDD.rawSpatialRDD.map(lambda geo_data: (polygon_id(geo_data.userData), geo_data.geom)).collect()
+        return cls(spatialRDD._sc, polygons, StringType())
+
+    @classmethod
+    def from_dataframe(cls, dataFrame, geometryColumn: str, idColumn: str) -> 'PolygonLookup':
+        """
+        :param dataFrame: DataFrame with geometry column
+        :param geometryColumn: str
+        :param idColumn: str
+        :return: PolygonLookup
+        """
+        polygons = [(row[idColumn], row[geometryColumn]) for row in dataFrame.select(idColumn, geometryColumn).collect()]
+        return cls(dataFrame._sc, polygons, dataFrame.schema[idColumn].dataType)
+
+    def index(self) -> PreparedPolygonIndex:
+        index = _INDEXES.get(self._key)
+        if index is None:
+            index = PreparedPolygonIndex(self._broadcast.value)
+            _INDEXES[self._key] = index
+            while len(_INDEXES) > MAX_CACHED_INDEXES:
+                _INDEXES.popitem(last=False)
+        else:
+            _INDEXES.move_to_end(self._key)
+        return index
+
+    def lookup(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        :param x: np.ndarray of x coordinates
+        :param y: np.ndarray of y coordinates
+        :return: np.ndarray of polygon ids, None for points outside all polygons
+        """
+        return self.index().lookup(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+
+    def udf(self, returnType: Optional[DataType] = None):
+        """
+        Scalar pandas_udf taking x and y columns and returning polygon id column.
+        :param returnType: DataType or str, spark type of polygon id, type of id column by default
+        :return: pandas_udf
+        """
+        import pandas as pd
+        from pyspark.sql.functions import pandas_udf
+
+        def lookup(x: pd.Series, y: pd.Series) -> pd.Series:
+            return pd.Series(self.lookup(x.values, y.values))
+
+        return pandas_udf(lookup, returnType if returnType is not None else self._id_type)
+
+    def unpersist(self):
+        _INDEXES.pop(self._key, None)
+        self._broadcast.unpersist()
+
+    def destroy(self):
+        _INDEXES.pop(self._key, None)
+        self._broadcast.destroy()
@@ -0,0 +1,59 @@
+from pyspark.sql import DataFrame
+from pyspark.sql.functions import expr
+
+from geo_pyspark.core.geom_types import Envelope
+from geo_pyspark.core.utils import require
+from geo_pyspark.register.java_libs import GeoSparkLib
+
+MAX_LEVEL = 31
+WORLD = Envelope(-180.0, 180.0, -90.0, 90.0)
+
+_LEFT = "__quadkey_left"
+_RIGHT = "__quadkey_right"
+_LEFT_CELL = "__quadkey_left_cell"
+_RIGHT_CELL = "__quadkey_right_cell"
+
+
+class QuadKeyJoin:
+    """
+    DataFrame spatial join through equi join on quadkey grid cells. Geometries are assigned cells of fixed level
+    grid covered by their envelopes (single cell for points), pairs sharing a cell are refined with exact predicate
+    and kept only in the cell holding lower left corner of their envelope intersection, so each pair is returned once.
+    Predicate has to imply envelope intersection (ST_Contains, ST_Intersects, ST_Within, ...).
+
+    >> QuadKeyJoin.join(polygon_df, "polygonshape", point_df, "pointshape", "ST_Contains", level=10)
+    """
+
+    @classmethod
+    @require([GeoSparkLib.QuadKeyJoin])
+    def join(cls, leftDf: DataFrame, leftGeometryColumn: str, rightDf: DataFrame, rightGeometryColumn: str,
+             predicate: str = "ST_Intersects", level: int = 12, extent: Envelope = WORLD) -> DataFrame:
+        """
+        :param leftDf: DataFrame, first argument of predicate
+        :param leftGeometryColumn: str, name of geometry column of leftDf
+        :param rightDf: DataFrame, second argument of predicate
+        :param rightGeometryColumn: str, name of geometry column of rightDf
+        :param predicate: str, name of GeoSpark SQL predicate function called as predicate(left, right)
+        :param level: int, grid has 2^level x 2^level cells over extent, geometries outside extent fall
+            into border cells
+        :param extent: Envelope, area covered by grid
+        :return: DataFrame with columns of both DataFrames
+        """
+        if not 0 <= level <= MAX_LEVEL:
+            raise ValueError(f"level should be between 0 and {MAX_LEVEL}")
+
+        grid = f"{level}, {float(extent.minx)}, {float(extent.maxx)}, {float(extent.miny)}, {float(extent.maxy)}"
+        left_geometry = f"{_LEFT}.`{leftGeometryColumn}`"
+        right_geometry = f"{_RIGHT}.`{rightGeometryColumn}`"
+
+        left_cells = leftDf.withColumn(
+            _LEFT_CELL, expr(f"explode(ST_QuadKeyCells(`{leftGeometryColumn}`, {grid}))")
+        ).alias(_LEFT)
+        right_cells = rightDf.withColumn(
+            _RIGHT_CELL, expr(f"explode(ST_QuadKeyCells(`{rightGeometryColumn}`, {grid}))")
+        ).alias(_RIGHT)
+
+        return left_cells.join(right_cells, expr(f"{_LEFT}.{_LEFT_CELL} = {_RIGHT}.{_RIGHT_CELL}")).\
+            where(expr(f"{_LEFT}.{_LEFT_CELL} = ST_QuadKeyReferenceCell({left_geometry}, {right_geometry}, {grid})")).\
+            where(expr(f"{predicate}({left_geometry}, {right_geometry})")).\
+            drop(_LEFT_CELL, _RIGHT_CELL)
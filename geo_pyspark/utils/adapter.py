@@ -5,6 +5,9 @@ from pyspark.sql import DataFrame, SparkSession
 
 from geo_pyspark.core.SpatialRDD.spatial_rdd import SpatialRDD, JvmSpatialRDD
 from geo_pyspark.core.enums.spatial import SpatialType
+from geo_pyspark.core.spatialOperator.spatial_pair_rdd import SpatialPairRDD
+from geo_pyspark.core.utils import ImportedJvmLib
+from geo_pyspark.register.java_libs import GeoSparkLib
 from geo_pyspark.utils.meta import MultipleMeta
 
 
@@ -114,11 +117,18 @@ class Adapter(metaclass=MultipleMeta):
     @classmethod
     def toDf(cls, spatialPairRDD: RDD, sparkSession: SparkSession):
         """
+        Pair RDDs returned by JoinQuery flat joins are converted on JVM side when PairRDDAdapter is available in
+        installed jar, other RDDs of pairs are mapped in python.
 
         :param spatialPairRDD:
         :param sparkSession:
         :return:
         """
+        if isinstance(spatialPairRDD, SpatialPairRDD) and ImportedJvmLib.has_library(GeoSparkLib.PairRDDAdapter):
+            jvm = spatialPairRDD.ctx._jvm
+            jdf = jvm.PairRDDAdapter.toDf(spatialPairRDD.jvm_pair_rdd, [], [], sparkSession._jsparkSession)
+            return DataFrame(jdf, sparkSession._wrapped)
+
         spatialPairRDD_mapped = spatialPairRDD.map(
             lambda x: [x[0].geom, *x[0].getUserData().split("\t"), x[1].geom, *x[1].getUserData().split("\t")]
         )
@@ -18,6 +18,11 @@ size_dict = {
     "?": BOOLEAN_SIZE
 }
 
+DOUBLE = struct.Struct("d")
+INT = struct.Struct("i")
+BYTE = struct.Struct("b")
+BOOLEAN = struct.Struct("?")
+
 
 @attr.s
 class BinaryParser:
@@ -25,26 +30,31 @@ class BinaryParser:
     current_index = attr.ib(default=0)
 
     def __attrs_post_init__(self):
-        no_negatives = self.remove_negatives(self.bytes)
-        self.bytes = self._convert_to_binary_array(no_negatives)
+        if isinstance(self.bytes, list):
+            self.bytes = self.remove_negatives(self.bytes)
 
     def read_double(self):
-        data = self.unpack("d", self.bytes)
+        data = DOUBLE.unpack_from(self.bytes, self.current_index)[0]
         self.current_index = self.current_index + DOUBLE_SIZE
         return data
 
+    def read_doubles(self, number_of_doubles: int):
+        data = struct.unpack_from(f"{number_of_doubles}d", self.bytes, self.current_index)
+        self.current_index = self.current_index + number_of_doubles * DOUBLE_SIZE
+        return data
+
     def read_double_reverse(self):
         data = self.unpack_reverse("d", self.bytes)
         self.current_index = self.current_index + DOUBLE_SIZE
         return data
 
     def read_int(self):
-        data = self.unpack("i", self.bytes)
+        data = INT.unpack_from(self.bytes, self.current_index)[0]
         self.current_index = self.current_index + INT_SIZE
         return data
 
     def read_byte(self):
-        data = self.unpack("b", self.bytes)
+        data = BYTE.unpack_from(self.bytes, self.current_index)[0]
         self.current_index = self.current_index + BYTE_SIZE
         return data
 
@@ -54,7 +64,7 @@ class BinaryParser:
         return data
 
     def read_boolean(self):
-        data = self.unpack("?", self.bytes)
+        data = BOOLEAN.unpack_from(self.bytes, self.current_index)[0]
         self.current_index = self.current_index + BOOLEAN_SIZE
         return data
 
@@ -81,9 +91,7 @@ class BinaryParser:
         return decoded_string
 
     def unpack(self, tp: str, bytes: bytearray):
-        max_index = self.current_index + size_dict[tp]
-        bytes = self._convert_to_binary_array(bytes[self.current_index: max_index])
-        return struct.unpack(tp, bytes)[0]
+        return struct.unpack_from(tp, bytes, self.current_index)[0]
 
     def unpack_reverse(self, tp: str, bytes: bytearray):
         max_index = self.current_index + size_dict[tp]
@@ -91,8 +99,15 @@ class BinaryParser:
         return struct.unpack(tp, bytes)[0]
 
     @classmethod
-    def remove_negatives(cls, bytes):
-        return [cls.remove_negative(bt) for bt in bytes]
+    def remove_negatives(cls, bytes) -> bytearray:
+        if not bytes:
+            return bytearray()
+        lowest, highest = min(bytes), max(bytes)
+        if lowest < -128 or highest > 255:
+            raise ValueError(f"Byte values have to be in range [-128, 255], got values from {lowest} to {highest}")
+        if highest <= 127:
+            return bytearray(struct.pack(f"{len(bytes)}b", *bytes))
+        return bytearray([cls.remove_negative(bt) for bt in bytes])
 
     @classmethod
     def remove_negative(cls, byte):
@@ -109,7 +124,7 @@ class BinaryParser:
 class BinaryBuffer:
 
     def __init__(self):
-        self.array = []
+        self.array = bytearray()
 
     def put_double(self, value):
         bytes = self.__pack("d", value)
@@ -130,10 +145,10 @@ class BinaryBuffer:
         return struct.pack(type, value)
 
     def __extend_buffer(self, bytes):
-        self.array.extend(list(bytes))
+        self.array.extend(bytes)
 
     def __translate_values(self, values):
-        return [el if el < 128 else el - 256 for el in values]
+        return list(struct.unpack(f"{len(values)}b", values))
 
     def add_empty_bytes(self, tp: str, number_of_empty):
         if tp == "double":
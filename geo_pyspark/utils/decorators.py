@@ -1,3 +1,4 @@
+from functools import wraps
 from typing import List, Iterable, Callable, TypeVar
 
 from geo_pyspark.register.java_libs import GeoSparkLib
@@ -23,6 +24,7 @@ def get_first_meet_criteria_element_from_iterable(iterable: Iterable[T], criteri
 
 def require(library_names: List[GeoSparkLib]):
     def wrapper(func):
+        @wraps(func)
         def run_function(*args, **kwargs):
             from geo_pyspark.core.utils import ImportedJvmLib
             has_all_libs = [lib for lib in library_names]
@@ -1,3 +1,4 @@
+import struct
 from typing import Union, Iterable, Tuple, List
 
 import attr
@@ -10,19 +11,19 @@ from shapely.geometry import MultiPoint
 from shapely.geometry.base import BaseGeometry
 
 from geo_pyspark.core.geom_types import Circle
-from geo_pyspark.sql.enums import ShapeEnum
+from geo_pyspark.sql.enums import ShapeEnum, GeomEnum
 from geo_pyspark.sql.exceptions import InvalidGeometryException
-from geo_pyspark.sql.geometry import GeomEnum
 from geo_pyspark.utils.abstract_parser import GeometryParser
 from geo_pyspark.utils.binary_parser import BinaryParser, BinaryBuffer
 from geo_pyspark.utils.types import numeric
 
 
+POINT_RECORD = struct.Struct("=bbddi")
+
+
 def read_coordinates(parser: BinaryParser, read_scale: int):
-    coordinates = []
-    for i in range(read_scale):
-        coordinates.append((parser.read_double(), parser.read_double()))
-    return coordinates
+    values = parser.read_doubles(2 * read_scale)
+    return list(zip(values[::2], values[1::2]))
 
 
 def put_coordinates(coordinates: Iterable[Iterable[numeric]], binary_buffer: BinaryBuffer):
@@ -84,18 +85,15 @@ class PointParser(GeometryParser):
     @classmethod
     def serialize(cls, obj: Point, binary_buffer: BinaryBuffer):
         if isinstance(obj, Point):
-            add_shape_geometry_metadata(GeomEnum.point.value, binary_buffer)
-            binary_buffer.put_double(obj.x)
-            binary_buffer.put_double(obj.y)
-            binary_buffer.put_int(-2130640127)
+            x, y = obj.coords[0][:2]
+            binary_buffer.put(POINT_RECORD.pack(ShapeEnum.shape.value, GeomEnum.point.value, x, y, -2130640127))
         else:
             raise TypeError(f"Need a {cls.name} instance")
         return binary_buffer.byte_array
 
     @classmethod
     def deserialize(cls, parser: BinaryParser) -> Point:
-        x = parser.read_double()
-        y = parser.read_double()
+        x, y = parser.read_doubles(2)
         has_user_data = parser.read_boolean()
         if has_user_data:
             for _ in range(3):
@@ -374,8 +372,7 @@ class CircleParser(GeometryParser):
     def deserialize(cls, bin_parser: BinaryParser):
         radius = bin_parser.read_double_reverse()
         primitive_geom_type = bin_parser.read_byte()
-        parser = GeomEnum.get_name(primitive_geom_type)
-        geom = PARSERS[parser].deserialize(bin_parser)
+        geom = DECODERS[primitive_geom_type].deserialize(bin_parser)
         return Circle(geom, radius)
 
 
@@ -389,3 +386,14 @@ PARSERS = dict(
     multipoint=MultiPointParser,
     multipolygon=MultiPolygonParser
 )
+
+DECODERS = {geom_type.value: PARSERS[geom_type.name] for geom_type in GeomEnum}
+
+ENCODERS = {
+    Point: PointParser,
+    LineString: LineStringParser,
+    MultiLineString: MultiLineStringParser,
+    Polygon: PolygonParser,
+    MultiPoint: MultiPointParser,
+    MultiPolygon: MultiPolygonParser
+}
@@ -1,12 +1,16 @@
 from pyspark import PickleSerializer
 
 from geo_pyspark.utils.binary_parser import BinaryParser
-from geo_pyspark.utils.spatial_rdd_parser import SpatialRDDParserData, SpatialPairRDDParserData
+from geo_pyspark.utils.spatial_rdd_parser import SpatialRDDParserData, SpatialPairRDDParserData, PointArrayParserData, \
+    UserDataParserData
 
 PARSERS = {
     0: SpatialRDDParserData(),
     1: SpatialRDDParserData(),
     2: SpatialPairRDDParserData(),
+    3: PointArrayParserData(),
+    4: UserDataParserData(),
+    5: UserDataParserData(grouped=True),
 
 
 }
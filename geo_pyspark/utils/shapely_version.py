@@ -0,0 +1,4 @@
+import shapely
+
+
+SHAPELY_2 = int(shapely.__version__.split(".")[0]) >= 2
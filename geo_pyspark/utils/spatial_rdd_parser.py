@@ -1,6 +1,10 @@
+from typing import List
+
 import attr
+import numpy as np
 from shapely.geometry.base import BaseGeometry
 
+from geo_pyspark.core.data import PointArray, GeoData
 from geo_pyspark.utils.abstract_parser import AbstractSpatialRDDParser
 from geo_pyspark.utils.binary_parser import BinaryParser, BinaryBuffer
 
@@ -34,18 +38,70 @@ class SpatialRDDParserData(AbstractSpatialRDDParser):
     def deserialize(cls, bin_parser: BinaryParser):
         left_geom_data = cls._deserialize_geom(bin_parser)
 
-        geometry_numbers = bin_parser.read_int()
-
-        right_geoms = []
-
-        for right_geometry_number in range(geometry_numbers):
-            right_geom_data = cls._deserialize_geom(bin_parser)
-            right_geoms.append(right_geom_data)
+        right_geoms = cls.read_geometries(bin_parser)
 
         deserialized_data = [left_geom_data, right_geoms] if right_geoms else left_geom_data
 
         return deserialized_data
 
+    @classmethod
+    def read_geometries(cls, bin_parser: BinaryParser) -> List[GeoData]:
+        """
+        Reads geometries prefixed with their number. Whole record is decoded at once, its size is bounded
+        by maxChunkSize passed to join query.
+        :param bin_parser: BinaryParser
+        :return: List[GeoData]
+        """
+        geometry_numbers = bin_parser.read_int()
+
+        return [cls._deserialize_geom(bin_parser) for _ in range(geometry_numbers)]
+
     @classmethod
     def serialize(cls, obj: BaseGeometry, binary_buffer: BinaryBuffer):
         raise NotImplementedError("Currently this operation is not supported")
+
+
+@attr.s
+class PointArrayParserData(AbstractSpatialRDDParser):
+    name = "PointArrayParserData"
+
+    @classmethod
+    def deserialize(cls, bin_parser: BinaryParser) -> PointArray:
+        number_of_points = bin_parser.read_int()
+        coordinates = np.frombuffer(
+            bin_parser.bytes, dtype="<f8", count=2 * number_of_points, offset=bin_parser.current_index
+        ).reshape(number_of_points, 2)
+        bin_parser.current_index += 2 * number_of_points * 8
+
+        has_user_data = bin_parser.read_int()
+        if not has_user_data:
+            return PointArray(coordinates)
+
+        lengths = np.frombuffer(bin_parser.bytes, dtype="<i4", count=number_of_points, offset=bin_parser.current_index)
+        bin_parser.current_index += number_of_points * 4
+        user_data = [bin_parser.read_string(length) for length in lengths.tolist()]
+
+        return PointArray(coordinates, user_data)
+
+    @classmethod
+    def serialize(cls, obj: PointArray, binary_buffer: BinaryBuffer):
+        raise NotImplementedError("Currently this operation is not supported")
+
+
+@attr.s
+class UserDataParserData(AbstractSpatialRDDParser):
+    name = "UserDataParserData"
+    grouped = attr.ib(default=False)
+
+    def deserialize(self, bin_parser: BinaryParser):
+        left_user_data = bin_parser.read_string(bin_parser.read_int())
+        number_of_rights = bin_parser.read_int()
+        right_user_data = [bin_parser.read_string(bin_parser.read_int()) for _ in range(number_of_rights)]
+
+        if self.grouped:
+            return [left_user_data, right_user_data]
+        return [left_user_data, right_user_data[0]]
+
+    @classmethod
+    def serialize(cls, obj: List[str], binary_buffer: BinaryBuffer):
+        raise NotImplementedError("Currently this operation is not supported")
@@ -0,0 +1,84 @@
+package org.imbruced.geo_pyspark
+
+import com.vividsolutions.jts.geom.Geometry
+import com.vividsolutions.jts.geom.prep.{PreparedGeometry, PreparedGeometryFactory}
+import com.vividsolutions.jts.index.strtree.STRtree
+import org.apache.spark.api.java.JavaPairRDD
+import org.apache.spark.rdd.RDD
+import org.datasyslab.geospark.geometryObjects.Circle
+import org.datasyslab.geospark.spatialRDD.SpatialRDD
+
+import scala.collection.JavaConverters._
+
+
+object BroadcastSpatialJoin {
+
+  /**
+    * Joins large spatialRDD with small queryRDD without shuffling, STRtree built over query geometries is
+    * broadcast and probed partition locally with prepared geometries. Pairs are (query geometry, spatial geometry)
+    * as in JoinQuery.SpatialJoinQueryFlat. Query geometries of broadcast index are shared by all tasks of an executor,
+    * so every pair gets its own clone of query geometry (clone keeps user data). Circle query geometries are
+    * matched with their own predicates and replaced with their center geometry, as in JoinQuery.DistanceJoinQueryFlat.
+    */
+  def join(spatialRDD: SpatialRDD[Geometry], queryRDD: SpatialRDD[Geometry],
+           considerBoundaryIntersection: Boolean): JavaPairRDD[Geometry, Geometry] = {
+    JavaPairRDD.fromRDD(pairs(spatialRDD, queryRDD, considerBoundaryIntersection))
+  }
+
+  /**
+    * Same as join, but matches are grouped by query geometry as in JoinQuery.SpatialJoinQuery.
+    */
+  def joinGrouped(spatialRDD: SpatialRDD[Geometry], queryRDD: SpatialRDD[Geometry],
+                  considerBoundaryIntersection: Boolean): JavaPairRDD[Geometry, java.util.HashSet[Geometry]] = {
+    JavaPairRDD.fromRDD(pairs(spatialRDD, queryRDD, considerBoundaryIntersection).aggregateByKey(
+      new java.util.HashSet[Geometry]())(
+      (geometries, geometry) => {
+        geometries.add(geometry)
+        geometries
+      },
+      (left, right) => {
+        left.addAll(right)
+        left
+      }
+    ))
+  }
+
+  private def pairs(spatialRDD: SpatialRDD[Geometry], queryRDD: SpatialRDD[Geometry],
+                    considerBoundaryIntersection: Boolean): RDD[(Geometry, Geometry)] = {
+    val index = new STRtree()
+    queryRDD.rawSpatialRDD.collect().asScala.foreach(geometry => index.insert(geometry.getEnvelopeInternal, geometry))
+    index.build()
+
+    val broadcastIndex = spatialRDD.rawSpatialRDD.context.broadcast(index)
+
+    spatialRDD.rawSpatialRDD.rdd.mapPartitions(geometries => {
+      val queryIndex = broadcastIndex.value
+      val preparedGeometries = new java.util.IdentityHashMap[Geometry, PreparedGeometry]()
+      val factory = new PreparedGeometryFactory()
+
+      def prepared(geometry: Geometry): PreparedGeometry = {
+        var preparedGeometry = preparedGeometries.get(geometry)
+        if (preparedGeometry == null) {
+          preparedGeometry = factory.create(geometry)
+          preparedGeometries.put(geometry, preparedGeometry)
+        }
+        preparedGeometry
+      }
+
+      def matches(query: Geometry, geometry: Geometry): Boolean = query match {
+        case circle: Circle => if (considerBoundaryIntersection) circle.intersects(geometry) else circle.covers(geometry)
+        case _ => if (considerBoundaryIntersection) prepared(query).intersects(geometry) else prepared(query).covers(geometry)
+      }
+
+      def resultGeometry(query: Geometry): Geometry = query match {
+        case circle: Circle => circle.getCenterGeometry.clone().asInstanceOf[Geometry]
+        case _ => query.clone().asInstanceOf[Geometry]
+      }
+
+      geometries.flatMap(geometry => {
+        val candidates = queryIndex.query(geometry.getEnvelopeInternal).asScala.map(_.asInstanceOf[Geometry])
+        candidates.filter(query => matches(query, geometry)).map(query => (resultGeometry(query), geometry))
+      })
+    })
+  }
+}
@@ -0,0 +1,29 @@
+package org.imbruced.geo_pyspark
+
+import com.vividsolutions.jts.geom.Geometry
+import com.vividsolutions.jts.io.{WKBReader, WKBWriter}
+import org.apache.spark.sql.SparkSession
+
+
+object GeoParquet {
+
+  /**
+    * Registers functions used to store geometries in Parquet: ST_AsBinary(geometry) returning WKB,
+    * ST_GeomFromBinary(wkb) and ST_XMin, ST_XMax, ST_YMin, ST_YMax(geometry) returning envelope bounds.
+    * Null geometries give null results.
+    */
+  def registerFunctions(sparkSession: SparkSession): Unit = {
+    sparkSession.udf.register("ST_AsBinary", (geometry: Geometry) =>
+      if (geometry == null) null else new WKBWriter(2).write(geometry))
+    sparkSession.udf.register("ST_GeomFromBinary", (wkb: Array[Byte]) =>
+      if (wkb == null) null else new WKBReader().read(wkb))
+    sparkSession.udf.register("ST_XMin", (geometry: Geometry) => bound(geometry, _.getEnvelopeInternal.getMinX))
+    sparkSession.udf.register("ST_XMax", (geometry: Geometry) => bound(geometry, _.getEnvelopeInternal.getMaxX))
+    sparkSession.udf.register("ST_YMin", (geometry: Geometry) => bound(geometry, _.getEnvelopeInternal.getMinY))
+    sparkSession.udf.register("ST_YMax", (geometry: Geometry) => bound(geometry, _.getEnvelopeInternal.getMaxY))
+  }
+
+  private def bound(geometry: Geometry, value: Geometry => Double): java.lang.Double = {
+    if (geometry == null || geometry.isEmpty) null else value(geometry)
+  }
+}
@@ -0,0 +1,93 @@
+package org.imbruced.geo_pyspark
+
+import com.vividsolutions.jts.geom.{Envelope, Geometry, GeometryFactory}
+import com.vividsolutions.jts.index.strtree.STRtree
+import org.apache.spark.api.java.JavaPairRDD
+import org.datasyslab.geospark.spatialRDD.SpatialRDD
+
+import scala.collection.JavaConverters._
+
+
+object GeodesicDistanceJoin {
+
+  val EarthRadius = 6371008.8
+
+  /**
+    * Distance join for geographic coordinates (x longitude, y latitude in degrees) with distance in meters.
+    * Query geometries are replicated to partitions of spatially partitioned spatialRDD overlapping their envelope
+    * expanded by distance for its latitude band, candidates are filtered with haversine distance of centroids
+    * (as CircleRDD does for planar distance). Pairs are (query geometry, spatial geometry).
+    */
+  def joinFlat(spatialRDD: SpatialRDD[Geometry], queryRDD: SpatialRDD[Geometry],
+               distance: Double): JavaPairRDD[Geometry, Geometry] = {
+    val partitioner = spatialRDD.getPartitioner
+    if (partitioner == null) {
+      throw new IllegalArgumentException("spatialRDD has to be spatially partitioned")
+    }
+    val grids = partitioner.getGrids.asScala.toArray
+
+    val queries = queryRDD.rawSpatialRDD.rdd.flatMap(query => {
+      val envelope = expandEnvelope(query.getEnvelopeInternal, distance)
+      partitioner.placeObject(new GeometryFactory().toGeometry(envelope)).asScala
+        .map(placed => (placed._1.intValue(), (query, envelope)))
+    }).partitionBy(partitioner).values
+
+    val pairs = queries.zipPartitions(spatialRDD.spatialPartitionedRDD.rdd)((queryGeometries, spatialGeometries) => {
+      val index = new STRtree()
+      spatialGeometries.foreach(geometry => index.insert(geometry.getEnvelopeInternal, geometry))
+
+      queryGeometries.flatMap { case (query, envelope) =>
+        val center = query.getCentroid
+        index.query(envelope).asScala.iterator
+          .map(_.asInstanceOf[Geometry])
+          .filter(geometry => {
+            val centroid = geometry.getCentroid
+            haversine(center.getX, center.getY, centroid.getX, centroid.getY) <= distance
+          })
+          .map(geometry => (query, geometry, envelope))
+      }
+    })
+
+    JavaPairRDD.fromRDD(pairs.mapPartitionsWithIndex((partitionId, candidates) =>
+      candidates
+        .filter(candidate =>
+          RangeQueryPruning.isReferencePartition(grids, partitionId, candidate._2.getEnvelopeInternal, candidate._3))
+        .map(candidate => (candidate._1, candidate._2))
+    ))
+  }
+
+  /**
+    * Expands envelope by distance in meters. Latitude is expanded by angular distance, longitude by the widest
+    * expansion within envelope latitude band. Envelopes reaching a pole or antimeridian cover all longitudes.
+    */
+  def expandEnvelope(envelope: Envelope, distance: Double): Envelope = {
+    val angularDistance = distance / EarthRadius
+    val latitudeDelta = math.toDegrees(angularDistance)
+    val minY = envelope.getMinY - latitudeDelta
+    val maxY = envelope.getMaxY + latitudeDelta
+
+    if (minY <= -90.0 || maxY >= 90.0) {
+      return new Envelope(-180.0, 180.0, math.max(minY, -90.0), math.min(maxY, 90.0))
+    }
+
+    val widestLatitude = math.toRadians(math.max(math.abs(envelope.getMinY), math.abs(envelope.getMaxY)))
+    val ratio = math.sin(angularDistance) / math.cos(widestLatitude)
+    if (ratio >= 1.0) {
+      return new Envelope(-180.0, 180.0, minY, maxY)
+    }
+
+    val longitudeDelta = math.toDegrees(math.asin(ratio))
+    val minX = envelope.getMinX - longitudeDelta
+    val maxX = envelope.getMaxX + longitudeDelta
+    if (minX < -180.0 || maxX > 180.0) new Envelope(-180.0, 180.0, minY, maxY)
+    else new Envelope(minX, maxX, minY, maxY)
+  }
+
+  def haversine(longitude1: Double, latitude1: Double, longitude2: Double, latitude2: Double): Double = {
+    val latitudeDelta = math.toRadians(latitude2 - latitude1)
+    val longitudeDelta = math.toRadians(longitude2 - longitude1)
+    val a = math.pow(math.sin(latitudeDelta / 2), 2) +
+      math.cos(math.toRadians(latitude1)) * math.cos(math.toRadians(latitude2)) * math.pow(math.sin(longitudeDelta / 2), 2)
+    2 * EarthRadius * math.asin(math.min(1.0, math.sqrt(a)))
+  }
+}
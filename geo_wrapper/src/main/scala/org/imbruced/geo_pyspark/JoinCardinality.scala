@@ -0,0 +1,70 @@
+package org.imbruced.geo_pyspark
+
+import java.nio.{ByteBuffer, ByteOrder}
+
+import com.vividsolutions.jts.geom.Geometry
+import com.vividsolutions.jts.index.strtree.STRtree
+import org.apache.spark.TaskContext
+import org.datasyslab.geospark.spatialRDD.SpatialRDD
+
+import scala.collection.JavaConverters._
+import scala.collection.mutable
+import scala.util.Random
+
+
+object JoinCardinality {
+
+  case class PartitionCardinality(partitionId: Int, queryCount: Long, sampledQueryCount: Long, sampledMatches: Long)
+
+  /**
+    * Estimates number of join pairs of co-partitioned RDDs. In each partition query geometries are sampled with
+    * sampleFraction and matched against all partition geometries through STRtree, pairs are counted only in
+    * partition owning their reference point so replicated geometries are not counted twice.
+    * Layout is number of partitions and per partition id, query count, sampled query count and sampled matches.
+    */
+  def estimate(spatialRDD: SpatialRDD[Geometry], queryRDD: SpatialRDD[Geometry], considerBoundaryIntersection: Boolean,
+               sampleFraction: Double, seed: Long): Array[Byte] = {
+    val partitioner = spatialRDD.getPartitioner
+    if (partitioner == null || !partitioner.equals(queryRDD.getPartitioner)) {
+      throw new IllegalArgumentException("spatialRDD and queryRDD have to be partitioned with the same partitioner")
+    }
+    val grids = partitioner.getGrids.asScala.toArray
+
+    val partitions = queryRDD.spatialPartitionedRDD.rdd.zipPartitions(spatialRDD.spatialPartitionedRDD.rdd)(
+      (queryGeometries, spatialGeometries) => {
+        val partitionId = TaskContext.getPartitionId()
+        val random = new Random(seed + partitionId)
+        var queryCount = 0L
+        val sampled = mutable.ArrayBuffer[Geometry]()
+        queryGeometries.foreach(query => {
+          queryCount += 1
+          if (random.nextDouble() < sampleFraction) sampled += query
+        })
+
+        var matches = 0L
+        if (sampled.nonEmpty) {
+          val index = new STRtree()
+          spatialGeometries.foreach(geometry => index.insert(geometry.getEnvelopeInternal, geometry))
+          sampled.foreach(query => index.query(query.getEnvelopeInternal).asScala.foreach(candidate => {
+            val geometry = candidate.asInstanceOf[Geometry]
+            val matched = if (considerBoundaryIntersection) query.intersects(geometry) else query.covers(geometry)
+            if (matched && RangeQueryPruning.isReferencePartition(
+              grids, partitionId, geometry.getEnvelopeInternal, query.getEnvelopeInternal)) {
+              matches += 1
+            }
+          }))
+        }
+        Iterator(PartitionCardinality(partitionId, queryCount, sampled.length, matches))
+      }).collect()
+
+    val buffer = ByteBuffer.allocate(4 + partitions.length * (4 + 8 + 8 + 8)).order(ByteOrder.LITTLE_ENDIAN)
+    buffer.putInt(partitions.length)
+    partitions.foreach(partition => {
+      buffer.putInt(partition.partitionId)
+      buffer.putLong(partition.queryCount)
+      buffer.putLong(partition.sampledQueryCount)
+      buffer.putLong(partition.sampledMatches)
+    })
+    buffer.array()
+  }
+}
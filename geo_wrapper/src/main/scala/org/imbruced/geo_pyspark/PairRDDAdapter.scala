@@ -0,0 +1,46 @@
+package org.imbruced.geo_pyspark
+
+import com.vividsolutions.jts.geom.Geometry
+import org.apache.spark.api.java.JavaPairRDD
+import org.apache.spark.sql.geosparksql.UDT.GeometryUDT
+import org.apache.spark.sql.types.{StringType, StructField, StructType}
+import org.apache.spark.sql.{DataFrame, Row, SparkSession}
+
+import scala.collection.JavaConverters._
+
+
+object PairRDDAdapter {
+
+  /**
+    * Converts join pairs to DataFrame with geometry columns and tab separated user data columns without sending
+    * rows through python. When field names are empty, columns are named _1, _2, ... as createDataFrame does and
+    * number of user data fields is taken from the first pair.
+    */
+  def toDf(spatialPairRDD: JavaPairRDD[Geometry, Geometry], leftFieldNames: java.util.List[String],
+           rightFieldNames: java.util.List[String], sparkSession: SparkSession): DataFrame = {
+    val (leftFields, rightFields) = if (leftFieldNames.isEmpty && rightFieldNames.isEmpty) {
+      spatialPairRDD.rdd.take(1).headOption match {
+        case Some((left, right)) => (userDataFields(left).length, userDataFields(right).length)
+        case None => (0, 0)
+      }
+    } else (leftFieldNames.size(), rightFieldNames.size())
+
+    val names = if (leftFieldNames.isEmpty && rightFieldNames.isEmpty) {
+      (1 to leftFields + rightFields + 2).map(index => s"_$index")
+    } else Seq("geom_1") ++ leftFieldNames.asScala ++ Seq("geom_2") ++ rightFieldNames.asScala
+
+    val types = Seq(new GeometryUDT()) ++ Seq.fill(leftFields)(StringType) ++
+      Seq(new GeometryUDT()) ++ Seq.fill(rightFields)(StringType)
+    val schema = StructType(names.zip(types).map { case (name, dataType) => StructField(name, dataType) })
+
+    val rows = spatialPairRDD.rdd.map { case (left, right) =>
+      Row.fromSeq(Seq(left) ++ userDataFields(left) ++ Seq(right) ++ userDataFields(right))
+    }
+    sparkSession.createDataFrame(rows, schema)
+  }
+
+  private def userDataFields(geometry: Geometry): Seq[String] = geometry.getUserData match {
+    case null => Seq("")
+    case userData => userData.toString.split("\t", -1).toSeq
+  }
+}
@@ -0,0 +1,112 @@
+package org.imbruced.geo_pyspark
+
+import java.nio.charset.{Charset, StandardCharsets}
+
+import com.vividsolutions.jts.geom.{Envelope, Geometry}
+import org.apache.hadoop.conf.Configuration
+import org.apache.hadoop.fs.Path
+import org.apache.spark.api.java.{JavaRDD, JavaSparkContext}
+import org.apache.spark.{SerializableWritable, TaskContext}
+import org.datasyslab.geospark.spatialRDD.SpatialRDD
+
+import scala.collection.JavaConverters._
+
+
+object ParallelShapefileReader {
+
+  val SourceFileField = "source_file"
+  private val MinRecordsPerTask = 10000
+
+  /**
+    * Reads many shapefiles into one SpatialRDD, each .shp file is read by separate task. Input paths can be
+    * .shp files, directories with shapefiles or glob patterns. Path of source .shp file is appended to user data
+    * as last attribute, field names are taken from .dbf file of the first shapefile.
+    */
+  def readToGeometryRDD(sc: JavaSparkContext, inputPaths: java.util.List[String]): SpatialRDD[Geometry] = {
+    val configuration = sc.hadoopConfiguration()
+    val shpPaths = shapefilePaths(configuration, inputPaths.asScala)
+    if (shpPaths.isEmpty) throw new IllegalArgumentException(s"No shapefiles found in ${inputPaths.asScala.mkString(", ")}")
+
+    val broadcastConfiguration = sc.sc.broadcast(new SerializableWritable(configuration))
+    val charsetName = charset(configuration).name()
+    val geometries = sc.sc.parallelize(shpPaths, shpPaths.length).mapPartitions(paths => paths.flatMap(path => {
+      val parser = open(broadcastConfiguration.value.value, new Path(path), Charset.forName(charsetName))
+      parser.read(parser.recordOffsets(0, Int.MaxValue), 0, null).map(geometry => {
+        geometry.setUserData(if (geometry.getUserData == null) path else s"${geometry.getUserData}\t$path")
+        geometry
+      })
+    }))
+
+    val firstParser = open(configuration, new Path(shpPaths.head), charset(configuration))
+    val fieldNames = try firstParser.fieldNames finally firstParser.close()
+
+    val spatialRDD = new SpatialRDD[Geometry]()
+    spatialRDD.setRawSpatialRDD(JavaRDD.fromRDD(geometries))
+    spatialRDD.fieldNames = (fieldNames :+ SourceFileField).toList.asJava
+    spatialRDD
+  }
+
+  /**
+    * Reads geometries which bounding boxes intersect queryWindow. Records of large shapefiles are split into
+    * ranges by .shx offsets and read by separate tasks, bounding box of each record is read from record header
+    * and only intersecting records are decoded and joined with .dbf attributes. Input path is .shp file or
+    * directory with shapefiles, output has the same user data and field names as GeoSpark ShapefileReader.
+    */
+  def readToGeometryRDD(sc: JavaSparkContext, inputPath: String, queryWindow: Envelope): SpatialRDD[Geometry] = {
+    val configuration = sc.hadoopConfiguration()
+    val shpPaths = shapefilePaths(configuration, Seq(inputPath))
+    if (shpPaths.isEmpty) throw new IllegalArgumentException(s"No shapefiles found in $inputPath")
+
+    val recordRanges = shpPaths.flatMap(shpPath => {
+      val path = new Path(shpPath)
+      val fileSystem = path.getFileSystem(configuration)
+      val numberOfRecords = ShapefileParser.recordCount(fileSystem, ShapefileParser.sibling(fileSystem, path, "shx"))
+      if (numberOfRecords < 0) Seq((shpPath, 0, Int.MaxValue))
+      else {
+        val rangeLength = math.max(MinRecordsPerTask, math.ceil(numberOfRecords.toDouble / sc.defaultParallelism).toInt)
+        (0 until numberOfRecords by rangeLength).map(from => (shpPath, from, math.min(from + rangeLength, numberOfRecords)))
+      }
+    })
+
+    val broadcastConfiguration = sc.sc.broadcast(new SerializableWritable(configuration))
+    val charsetName = charset(configuration).name()
+    val geometries = sc.sc.parallelize(recordRanges, math.max(recordRanges.length, 1)).mapPartitions(ranges =>
+      ranges.flatMap { case (path, from, until) =>
+        val parser = open(broadcastConfiguration.value.value, new Path(path), Charset.forName(charsetName))
+        parser.read(parser.recordOffsets(from, until), from, queryWindow)
+      }
+    )
+
+    val firstParser = open(configuration, new Path(shpPaths.head), charset(configuration))
+    val fieldNames = try firstParser.fieldNames finally firstParser.close()
+
+    val spatialRDD = new SpatialRDD[Geometry]()
+    spatialRDD.setRawSpatialRDD(JavaRDD.fromRDD(geometries))
+    spatialRDD.fieldNames = fieldNames.toList.asJava
+    spatialRDD
+  }
+
+  /**
+    * Sorted .shp files matching input paths, directories are expanded to .shp files they contain.
+    */
+  def shapefilePaths(configuration: Configuration, inputPaths: Seq[String]): Array[String] = {
+    inputPaths.flatMap(inputPath => {
+      val path = new Path(inputPath)
+      val fileSystem = path.getFileSystem(configuration)
+      Option(fileSystem.globStatus(path)).getOrElse(Array()).flatMap(status =>
+        if (status.isDirectory) fileSystem.listStatus(status.getPath).filter(_.isFile).map(_.getPath)
+        else Array(status.getPath)
+      )
+    }).map(_.toString).filter(_.toLowerCase.endsWith(".shp")).distinct.sorted.toArray
+  }
+
+  private[geo_pyspark] def open(configuration: Configuration, shpPath: Path, charset: Charset): ShapefileParser = {
+    val parser = new ShapefileParser(shpPath.getFileSystem(configuration), shpPath, charset)
+    Option(TaskContext.get()).foreach(_.addTaskCompletionListener((_: TaskContext) => parser.close()))
+    parser
+  }
+
+  private[geo_pyspark] def charset(configuration: Configuration): Charset = {
+    Option(configuration.get("geospark.global.charset")).map(Charset.forName).getOrElse(StandardCharsets.UTF_8)
+  }
+}
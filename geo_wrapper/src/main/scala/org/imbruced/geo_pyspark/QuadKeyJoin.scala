@@ -0,0 +1,55 @@
+package org.imbruced.geo_pyspark
+
+import com.vividsolutions.jts.geom.{Envelope, Geometry}
+import org.apache.spark.sql.SparkSession
+
+
+object QuadKeyJoin {
+
+  val MaxLevel = SpaceFillingCurve.MaxPrecision
+
+  /**
+    * Registers ST_QuadKeyCells(geometry, level, minX, maxX, minY, maxY), returning ids of all grid cells covered
+    * by geometry envelope, and ST_QuadKeyReferenceCell(geometryA, geometryB, level, minX, maxX, minY, maxY),
+    * returning id of the cell holding lower left corner of envelope intersection. Cell id is z-order (quadkey)
+    * of cell position, so cells of a point are single element arrays.
+    */
+  def registerFunctions(sparkSession: SparkSession): Unit = {
+    sparkSession.udf.register("ST_QuadKeyCells",
+      (geometry: Geometry, level: Int, minX: Double, maxX: Double, minY: Double, maxY: Double) =>
+        cells(geometry, level, new Envelope(minX, maxX, minY, maxY)))
+    sparkSession.udf.register("ST_QuadKeyReferenceCell",
+      (geometryA: Geometry, geometryB: Geometry, level: Int, minX: Double, maxX: Double, minY: Double, maxY: Double) =>
+        referenceCell(geometryA, geometryB, level, new Envelope(minX, maxX, minY, maxY)))
+  }
+
+  def cells(geometry: Geometry, level: Int, extent: Envelope): Array[Long] = {
+    validate(level)
+    if (geometry == null || geometry.isEmpty) return Array.empty[Long]
+    val envelope = geometry.getEnvelopeInternal
+    val minCellX = SpaceFillingCurve.cell(envelope.getMinX, extent.getMinX, extent.getMaxX, level)
+    val maxCellX = SpaceFillingCurve.cell(envelope.getMaxX, extent.getMinX, extent.getMaxX, level)
+    val minCellY = SpaceFillingCurve.cell(envelope.getMinY, extent.getMinY, extent.getMaxY, level)
+    val maxCellY = SpaceFillingCurve.cell(envelope.getMaxY, extent.getMinY, extent.getMaxY, level)
+    (for (x <- minCellX to maxCellX; y <- minCellY to maxCellY) yield SpaceFillingCurve.zOrder(x, y)).toArray
+  }
+
+  /**
+    * Cell shared by cells of both geometries in which pair is kept, so pairs matched in several cells are
+    * emitted once. Returns -1 when envelopes do not intersect.
+    */
+  def referenceCell(geometryA: Geometry, geometryB: Geometry, level: Int, extent: Envelope): Long = {
+    validate(level)
+    if (geometryA == null || geometryB == null) return -1L
+    val intersection = geometryA.getEnvelopeInternal.intersection(geometryB.getEnvelopeInternal)
+    if (intersection.isNull) return -1L
+    SpaceFillingCurve.zOrder(
+      SpaceFillingCurve.cell(intersection.getMinX, extent.getMinX, extent.getMaxX, level),
+      SpaceFillingCurve.cell(intersection.getMinY, extent.getMinY, extent.getMaxY, level)
+    )
+  }
+
+  private def validate(level: Int): Unit = {
+    if (level < 0 || level > MaxLevel) throw new IllegalArgumentException(s"Level should be between 0 and $MaxLevel")
+  }
+}
@@ -0,0 +1,70 @@
+package org.imbruced.geo_pyspark
+
+import java.nio.{ByteBuffer, ByteOrder}
+
+import com.vividsolutions.jts.geom.{Envelope, Geometry, GeometryFactory}
+import org.apache.spark.api.java.JavaRDD
+import org.apache.spark.rdd.PartitionPruningRDD
+import org.datasyslab.geospark.rangeJudgement.{RangeFilter, RangeFilterUsingIndex}
+import org.datasyslab.geospark.spatialRDD.SpatialRDD
+
+import scala.collection.JavaConverters._
+
+object RangeQueryPruning {
+
+  def SpatialRangeQuery(spatialRDD: SpatialRDD[Geometry], queryWindow: Envelope, considerBoundaryIntersection: Boolean,
+                        useIndex: Boolean, partitionIds: java.util.List[Integer]): JavaRDD[Geometry] = {
+    val selectedPartitions = partitionIds.asScala.map(_.intValue()).toSet
+    val grids = spatialRDD.getPartitioner.getGrids.asScala.toArray
+    val queryGeometry = new GeometryFactory().toGeometry(queryWindow)
+
+    val matched = if (useIndex) {
+      PartitionPruningRDD.create(spatialRDD.indexedRDD.rdd, selectedPartitions.contains)
+        .toJavaRDD()
+        .mapPartitions(new RangeFilterUsingIndex[Geometry, Geometry](queryGeometry, considerBoundaryIntersection, true))
+    }
+    else {
+      PartitionPruningRDD.create(spatialRDD.spatialPartitionedRDD.rdd, selectedPartitions.contains)
+        .toJavaRDD()
+        .filter(new RangeFilter[Geometry, Geometry](queryGeometry, considerBoundaryIntersection, true))
+    }
+
+    JavaRDD.fromRDD(matched.rdd.mapPartitionsWithIndex((partitionId, iter) =>
+      iter.filter(geometry => isReferencePartition(grids, partitionId, geometry.getEnvelopeInternal, queryWindow))
+    ))
+  }
+
+  /**
+    * Partitioner grids as little endian minX, maxX, minY, maxY doubles, used on python side to find partitions
+    * overlapping query window.
+    */
+  def serializeEnvelopes(envelopes: java.util.List[Envelope]): Array[Byte] = {
+    val envelopesBuffer = ByteBuffer.allocate(envelopes.size() * 4 * 8).order(ByteOrder.LITTLE_ENDIAN)
+    envelopes.asScala.foreach(envelope => {
+      envelopesBuffer.putDouble(envelope.getMinX)
+      envelopesBuffer.putDouble(envelope.getMaxX)
+      envelopesBuffer.putDouble(envelope.getMinY)
+      envelopesBuffer.putDouble(envelope.getMaxY)
+    })
+    envelopesBuffer.array()
+  }
+
+  /**
+    * Geometries spanning several grid cells are replicated to every partition they touch, only the partition
+    * which contains the lower left corner of the geometry and query window intersection keeps the result.
+    * Overflow partition keeps geometries which reference point is not covered by any grid.
+    */
+  def isReferencePartition(grids: Array[Envelope], partitionId: Int, geometryEnvelope: Envelope,
+                           queryWindow: Envelope): Boolean = {
+    val intersection = geometryEnvelope.intersection(queryWindow)
+    val reference = if (intersection.isNull) geometryEnvelope else intersection
+
+    if (partitionId >= grids.length) !grids.exists(extent => containsReference(extent, reference))
+    else containsReference(grids(partitionId), reference)
+  }
+
+  private def containsReference(extent: Envelope, reference: Envelope): Boolean = {
+    extent.getMinX <= reference.getMinX && reference.getMinX < extent.getMaxX &&
+      extent.getMinY <= reference.getMinY && reference.getMinY < extent.getMaxY
+  }
+}
@@ -0,0 +1,75 @@
+package org.imbruced.geo_pyspark
+
+import com.vividsolutions.jts.geom.Geometry
+import com.vividsolutions.jts.index.strtree.STRtree
+import org.apache.spark.api.java.JavaPairRDD
+import org.datasyslab.geospark.spatialRDD.SpatialRDD
+
+import scala.collection.JavaConverters._
+
+
+object ReferencePointJoin {
+
+  /**
+    * Joins spatially partitioned RDDs partition by partition and keeps pair only in the partition which contains
+    * lower left corner of query and spatial envelopes intersection, so geometries replicated to several partitions
+    * never produce duplicated pairs. Pairs are (query geometry, spatial geometry) as in JoinQuery.SpatialJoinQueryFlat.
+    */
+  def joinFlat(spatialRDD: SpatialRDD[Geometry], queryRDD: SpatialRDD[Geometry], useIndex: Boolean,
+               considerBoundaryIntersection: Boolean): JavaPairRDD[Geometry, Geometry] = {
+    val partitioner = spatialRDD.getPartitioner
+    if (partitioner == null || !partitioner.equals(queryRDD.getPartitioner)) {
+      throw new IllegalArgumentException("spatialRDD and queryRDD have to be partitioned with the same partitioner")
+    }
+    val grids = partitioner.getGrids.asScala.toArray
+
+    val candidates = queryRDD.spatialPartitionedRDD.rdd.zipPartitions(spatialRDD.spatialPartitionedRDD.rdd)(
+      (queryGeometries, spatialGeometries) => {
+        val matches = (query: Geometry, geometry: Geometry) =>
+          if (considerBoundaryIntersection) query.intersects(geometry) else query.covers(geometry)
+
+        if (useIndex) {
+          val index = new STRtree()
+          spatialGeometries.foreach(geometry => index.insert(geometry.getEnvelopeInternal, geometry))
+          queryGeometries.flatMap(query =>
+            index.query(query.getEnvelopeInternal).asScala.iterator
+              .map(_.asInstanceOf[Geometry])
+              .filter(geometry => matches(query, geometry))
+              .map(geometry => (query, geometry))
+          )
+        }
+        else {
+          val geometries = spatialGeometries.toArray
+          queryGeometries.flatMap(query =>
+            geometries.iterator.filter(geometry => matches(query, geometry)).map(geometry => (query, geometry))
+          )
+        }
+      })
+
+    JavaPairRDD.fromRDD(candidates.mapPartitionsWithIndex((partitionId, pairs) =>
+      pairs.filter(pair => RangeQueryPruning.isReferencePartition(
+        grids, partitionId, pair._2.getEnvelopeInternal, pair._1.getEnvelopeInternal))
+    ))
+  }
+
+  /**
+    * Same as joinFlat, grouped by query geometry. Pairs are unique, so matched geometries are collected into
+    * lists instead of hash sets.
+    */
+  def join(spatialRDD: SpatialRDD[Geometry], queryRDD: SpatialRDD[Geometry], useIndex: Boolean,
+           considerBoundaryIntersection: Boolean): JavaPairRDD[Geometry, java.util.List[Geometry]] = {
+    val grouped = joinFlat(spatialRDD, queryRDD, useIndex, considerBoundaryIntersection).rdd
+      .aggregateByKey(new java.util.ArrayList[Geometry]())(
+        (geometries, geometry) => {
+          geometries.add(geometry)
+          geometries
+        },
+        (left, right) => {
+          left.addAll(right)
+          left
+        })
+      .mapValues(geometries => geometries.asInstanceOf[java.util.List[Geometry]])
+
+    JavaPairRDD.fromRDD(grouped)
+  }
+}
@@ -0,0 +1,215 @@
+package org.imbruced.geo_pyspark
+
+import java.nio.charset.Charset
+import java.nio.{ByteBuffer, ByteOrder}
+
+import com.vividsolutions.jts.algorithm.CGAlgorithms
+import com.vividsolutions.jts.geom._
+import org.apache.hadoop.fs.{FSDataInputStream, FileSystem, Path}
+
+import scala.collection.mutable.ArrayBuffer
+
+
+/**
+  * Reads records of single shapefile with positioned reads, so any range of records can be read by one task.
+  * Record offsets are taken from .shx file, record bounding boxes are read before geometry is decoded and
+  * attributes are read from .dbf file only for records which are kept. Attributes are joined with tab, the same
+  * as in GeoSpark ShapefileReader.
+  */
+class ShapefileParser(fileSystem: FileSystem, shpPath: Path, charset: Charset) extends AutoCloseable {
+
+  import ShapefileParser._
+
+  private val factory = new GeometryFactory()
+  private val shp = fileSystem.open(shpPath)
+  private val shpLength = fileSystem.getFileStatus(shpPath).getLen
+  private val shxPath = sibling(fileSystem, shpPath, "shx")
+  private val dbfPath = sibling(fileSystem, shpPath, "dbf")
+  private val dbf: Option[FSDataInputStream] = if (fileSystem.exists(dbfPath)) Some(fileSystem.open(dbfPath)) else None
+  private val dbfHeader: Option[DbfHeader] = dbf.map(readDbfHeader)
+
+  def fieldNames: Array[String] = dbfHeader.map(_.fields.map(_.name)).getOrElse(Array.empty)
+
+  /**
+    * Offsets of records in .shp file in bytes, read from .shx file when it exists, otherwise found by jumping over
+    * record headers of .shp file.
+    */
+  def recordOffsets(from: Int, until: Int): Array[Long] = {
+    if (fileSystem.exists(shxPath)) {
+      val numberOfRecords = math.min(until, recordCount(fileSystem, shxPath)) - from
+      if (numberOfRecords <= 0) return Array.empty
+      val shx = fileSystem.open(shxPath)
+      val bytes = new Array[Byte](numberOfRecords * 8)
+      try shx.readFully(HeaderLength + from * 8L, bytes) finally shx.close()
+      val buffer = ByteBuffer.wrap(bytes).order(ByteOrder.BIG_ENDIAN)
+      Array.fill(numberOfRecords)({
+        val offset = buffer.getInt() * 2L
+        buffer.getInt()
+        offset
+      })
+    } else {
+      val offsets = ArrayBuffer[Long]()
+      val header = new Array[Byte](8)
+      var offset = HeaderLength.toLong
+      while (offset + 8 <= shpLength) {
+        offsets += offset
+        shp.readFully(offset, header)
+        offset += 8 + ByteBuffer.wrap(header).order(ByteOrder.BIG_ENDIAN).getInt(4) * 2L
+      }
+      offsets.slice(from, until).toArray
+    }
+  }
+
+  /**
+    * Reads records starting at given offsets, first offset belongs to record number firstRecord. Records which
+    * bounding boxes do not intersect queryWindow are skipped without decoding, null queryWindow keeps all records.
+    */
+  def read(offsets: Array[Long], firstRecord: Int, queryWindow: Envelope): Iterator[Geometry] = {
+    offsets.iterator.zipWithIndex.flatMap { case (offset, position) =>
+      val header = new Array[Byte](8 + BoundingBoxEnd)
+      val available = math.min(header.length.toLong, shpLength - offset).toInt
+      shp.readFully(offset, header, 0, available)
+      val headerBuffer = ByteBuffer.wrap(header).order(ByteOrder.BIG_ENDIAN)
+      val contentLength = headerBuffer.getInt(4) * 2
+      headerBuffer.order(ByteOrder.LITTLE_ENDIAN)
+      val shapeType = headerBuffer.getInt(8)
+
+      if (shapeType == NullShape || (queryWindow != null && !recordEnvelope(headerBuffer, shapeType).intersects(queryWindow))) None
+      else {
+        val content = new Array[Byte](contentLength)
+        shp.readFully(offset + 8, content)
+        val geometry = parseGeometry(ByteBuffer.wrap(content).order(ByteOrder.LITTLE_ENDIAN))
+        attributes(firstRecord + position).foreach(geometry.setUserData)
+        Some(geometry)
+      }
+    }
+  }
+
+  override def close(): Unit = {
+    shp.close()
+    dbf.foreach(_.close())
+  }
+
+  private def recordEnvelope(header: ByteBuffer, shapeType: Int): Envelope = {
+    if (isPoint(shapeType)) {
+      val x = header.getDouble(12)
+      val y = header.getDouble(20)
+      new Envelope(x, x, y, y)
+    } else new Envelope(header.getDouble(12), header.getDouble(28), header.getDouble(20), header.getDouble(36))
+  }
+
+  private def parseGeometry(content: ByteBuffer): Geometry = {
+    val shapeType = content.getInt()
+    if (isPoint(shapeType)) factory.createPoint(new Coordinate(content.getDouble(), content.getDouble()))
+    else {
+      content.position(content.position() + 32)
+      if (isMultiPoint(shapeType)) factory.createMultiPoint(readCoordinates(content, content.getInt()))
+      else {
+        val numberOfParts = content.getInt()
+        val numberOfPoints = content.getInt()
+        val starts = Array.fill(numberOfParts)(content.getInt()) :+ numberOfPoints
+        val coordinates = readCoordinates(content, numberOfPoints)
+        val parts = (0 until numberOfParts).map(part => coordinates.slice(starts(part), starts(part + 1)))
+        if (isPolyLine(shapeType)) {
+          if (parts.length == 1) factory.createLineString(parts.head)
+          else factory.createMultiLineString(parts.map(part => factory.createLineString(part)).toArray)
+        }
+        else if (isPolygon(shapeType)) polygon(parts.filter(_.length >= 4))
+        else throw new IllegalArgumentException(s"Unsupported shape type $shapeType in $shpPath")
+      }
+    }
+  }
+
+  private def readCoordinates(content: ByteBuffer, numberOfPoints: Int): Array[Coordinate] = {
+    Array.fill(numberOfPoints)(new Coordinate(content.getDouble(), content.getDouble()))
+  }
+
+  /**
+    * Clockwise rings are shells and counter clockwise rings are holes of the shell containing them.
+    */
+  private def polygon(rings: Seq[Array[Coordinate]]): Geometry = {
+    val (counterClockwise, clockwise) = rings.map(ring => factory.createLinearRing(ring))
+      .partition(ring => CGAlgorithms.isCCW(ring.getCoordinates))
+    val (shells, holes) = if (clockwise.isEmpty) (counterClockwise, Seq.empty[LinearRing]) else (clockwise, counterClockwise)
+
+    val shellPolygons = shells.map(shell => factory.createPolygon(shell, Array.empty[LinearRing]))
+    val shellHoles = shells.map(_ => ArrayBuffer[LinearRing]())
+    holes.foreach(hole => {
+      val point = factory.createPoint(hole.getCoordinateN(0))
+      val shell = shellPolygons.indexWhere(shellPolygon => shellPolygon.contains(point))
+      shellHoles(if (shell < 0) 0 else shell) += hole
+    })
+    val polygons = shells.zip(shellHoles).map { case (shell, ringHoles) => factory.createPolygon(shell, ringHoles.toArray) }
+    if (polygons.length == 1) polygons.head else factory.createMultiPolygon(polygons.toArray)
+  }
+
+  private def attributes(recordNumber: Int): Option[String] = {
+    for (input <- dbf; header <- dbfHeader if recordNumber < header.numberOfRecords) yield {
+      val record = new Array[Byte](header.recordLength)
+      input.readFully(header.headerLength.toLong + recordNumber.toLong * header.recordLength, record)
+      var position = 1
+      header.fields.map(field => {
+        val value = new String(record, position, field.length, charset).trim
+        position += field.length
+        value
+      }).mkString("\t")
+    }
+  }
+
+  private def readDbfHeader(input: FSDataInputStream): DbfHeader = {
+    val header = new Array[Byte](32)
+    input.readFully(0, header)
+    val buffer = ByteBuffer.wrap(header).order(ByteOrder.LITTLE_ENDIAN)
+    val numberOfRecords = buffer.getInt(4)
+    val headerLength = buffer.getShort(8) & 0xFFFF
+    val recordLength = buffer.getShort(10) & 0xFFFF
+
+    val descriptors = new Array[Byte](headerLength - 32)
+    input.readFully(32, descriptors)
+    val fields = descriptors.grouped(32).takeWhile(descriptor => descriptor.length == 32 && descriptor(0) != 0x0D)
+      .map(descriptor => DbfField(
+        new String(descriptor, 0, 11, charset).takeWhile(_ != '\u0000').trim,
+        descriptor(16) & 0xFF
+      )).toArray
+    DbfHeader(numberOfRecords, headerLength, recordLength, fields)
+  }
+}
+
+
+object ShapefileParser {
+
+  val HeaderLength = 100
+  private val BoundingBoxEnd = 4 + 32
+  private val NullShape = 0
+
+  case class DbfField(name: String, length: Int)
+
+  case class DbfHeader(numberOfRecords: Int, headerLength: Int, recordLength: Int, fields: Array[DbfField])
+
+  /**
+    * Path of .shx or .dbf file belonging to .shp file, upper case extension is used when .shp extension is upper case.
+    */
+  def sibling(fileSystem: FileSystem, shpPath: Path, extension: String): Path = {
+    val name = shpPath.getName
+    val base = name.substring(0, name.lastIndexOf('.'))
+    val lower = new Path(shpPath.getParent, s"$base.$extension")
+    if (name.endsWith(".SHP") && !fileSystem.exists(lower)) new Path(shpPath.getParent, s"$base.${extension.toUpperCase}")
+    else lower
+  }
+
+  /**
+    * Number of records described by .shx file, -1 when shapefile has no .shx file.
+    */
+  def recordCount(fileSystem: FileSystem, shxPath: Path): Int = {
+    if (!fileSystem.exists(shxPath)) -1
+    else ((fileSystem.getFileStatus(shxPath).getLen - HeaderLength) / 8).toInt
+  }
+
+  private def isPoint(shapeType: Int): Boolean = shapeType == 1 || shapeType == 11 || shapeType == 21
+
+  private def isPolyLine(shapeType: Int): Boolean = shapeType == 3 || shapeType == 13 || shapeType == 23
+
+  private def isPolygon(shapeType: Int): Boolean = shapeType == 5 || shapeType == 15 || shapeType == 25
+
+  private def isMultiPoint(shapeType: Int): Boolean = shapeType == 8 || shapeType == 18 || shapeType == 28
+}
@@ -0,0 +1,95 @@
+package org.imbruced.geo_pyspark
+
+import com.vividsolutions.jts.geom.{Envelope, Geometry}
+import org.apache.spark.api.java.JavaRDD
+import org.apache.spark.sql.SparkSession
+
+
+object SpaceFillingCurve {
+
+  val MaxPrecision = 31
+
+  /**
+    * Registers ST_HilbertKey and ST_ZOrderKey(geometry, precision, minX, maxX, minY, maxY) SQL functions, keys are
+    * computed for envelope center of geometry and are the same as geo_pyspark.core.space_filling_curve keys.
+    */
+  def registerFunctions(sparkSession: SparkSession): Unit = {
+    sparkSession.udf.register("ST_HilbertKey",
+      (geometry: Geometry, precision: Int, minX: Double, maxX: Double, minY: Double, maxY: Double) =>
+        key("hilbert", geometry, precision, new Envelope(minX, maxX, minY, maxY)))
+    sparkSession.udf.register("ST_ZOrderKey",
+      (geometry: Geometry, precision: Int, minX: Double, maxX: Double, minY: Double, maxY: Double) =>
+        key("zorder", geometry, precision, new Envelope(minX, maxX, minY, maxY)))
+  }
+
+  /**
+    * Sorts geometries of each partition by curve key, partitioning is preserved.
+    */
+  def sortWithinPartitions(rdd: JavaRDD[Geometry], curve: String, precision: Int, extent: Envelope): JavaRDD[Geometry] = {
+    validate(curve, precision)
+    JavaRDD.fromRDD(rdd.rdd.mapPartitions(geometries =>
+      geometries.toArray.sortBy(geometry => key(curve, geometry, precision, extent)).iterator,
+      preservesPartitioning = true
+    ))
+  }
+
+  def key(curve: String, geometry: Geometry, precision: Int, extent: Envelope): Long = {
+    if (geometry == null) return 0L
+    val envelope = geometry.getEnvelopeInternal
+    val x = cell((envelope.getMinX + envelope.getMaxX) / 2, extent.getMinX, extent.getMaxX, precision)
+    val y = cell((envelope.getMinY + envelope.getMaxY) / 2, extent.getMinY, extent.getMaxY, precision)
+    curve match {
+      case "hilbert" => hilbert(x, y, precision)
+      case "zorder" => zOrder(x, y)
+      case _ => throw new IllegalArgumentException(s"Unknown space filling curve $curve")
+    }
+  }
+
+  def cell(value: Double, min: Double, max: Double, precision: Int): Long = {
+    val cells = 1L << precision
+    val position = if (max > min) ((value - min) / (max - min) * cells).floor.toLong else 0L
+    math.min(math.max(position, 0L), cells - 1)
+  }
+
+  def hilbert(cellX: Long, cellY: Long, precision: Int): Long = {
+    val n = 1L << precision
+    var x = cellX
+    var y = cellY
+    var d = 0L
+    var s = n >> 1
+    while (s > 0) {
+      val rx = if ((x & s) > 0) 1L else 0L
+      val ry = if ((y & s) > 0) 1L else 0L
+      d += s * s * ((3 * rx) ^ ry)
+      if (ry == 0) {
+        if (rx == 1) {
+          x = n - 1 - x
+          y = n - 1 - y
+        }
+        val t = x
+        x = y
+        y = t
+      }
+      s >>= 1
+    }
+    d
+  }
+
+  def zOrder(cellX: Long, cellY: Long): Long = spread(cellX) | (spread(cellY) << 1)
+
+  private def spread(value: Long): Long = {
+    var v = value & 0xFFFFFFFFL
+    v = (v | (v << 16)) & 0x0000FFFF0000FFFFL
+    v = (v | (v << 8)) & 0x00FF00FF00FF00FFL
+    v = (v | (v << 4)) & 0x0F0F0F0F0F0F0F0FL
+    v = (v | (v << 2)) & 0x3333333333333333L
+    (v | (v << 1)) & 0x5555555555555555L
+  }
+
+  private def validate(curve: String, precision: Int): Unit = {
+    if (curve != "hilbert" && curve != "zorder") throw new IllegalArgumentException(s"Unknown space filling curve $curve")
+    if (precision < 1 || precision > MaxPrecision) {
+      throw new IllegalArgumentException(s"Precision should be between 1 and $MaxPrecision")
+    }
+  }
+}
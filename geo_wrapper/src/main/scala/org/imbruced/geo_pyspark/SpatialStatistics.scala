@@ -0,0 +1,101 @@
+package org.imbruced.geo_pyspark
+
+import java.nio.charset.StandardCharsets
+import java.nio.{ByteBuffer, ByteOrder}
+
+import com.vividsolutions.jts.geom.{Envelope, Geometry}
+import org.apache.spark.api.java.JavaRDD
+import org.datasyslab.geospark.spatialRDD.SpatialRDD
+import org.datasyslab.geosparksql.utils.GeometrySerializer
+
+
+object SpatialStatistics {
+
+  case class PartitionStatistics(partitionId: Int, count: Long, envelope: Envelope)
+
+  case class PartitionReport(partitionId: Int, count: Long, envelope: Envelope, numberOfVertices: Long,
+                             serializedSize: Long)
+
+  /**
+    * Computes boundary and count of SpatialRDD together with per partition envelopes and counts in one pass,
+    * boundaryEnvelope and approximateTotalCount are set in the same way as SpatialRDD.analyze does.
+    */
+  def analyze(spatialRDD: SpatialRDD[Geometry]): Array[Byte] = {
+    val statistics = partitionStatistics(spatialRDD.rawSpatialRDD)
+    val boundary = new Envelope()
+    statistics.foreach(partition => boundary.expandToInclude(partition.envelope))
+
+    spatialRDD.boundaryEnvelope = if (boundary.isNull) null else boundary
+    spatialRDD.approximateTotalCount = statistics.map(_.count).sum
+
+    serialize(statistics)
+  }
+
+  def partitionStatistics(rdd: JavaRDD[Geometry]): Array[PartitionStatistics] = {
+    rdd.rdd.mapPartitionsWithIndex((partitionId, geometries) => {
+      val envelope = new Envelope()
+      var count = 0L
+      geometries.foreach(geometry => {
+        envelope.expandToInclude(geometry.getEnvelopeInternal)
+        count += 1
+      })
+      Iterator(PartitionStatistics(partitionId, count, envelope))
+    }).collect()
+  }
+
+  /**
+    * Per partition count, envelope, number of vertices and size of geometries serialized to python,
+    * computed in one job.
+    */
+  def partitionReport(rdd: JavaRDD[Geometry]): Array[Byte] = {
+    val reports = rdd.rdd.mapPartitionsWithIndex((partitionId, geometries) => {
+      val envelope = new Envelope()
+      var count = 0L
+      var numberOfVertices = 0L
+      var serializedSize = 0L
+      geometries.foreach(geometry => {
+        envelope.expandToInclude(geometry.getEnvelopeInternal)
+        count += 1
+        numberOfVertices += geometry.getNumPoints
+        serializedSize += serializedGeometrySize(geometry)
+      })
+      Iterator(PartitionReport(partitionId, count, envelope, numberOfVertices, serializedSize))
+    }).collect()
+
+    val buffer = ByteBuffer.allocate(4 + reports.length * (4 + 8 + 4 * 8 + 8 + 8)).order(ByteOrder.LITTLE_ENDIAN)
+    buffer.putInt(reports.length)
+    reports.foreach(report => {
+      buffer.putInt(report.partitionId)
+      buffer.putLong(report.count)
+      buffer.putDouble(report.envelope.getMinX)
+      buffer.putDouble(report.envelope.getMaxX)
+      buffer.putDouble(report.envelope.getMinY)
+      buffer.putDouble(report.envelope.getMaxY)
+      buffer.putLong(report.numberOfVertices)
+      buffer.putLong(report.serializedSize)
+    })
+    buffer.array()
+  }
+
+  private def serializedGeometrySize(geometry: Geometry): Long = {
+    val userData = geometry.getUserData match {
+      case data: String => data.getBytes(StandardCharsets.UTF_8).length
+      case _ => 0
+    }
+    4 + GeometrySerializer.serialize(geometry).length + userData
+  }
+
+  def serialize(statistics: Array[PartitionStatistics]): Array[Byte] = {
+    val buffer = ByteBuffer.allocate(4 + statistics.length * (4 + 8 + 4 * 8)).order(ByteOrder.LITTLE_ENDIAN)
+    buffer.putInt(statistics.length)
+    statistics.foreach(partition => {
+      buffer.putInt(partition.partitionId)
+      buffer.putLong(partition.count)
+      buffer.putDouble(partition.envelope.getMinX)
+      buffer.putDouble(partition.envelope.getMaxX)
+      buffer.putDouble(partition.envelope.getMinY)
+      buffer.putDouble(partition.envelope.getMaxY)
+    })
+    buffer.array()
+  }
+}
@@ -0,0 +1,40 @@
+package org.imbruced.geo_pyspark.serializers
+
+import java.io.ByteArrayOutputStream
+import java.nio.{ByteBuffer, ByteOrder}
+
+import com.vividsolutions.jts.geom.Geometry
+import org.apache.spark.api.java.{JavaPairRDD, JavaRDD}
+
+import scala.collection.JavaConverters._
+
+
+object ChunkedJoinSerializer {
+
+  /**
+    * Same layout as serializeToPythonHashSet, but each group is split into records of at most maxChunkSize right
+    * geometries, so single record size does not depend on group size. Any collection of matched geometries is
+    * accepted, e.g. lists produced by ReferencePointJoin.
+    */
+  def serializeToPythonHashSet[C <: java.util.Collection[Geometry]](spatialRDD: JavaPairRDD[Geometry, C],
+                                                                    maxChunkSize: Int): JavaRDD[Array[Byte]] = {
+    spatialRDD.rdd.flatMap[Array[Byte]](pairRDD => {
+      val leftGeometry = GeoSerializerData.serializeGeomToPython(pairRDD._1)
+
+      pairRDD._2.asScala.iterator.grouped(maxChunkSize).map(rightGeometries => {
+        val record = new ByteArrayOutputStream()
+        val header = ByteBuffer.allocate(4).order(ByteOrder.LITTLE_ENDIAN)
+        val sizeBuffer = ByteBuffer.allocate(4).order(ByteOrder.LITTLE_ENDIAN)
+        header.putInt(1)
+        sizeBuffer.putInt(rightGeometries.length)
+
+        record.write(header.array())
+        record.write(leftGeometry)
+        record.write(sizeBuffer.array())
+        rightGeometries.foreach(geometry => record.write(GeoSerializerData.serializeGeomToPython(geometry)))
+        record.toByteArray
+      })
+    }).toJavaRDD()
+  }
+
+}
@@ -102,10 +102,14 @@ object GeoSerializerData {
     )
   }
 
+  /**
+    * User data is written separately, so it is removed from geometry only for GeometrySerializer call and restored
+    * afterwards. Geometries shared by several records, like query geometries of join pairs, keep their user data.
+    */
   def serializeGeomToPython(geom: Geometry): Array[Byte] = {
       val userData = geom.getUserData
       geom.setUserData("")
-      val serializedGeom = GeometrySerializer.serialize(geom)
+      val serializedGeom = try GeometrySerializer.serialize(geom) finally geom.setUserData(userData)
       val userDataBinary = userData.asInstanceOf[String].getBytes(StandardCharsets.UTF_8)
       val userDataLengthArray = ByteBuffer.allocate(4).order(ByteOrder.LITTLE_ENDIAN)
       userDataLengthArray.putInt(userDataBinary.length)
@@ -114,7 +118,7 @@ object GeoSerializerData {
 
   }
 
-  def serializeToPythonHashSet(spatialRDD: JavaPairRDD[Geometry, java.util.HashSet[Geometry]]): JavaRDD[Array[Byte]] = {
+  def serializeToPythonHashSet[C <: java.util.Collection[Geometry]](spatialRDD: JavaPairRDD[Geometry, C]): JavaRDD[Array[Byte]] = {
 
     spatialRDD.rdd.map[Array[Byte]](
       pairRDD => {
@@ -133,6 +137,7 @@ object GeoSerializerData {
       }
     )
   }
+
   def serializeToPython(spatialRDD: JavaPairRDD[Geometry, Geometry]): JavaRDD[Array[Byte]] = {
     spatialRDD.rdd.map[Array[Byte]](pairRDD =>{
       val leftGeometry = pairRDD._1
@@ -0,0 +1,119 @@
+package org.imbruced.geo_pyspark.serializers
+
+import java.io.{ObjectInputStream, ObjectOutputStream}
+import java.nio.charset.StandardCharsets
+import java.util.zip.{GZIPInputStream, GZIPOutputStream}
+
+import com.vividsolutions.jts.geom.{Envelope, Geometry}
+import com.vividsolutions.jts.index.SpatialIndex
+import org.apache.hadoop.conf.Configuration
+import org.apache.hadoop.fs.Path
+import org.apache.spark.api.java.JavaRDD
+import org.apache.spark.rdd.RDD
+import org.apache.spark.storage.StorageLevel
+import org.apache.spark.{SerializableWritable, SparkContext}
+import org.datasyslab.geospark.spatialPartitioning.SpatialPartitioner
+import org.datasyslab.geospark.spatialRDD.SpatialRDD
+import org.imbruced.geo_pyspark.RangeQueryPruning
+
+import scala.collection.JavaConverters._
+import scala.io.Source
+
+
+object IndexedRDDPersistence {
+
+  private val Partitioned = "partitioned"
+  private val Raw = "raw"
+  private val AllItems = new Envelope(Double.NegativeInfinity, Double.PositiveInfinity,
+    Double.NegativeInfinity, Double.PositiveInfinity)
+
+  /**
+    * Saves indexedRDD (with partitioner) or indexedRawRDD as one gzipped java serialized index per partition,
+    * geometries are read back from indexes, so they are not stored twice.
+    */
+  def save(spatialRDD: SpatialRDD[Geometry], path: String): Unit = {
+    val sparkContext = SparkContext.getOrCreate()
+    val (kind, indexes) = if (spatialRDD.indexedRDD != null) {
+      SpatialPartitionerSerializer.save(spatialRDD.getPartitioner, new Path(path, "partitioner").toString)
+      (Partitioned, spatialRDD.indexedRDD.rdd)
+    } else if (spatialRDD.indexedRawRDD != null) {
+      (Raw, spatialRDD.indexedRawRDD.rdd)
+    } else throw new IllegalArgumentException("SpatialRDD does not have index, please run buildIndex before")
+
+    val configuration = sparkContext.broadcast(new SerializableWritable(sparkContext.hadoopConfiguration))
+    indexes.mapPartitionsWithIndex((partitionId, partitionIndexes) => {
+      val index = if (partitionIndexes.hasNext) partitionIndexes.next() else null
+      val partitionPath = new Path(path, partitionFileName(partitionId))
+      val output = new ObjectOutputStream(new GZIPOutputStream(
+        partitionPath.getFileSystem(configuration.value.value).create(partitionPath, true)))
+      try output.writeObject(index) finally output.close()
+      Iterator(partitionId)
+    }).collect()
+
+    writeMetadata(sparkContext.hadoopConfiguration, path, s"$kind\t${indexes.getNumPartitions}")
+  }
+
+  /**
+    * Loads indexes saved with save into spatialRDD without building them again. Partition i is read from
+    * partition file i, so partitioning matches saved partitioner. Spatially partitioned geometries are read
+    * from indexes and raw RDD keeps every geometry once (in partition containing its reference point).
+    * Returns true when loaded RDD is spatially partitioned.
+    */
+  def load(spatialRDD: SpatialRDD[Geometry], path: String, newLevel: StorageLevel): Boolean = {
+    val sparkContext = SparkContext.getOrCreate()
+    val Array(kind, numberOfPartitions) = readMetadata(sparkContext.hadoopConfiguration, path).trim.split("\t")
+
+    val configuration = sparkContext.broadcast(new SerializableWritable(sparkContext.hadoopConfiguration))
+    val indexes: RDD[SpatialIndex] = sparkContext.parallelize(0 until numberOfPartitions.toInt, numberOfPartitions.toInt)
+      .mapPartitionsWithIndex((partitionId, _) => {
+        val partitionPath = new Path(path, partitionFileName(partitionId))
+        val input = new ObjectInputStream(new GZIPInputStream(
+          partitionPath.getFileSystem(configuration.value.value).open(partitionPath)))
+        val index = try input.readObject().asInstanceOf[SpatialIndex] finally input.close()
+        if (index == null) Iterator() else Iterator(index)
+      }, preservesPartitioning = true)
+      .persist(newLevel)
+
+    val geometries = indexes.mapPartitions(partitionIndexes =>
+      partitionIndexes.flatMap(index => index.query(AllItems).asScala.map(_.asInstanceOf[Geometry])),
+      preservesPartitioning = true
+    )
+
+    if (kind == Partitioned) {
+      val partitioner = SpatialPartitionerSerializer.load(new Path(path, "partitioner").toString)
+      val grids = partitioner.getGrids.asScala.toArray
+      setPartitioner(spatialRDD, partitioner)
+      spatialRDD.indexedRDD = JavaRDD.fromRDD(indexes)
+      spatialRDD.spatialPartitionedRDD = JavaRDD.fromRDD(geometries)
+      spatialRDD.setRawSpatialRDD(JavaRDD.fromRDD(geometries.mapPartitionsWithIndex((partitionId, partition) =>
+        partition.filter(geometry => RangeQueryPruning.isReferencePartition(
+          grids, partitionId, geometry.getEnvelopeInternal, geometry.getEnvelopeInternal))
+      )))
+      true
+    } else {
+      spatialRDD.indexedRawRDD = JavaRDD.fromRDD(indexes)
+      spatialRDD.setRawSpatialRDD(JavaRDD.fromRDD(geometries))
+      false
+    }
+  }
+
+  private def setPartitioner(spatialRDD: SpatialRDD[Geometry], partitioner: SpatialPartitioner): Unit = {
+    val field = classOf[SpatialRDD[_]].getDeclaredField("partitioner")
+    field.setAccessible(true)
+    field.set(spatialRDD, partitioner)
+  }
+
+  private def partitionFileName(partitionId: Int): String = f"part-$partitionId%05d"
+
+  private def writeMetadata(configuration: Configuration, path: String, metadata: String): Unit = {
+    val metadataPath = new Path(path, "_metadata")
+    val output = metadataPath.getFileSystem(configuration).create(metadataPath, true)
+    try output.write(metadata.getBytes(StandardCharsets.UTF_8)) finally output.close()
+  }
+
+  private def readMetadata(configuration: Configuration, path: String): String = {
+    val metadataPath = new Path(path, "_metadata")
+    val input = metadataPath.getFileSystem(configuration).open(metadataPath)
+    try Source.fromInputStream(input, "UTF-8").mkString finally input.close()
+  }
+}
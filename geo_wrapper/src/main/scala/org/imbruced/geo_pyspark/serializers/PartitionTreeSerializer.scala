@@ -0,0 +1,109 @@
+package org.imbruced.geo_pyspark.serializers
+
+import java.nio.{ByteBuffer, ByteOrder}
+
+import com.vividsolutions.jts.geom.Envelope
+import org.datasyslab.geospark.spatialPartitioning.quadtree.StandardQuadTree
+import org.datasyslab.geospark.spatialPartitioning.{KDBTree, KDBTreePartitioner, QuadTreePartitioner, SpatialPartitioner}
+
+import scala.collection.JavaConverters._
+import scala.collection.mutable
+
+
+object PartitionTreeSerializer {
+
+  val TREE_PARTITIONER = 0
+  val FLAT_PARTITIONER = 1
+
+  private val NO_PARENT = -1
+  private val NO_PARTITION = -1
+
+  case class TreeNode(envelope: Envelope, isLeaf: Boolean, partitionId: Int)
+
+  /**
+    * Serializes whole partitioning tree in pre order as arrays, layout is
+    * kind, numPartitions, numNodes, envelopes (minX, maxX, minY, maxY) per node, parent index per node,
+    * partition id per node (-1 for non leaf nodes).
+    */
+  def serialize(partitioning: AnyRef): Array[Byte] = partitioning match {
+    case quadTree: StandardQuadTree[_] =>
+      toBytes(TREE_PARTITIONER, quadTree.getTotalNumLeafNode, quadTreeNodes(quadTree), 4)
+    case partitioner: QuadTreePartitioner =>
+      toBytes(TREE_PARTITIONER, partitioner.numPartitions,
+        quadTreeNodes(privateField[StandardQuadTree[_]](partitioner, "quadTree")), 4)
+    case partitioner: KDBTreePartitioner =>
+      toBytes(TREE_PARTITIONER, partitioner.numPartitions,
+        kdbTreeNodes(privateField[KDBTree](partitioner, "tree")), 2)
+    case partitioner: SpatialPartitioner =>
+      val nodes = partitioner.getGrids.asScala.zipWithIndex.map {
+        case (grid, partitionId) => TreeNode(grid, isLeaf = true, partitionId)
+      }
+      toBytes(FLAT_PARTITIONER, partitioner.numPartitions, nodes, 0)
+    case _ =>
+      throw new IllegalArgumentException(s"Can not serialize partitioning of type ${partitioning.getClass.getName}")
+  }
+
+  private def quadTreeNodes(quadTree: StandardQuadTree[_]): Seq[TreeNode] = {
+    quadTree.getAllZones.asScala.map(zone => {
+      val partitionId: Integer = zone.partitionId
+      TreeNode(zone.getEnvelope, partitionId != null, if (partitionId != null) partitionId.intValue() else NO_PARTITION)
+    })
+  }
+
+  private def kdbTreeNodes(kdbTree: KDBTree): Seq[TreeNode] = {
+    val nodes = mutable.ArrayBuffer[TreeNode]()
+    kdbTree.traverse(new KDBTree.Visitor {
+      override def visit(tree: KDBTree): Boolean = {
+        nodes += TreeNode(tree.getExtent, tree.isLeaf, if (tree.isLeaf) tree.getLeafId else NO_PARTITION)
+        true
+      }
+    })
+    nodes
+  }
+
+  private def parentIndices(nodes: Seq[TreeNode], numberOfChildren: Int): Array[Int] = {
+    val openNodes = mutable.Stack[(Int, Int)]()
+    nodes.zipWithIndex.map {
+      case (node, index) =>
+        val parent = if (openNodes.isEmpty) NO_PARENT else {
+          val (parentIndex, remainingChildren) = openNodes.pop()
+          if (remainingChildren > 1) openNodes.push((parentIndex, remainingChildren - 1))
+          parentIndex
+        }
+        if (!node.isLeaf && numberOfChildren > 0) openNodes.push((index, numberOfChildren))
+        parent
+    }.toArray
+  }
+
+  private def toBytes(kind: Int, numPartitions: Int, nodes: Seq[TreeNode], numberOfChildren: Int): Array[Byte] = {
+    val parents = parentIndices(nodes, numberOfChildren)
+    val buffer = ByteBuffer.allocate(3 * 4 + nodes.length * (4 * 8 + 4 + 4)).order(ByteOrder.LITTLE_ENDIAN)
+
+    buffer.putInt(kind)
+    buffer.putInt(numPartitions)
+    buffer.putInt(nodes.length)
+    nodes.foreach(node => {
+      buffer.putDouble(node.envelope.getMinX)
+      buffer.putDouble(node.envelope.getMaxX)
+      buffer.putDouble(node.envelope.getMinY)
+      buffer.putDouble(node.envelope.getMaxY)
+    })
+    parents.foreach(parent => buffer.putInt(parent))
+    nodes.foreach(node => buffer.putInt(node.partitionId))
+
+    buffer.array()
+  }
+
+  /**
+    * QuadTreePartitioner (quadTree) and KDBTreePartitioner (tree) do not expose their trees in GeoSpark 1.2.0,
+    * field names are checked against that version and have to be verified when GeoSpark is upgraded.
+    */
+  private def privateField[T](instance: AnyRef, name: String): T = {
+    val field = try instance.getClass.getDeclaredField(name) catch {
+      case _: NoSuchFieldException => throw new IllegalArgumentException(
+        s"${instance.getClass.getName} does not have field $name, partitioning tree can not be read in this GeoSpark version")
+    }
+    field.setAccessible(true)
+    field.get(instance).asInstanceOf[T]
+  }
+}
@@ -0,0 +1,118 @@
+package org.imbruced.geo_pyspark.serializers
+
+import java.io.{BufferedWriter, OutputStreamWriter}
+import java.nio.charset.StandardCharsets
+
+import com.vividsolutions.jts.geom.{Envelope, Geometry}
+import com.vividsolutions.jts.io.{WKBReader, WKBWriter}
+import org.apache.hadoop.fs.Path
+import org.apache.spark.api.java.JavaRDD
+import org.apache.spark.{SerializableWritable, SparkContext}
+import org.datasyslab.geospark.spatialRDD.SpatialRDD
+import org.imbruced.geo_pyspark.{RangeQueryPruning, SpatialStatistics}
+import org.imbruced.geo_pyspark.SpatialStatistics.PartitionStatistics
+
+import scala.collection.JavaConverters._
+import scala.io.Source
+
+
+object PartitionedDataset {
+
+  private val ManifestFile = "_manifest"
+
+  case class ManifestEntry(fileName: String, count: Long, envelope: Envelope)
+
+  /**
+    * Writes every spatial partition of spatialRDD as its own file of hex WKB lines (user data after tab, as in
+    * saveAsWKB) and a manifest with count and envelope of geometries in each file. Geometries replicated to
+    * several partitions are written once, in partition containing their reference point.
+    */
+  def save(spatialRDD: SpatialRDD[Geometry], path: String): Unit = {
+    if (spatialRDD.spatialPartitionedRDD == null) {
+      throw new IllegalArgumentException("SpatialRDD is not spatially partitioned, please run spatialPartitioning before")
+    }
+    val sparkContext = SparkContext.getOrCreate()
+    val grids = spatialRDD.getPartitioner.getGrids.asScala.toArray
+    val configuration = sparkContext.broadcast(new SerializableWritable(sparkContext.hadoopConfiguration))
+
+    val entries = spatialRDD.spatialPartitionedRDD.rdd.mapPartitionsWithIndex((partitionId, geometries) => {
+      val stored = geometries.filter(geometry => RangeQueryPruning.isReferencePartition(
+        grids, partitionId, geometry.getEnvelopeInternal, geometry.getEnvelopeInternal))
+      if (!stored.hasNext) Iterator()
+      else {
+        val fileName = f"part-$partitionId%05d"
+        val partitionPath = new Path(path, fileName)
+        val output = new BufferedWriter(new OutputStreamWriter(
+          partitionPath.getFileSystem(configuration.value.value).create(partitionPath, true), StandardCharsets.UTF_8))
+        val writer = new WKBWriter(2, true)
+        val envelope = new Envelope()
+        var count = 0L
+        try stored.foreach(geometry => {
+          output.write(WKBWriter.toHex(writer.write(geometry)))
+          if (geometry.getUserData != null) output.write("\t" + geometry.getUserData)
+          output.newLine()
+          envelope.expandToInclude(geometry.getEnvelopeInternal)
+          count += 1
+        }) finally output.close()
+        Iterator(ManifestEntry(fileName, count, envelope))
+      }
+    }).collect()
+
+    val manifestPath = new Path(path, ManifestFile)
+    val output = manifestPath.getFileSystem(sparkContext.hadoopConfiguration).create(manifestPath, true)
+    val manifest = entries.map(entry =>
+      Seq(entry.fileName, entry.count, entry.envelope.getMinX, entry.envelope.getMaxX, entry.envelope.getMinY,
+        entry.envelope.getMaxY).mkString("\t")
+    ).mkString("\n")
+    try output.write(manifest.getBytes(StandardCharsets.UTF_8)) finally output.close()
+  }
+
+  /**
+    * Reads files written by save which envelopes intersect queryWindow (every file when queryWindow is null)
+    * into spatialRDD, geometries are filtered by envelope intersection with queryWindow.
+    */
+  def load(spatialRDD: SpatialRDD[Geometry], path: String, queryWindow: Envelope): Unit = {
+    val sparkContext = SparkContext.getOrCreate()
+    val entries = readManifest(path).filter(entry => queryWindow == null || entry.envelope.intersects(queryWindow))
+
+    val geometries = if (entries.isEmpty) sparkContext.emptyRDD[Geometry]
+    else sparkContext.textFile(entries.map(entry => new Path(path, entry.fileName).toString).mkString(","))
+      .mapPartitions(lines => {
+        val reader = new WKBReader()
+        lines.map(line => {
+          val separator = line.indexOf('\t')
+          val geometry = reader.read(WKBReader.hexToBytes(if (separator < 0) line else line.substring(0, separator)))
+          if (separator >= 0) geometry.setUserData(line.substring(separator + 1))
+          geometry
+        })
+      })
+      .filter(geometry => queryWindow == null || geometry.getEnvelopeInternal.intersects(queryWindow))
+
+    spatialRDD.setRawSpatialRDD(JavaRDD.fromRDD(geometries))
+    if (queryWindow == null) {
+      val boundary = new Envelope()
+      entries.foreach(entry => boundary.expandToInclude(entry.envelope))
+      spatialRDD.boundaryEnvelope = if (boundary.isNull) null else boundary
+      spatialRDD.approximateTotalCount = entries.map(_.count).sum
+    }
+  }
+
+  /**
+    * Manifest in SpatialStatistics format, partition id is position of file in manifest.
+    */
+  def manifest(path: String): Array[Byte] = {
+    SpatialStatistics.serialize(readManifest(path).zipWithIndex.map { case (entry, partitionId) =>
+      PartitionStatistics(partitionId, entry.count, entry.envelope)
+    })
+  }
+
+  private def readManifest(path: String): Array[ManifestEntry] = {
+    val manifestPath = new Path(path, ManifestFile)
+    val input = manifestPath.getFileSystem(SparkContext.getOrCreate().hadoopConfiguration).open(manifestPath)
+    val lines = try Source.fromInputStream(input, "UTF-8").getLines().toArray finally input.close()
+    lines.filter(_.nonEmpty).map(line => {
+      val Array(fileName, count, minX, maxX, minY, maxY) = line.split("\t")
+      ManifestEntry(fileName, count.toLong, new Envelope(minX.toDouble, maxX.toDouble, minY.toDouble, maxY.toDouble))
+    })
+  }
+}
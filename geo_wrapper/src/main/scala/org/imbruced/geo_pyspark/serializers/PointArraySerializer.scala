@@ -0,0 +1,46 @@
+package org.imbruced.geo_pyspark.serializers
+
+import java.nio.{ByteBuffer, ByteOrder}
+import java.nio.charset.StandardCharsets
+
+import com.vividsolutions.jts.geom.{Geometry, Point}
+import org.apache.spark.api.java.JavaRDD
+
+
+object PointArraySerializer {
+
+  /**
+    * Packs points into records of at most maxPointsPerRecord points, layout is
+    * type (3), number of points, x y doubles per point, user data flag, user data lengths and utf8 user data.
+    */
+  def serializePointsToPython(spatialRDD: JavaRDD[Geometry], withUserData: Boolean,
+                              maxPointsPerRecord: Int): JavaRDD[Array[Byte]] = {
+    spatialRDD.rdd.mapPartitions(points =>
+      points.grouped(maxPointsPerRecord).map(chunk => serializePoints(chunk, withUserData))
+    ).toJavaRDD()
+  }
+
+  private def serializePoints(points: Seq[Geometry], withUserData: Boolean): Array[Byte] = {
+    val userData = if (withUserData) points.map(point => point.getUserData match {
+      case data: String => data.getBytes(StandardCharsets.UTF_8)
+      case _ => Array[Byte]()
+    }) else Seq()
+    val buffer = ByteBuffer.allocate(4 + 4 + points.length * 2 * 8 + 4 + userData.map(4 + _.length).sum)
+      .order(ByteOrder.LITTLE_ENDIAN)
+
+    buffer.putInt(3)
+    buffer.putInt(points.length)
+    points.foreach {
+      case point: Point =>
+        buffer.putDouble(point.getX)
+        buffer.putDouble(point.getY)
+      case geometry => throw new IllegalArgumentException(s"Expected point, got ${geometry.getGeometryType}")
+    }
+    buffer.putInt(if (withUserData) 1 else 0)
+    userData.foreach(data => buffer.putInt(data.length))
+    userData.foreach(data => buffer.put(data))
+
+    buffer.array()
+  }
+
+}
@@ -0,0 +1,44 @@
+package org.imbruced.geo_pyspark.serializers
+
+import java.io.{ByteArrayInputStream, ByteArrayOutputStream, ObjectInputStream, ObjectOutputStream}
+import java.util.zip.{GZIPInputStream, GZIPOutputStream}
+
+import org.apache.hadoop.fs.Path
+import org.apache.hadoop.io.IOUtils
+import org.apache.spark.SparkContext
+import org.datasyslab.geospark.spatialPartitioning.SpatialPartitioner
+
+
+object SpatialPartitionerSerializer {
+
+  def serialize(partitioner: SpatialPartitioner): Array[Byte] = {
+    val bytes = new ByteArrayOutputStream()
+    val output = new ObjectOutputStream(new GZIPOutputStream(bytes))
+    try output.writeObject(partitioner) finally output.close()
+    bytes.toByteArray
+  }
+
+  def deserialize(bytes: Array[Byte]): SpatialPartitioner = {
+    val input = new ObjectInputStream(new GZIPInputStream(new ByteArrayInputStream(bytes)))
+    try input.readObject().asInstanceOf[SpatialPartitioner] finally input.close()
+  }
+
+  /**
+    * Saves partitioner (grids and KDB/quad tree) as single file on any file system supported by hadoop.
+    */
+  def save(partitioner: SpatialPartitioner, path: String): Unit = {
+    val hadoopPath = new Path(path)
+    val fileSystem = hadoopPath.getFileSystem(SparkContext.getOrCreate().hadoopConfiguration)
+    val output = fileSystem.create(hadoopPath, true)
+    try output.write(serialize(partitioner)) finally output.close()
+  }
+
+  def load(path: String): SpatialPartitioner = {
+    val hadoopPath = new Path(path)
+    val fileSystem = hadoopPath.getFileSystem(SparkContext.getOrCreate().hadoopConfiguration)
+    val bytes = new Array[Byte](fileSystem.getFileStatus(hadoopPath).getLen.toInt)
+    val input = fileSystem.open(hadoopPath)
+    try IOUtils.readFully(input, bytes, 0, bytes.length) finally input.close()
+    deserialize(bytes)
+  }
+}
@@ -0,0 +1,96 @@
+package org.imbruced.geo_pyspark.serializers
+
+import com.vividsolutions.jts.geom.Geometry
+import com.vividsolutions.jts.io.{WKBReader, WKBWriter, WKTWriter}
+import org.apache.hadoop.io.compress.CompressionCodec
+import org.apache.hadoop.io.{BytesWritable, Text}
+import org.apache.hadoop.mapred.SequenceFileOutputFormat
+import org.apache.spark.SparkContext
+import org.apache.spark.api.java.JavaRDD
+import org.apache.spark.rdd.RDD
+import org.datasyslab.geospark.spatialRDD.SpatialRDD
+import org.wololo.geojson.Feature
+import org.wololo.jts2geojson.GeoJSONWriter
+
+import scala.collection.JavaConverters._
+
+
+object SpatialRDDWriter {
+
+  /**
+    * Same output as SpatialRDD.saveAsWKT, SpatialRDD.saveAsWKB and SpatialRDD.saveAsGeoJSON compressed with
+    * hadoop codec given by class name, output is not compressed when codec is null.
+    */
+  def saveAsWKT(spatialRDD: SpatialRDD[Geometry], path: String, codec: String): Unit = {
+    save(raw(spatialRDD).mapPartitions(geometries => {
+      val writer = new WKTWriter(3)
+      geometries.map(geometry => withUserData(writer.write(geometry), geometry))
+    }), path, codec)
+  }
+
+  def saveAsWKB(spatialRDD: SpatialRDD[Geometry], path: String, codec: String): Unit = {
+    save(raw(spatialRDD).mapPartitions(geometries => {
+      val writer = new WKBWriter(3, true)
+      geometries.map(geometry => withUserData(WKBWriter.toHex(writer.write(geometry)), geometry))
+    }), path, codec)
+  }
+
+  def saveAsGeoJSON(spatialRDD: SpatialRDD[Geometry], path: String, codec: String): Unit = {
+    save(raw(spatialRDD).mapPartitions(geometries => {
+      val writer = new GeoJSONWriter()
+      geometries.map(geometry => {
+        val properties = if (geometry.getUserData == null) null
+        else Map[String, AnyRef]("UserData" -> geometry.getUserData).asJava
+        new Feature(writer.write(geometry), properties).toString
+      })
+    }), path, codec)
+  }
+
+  /**
+    * Writes sequence file of (WKB, user data) records, with codec records are compressed in blocks.
+    * Geometries are not parsed from text when read back, user data is empty string when geometry has none.
+    */
+  def saveAsWKBSequenceFile(spatialRDD: SpatialRDD[Geometry], path: String, codec: String): Unit = {
+    val records = raw(spatialRDD).mapPartitions(geometries => {
+      val writer = new WKBWriter(3, true)
+      geometries.map(geometry => (
+        new BytesWritable(writer.write(geometry)),
+        new Text(if (geometry.getUserData == null) "" else geometry.getUserData.toString)
+      ))
+    })
+    val outputFormat = classOf[SequenceFileOutputFormat[BytesWritable, Text]]
+    if (codec == null) records.saveAsHadoopFile(path, classOf[BytesWritable], classOf[Text], outputFormat)
+    else records.saveAsHadoopFile(path, classOf[BytesWritable], classOf[Text], outputFormat, codecClass(codec))
+  }
+
+  def readWKBSequenceFile(spatialRDD: SpatialRDD[Geometry], path: String): Unit = {
+    val geometries = SparkContext.getOrCreate().sequenceFile(path, classOf[BytesWritable], classOf[Text])
+      .mapPartitions(records => {
+        val reader = new WKBReader()
+        records.map { case (wkb, userData) =>
+          val geometry = reader.read(wkb.copyBytes())
+          val data = userData.toString
+          if (data.nonEmpty) geometry.setUserData(data)
+          geometry
+        }
+      })
+    spatialRDD.setRawSpatialRDD(JavaRDD.fromRDD(geometries))
+  }
+
+  private def raw(spatialRDD: SpatialRDD[Geometry]): RDD[Geometry] = {
+    if (spatialRDD.rawSpatialRDD == null) throw new IllegalArgumentException("SpatialRDD does not have raw RDD")
+    spatialRDD.rawSpatialRDD.rdd
+  }
+
+  private def withUserData(value: String, geometry: Geometry): String = {
+    if (geometry.getUserData == null) value else value + "\t" + geometry.getUserData
+  }
+
+  private def save(lines: RDD[String], path: String, codec: String): Unit = {
+    if (codec == null) lines.saveAsTextFile(path) else lines.saveAsTextFile(path, codecClass(codec))
+  }
+
+  private def codecClass(codec: String): Class[_ <: CompressionCodec] = {
+    Class.forName(codec).asSubclass(classOf[CompressionCodec])
+  }
+}
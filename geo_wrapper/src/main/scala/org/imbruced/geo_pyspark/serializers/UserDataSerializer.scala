@@ -0,0 +1,66 @@
+package org.imbruced.geo_pyspark.serializers
+
+import java.nio.{ByteBuffer, ByteOrder}
+import java.nio.charset.StandardCharsets
+
+import com.vividsolutions.jts.geom.Geometry
+import org.apache.spark.api.java.{JavaPairRDD, JavaRDD}
+
+import scala.collection.JavaConverters._
+
+
+object UserDataSerializer {
+
+  /**
+    * Serializes only user data of joined geometries, layout is type (4 for flat pairs, 5 for grouped result),
+    * left user data, number of right geometries and their user data, each user data prefixed with its length.
+    * When field indices are not empty, only those tab separated user data fields are kept.
+    */
+  def serializeUserDataToPython(spatialRDD: JavaPairRDD[Geometry, Geometry], leftFields: java.util.List[Integer],
+                                rightFields: java.util.List[Integer]): JavaRDD[Array[Byte]] = {
+    val leftIndices = leftFields.asScala.map(_.intValue()).toArray
+    val rightIndices = rightFields.asScala.map(_.intValue()).toArray
+    spatialRDD.rdd.map[Array[Byte]](pair =>
+      serializeUserData(4, selectUserData(pair._1, leftIndices), Seq(selectUserData(pair._2, rightIndices)))
+    ).toJavaRDD()
+  }
+
+  def serializeUserDataToPythonHashSet[C <: java.util.Collection[Geometry]](spatialRDD: JavaPairRDD[Geometry, C],
+                                                                             leftFields: java.util.List[Integer],
+                                                                             rightFields: java.util.List[Integer]
+                                                                            ): JavaRDD[Array[Byte]] = {
+    val leftIndices = leftFields.asScala.map(_.intValue()).toArray
+    val rightIndices = rightFields.asScala.map(_.intValue()).toArray
+    spatialRDD.rdd.map[Array[Byte]](pair =>
+      serializeUserData(5, selectUserData(pair._1, leftIndices),
+        pair._2.asScala.toSeq.map(geometry => selectUserData(geometry, rightIndices)))
+    ).toJavaRDD()
+  }
+
+  private def selectUserData(geometry: Geometry, fields: Array[Int]): Array[Byte] = {
+    val userData = geometry.getUserData match {
+      case null => ""
+      case data => data.toString
+    }
+    val selected = if (fields.isEmpty) userData else {
+      val values = userData.split("\t", -1)
+      fields.map(index => if (index < values.length) values(index) else "").mkString("\t")
+    }
+    selected.getBytes(StandardCharsets.UTF_8)
+  }
+
+  private def serializeUserData(recordType: Int, left: Array[Byte], rights: Seq[Array[Byte]]): Array[Byte] = {
+    val buffer = ByteBuffer.allocate(4 + 4 + left.length + 4 + rights.map(4 + _.length).sum)
+      .order(ByteOrder.LITTLE_ENDIAN)
+    buffer.putInt(recordType)
+    buffer.putInt(left.length)
+    buffer.put(left)
+    buffer.putInt(rights.length)
+    rights.foreach(right => {
+      buffer.putInt(right.length)
+      buffer.put(right)
+    })
+    buffer.array()
+  }
+
+}
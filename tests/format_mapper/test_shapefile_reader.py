@@ -1,10 +1,12 @@
+import glob
 import os
 
 from geo_pyspark.core import Envelope
 from geo_pyspark.core.spatialOperator import RangeQuery
+from geo_pyspark.register.java_libs import GeoSparkLib
 from tests.tools import tests_path
 from geo_pyspark.core.formatMapper.shapefileParser import ShapefileReader
-from tests.test_base import TestBase
+from tests.test_base import TestBase, skip_without_libs
 
 undefined_type_shape_location = os.path.join(tests_path, "resources/shapefiles/undefined")
 polygon_shape_location = os.path.join(tests_path, "resources/shapefiles/polygon")
@@ -66,3 +68,50 @@ class TestShapeFileReader(TestBase):
         assert spatial_rdd.rawSpatialRDD.count() == count
         assert 'org.datasyslab.geospark.spatialRDD.SpatialRDD' in geometry_rdd._srdd.toString()
         assert 'org.datasyslab.geospark.spatialRDD.PointRDD' in spatial_rdd._srdd.toString()
+
+    @skip_without_libs(GeoSparkLib.ParallelShapefileReader)
+    def test_read_files_to_geometry_rdd(self):
+        dbf_location = os.path.join(tests_path, "resources/shapefiles/dbf")
+        point_location = os.path.join(tests_path, "resources/shapefiles/point")
+        expected_count = ShapefileReader.readToGeometryRDD(self.sc, dbf_location).rawSpatialRDD.count() + \
+            ShapefileReader.readToGeometryRDD(self.sc, point_location).rawSpatialRDD.count()
+
+        spatial_rdd = ShapefileReader.readFilesToGeometryRDD(self.sc, [dbf_location, point_location])
+        geometries = spatial_rdd.rawSpatialRDD.collect()
+
+        assert spatial_rdd.fieldNames == [
+            'STATEFP', 'COUNTYFP', 'COUNTYNS', 'AFFGEOID', 'GEOID', 'NAME', 'LSAD', 'ALAND', 'AWATER', 'source_file'
+        ]
+        assert len(geometries) == expected_count
+        assert {geo_data.userData.split("\t")[-1].split("/")[-2] for geo_data in geometries} == {"dbf", "point"}
+
+        tuple_rdd = ShapefileReader.readFilesToGeometryRDD(self.sc, (dbf_location, point_location))
+        assert tuple_rdd.rawSpatialRDD.count() == expected_count
+
+    @skip_without_libs(GeoSparkLib.ParallelShapefileReader)
+    def test_read_files_to_geometry_rdd_with_glob(self):
+        pattern = os.path.join(tests_path, "resources/shapefiles/*/map.shp")
+        spatial_rdd = ShapefileReader.readFilesToGeometryRDD(self.sc, pattern)
+
+        expected_count = sum(
+            ShapefileReader.readToGeometryRDD(self.sc, os.path.dirname(path)).rawSpatialRDD.count()
+            for path in glob.glob(pattern)
+        )
+        assert spatial_rdd.rawSpatialRDD.count() == expected_count
+
+    @skip_without_libs(GeoSparkLib.ParallelShapefileReader)
+    def test_read_to_geometry_rdd_with_query_window(self):
+        input_location = os.path.join(tests_path, "resources/shapefiles/dbf")
+        window = Envelope(-90.01, -80.01, 30.01, 40.01)
+        geometry_rdd = ShapefileReader.readToGeometryRDD(self.sc, input_location)
+        expected = [
+            geo_data for geo_data in geometry_rdd.rawSpatialRDD.collect()
+            if Envelope.from_shapely_geom(geo_data.geom).intersects(window)
+        ]
+
+        window_rdd = ShapefileReader.readToGeometryRDD(self.sc, input_location, window)
+        geometries = window_rdd.rawSpatialRDD.collect()
+
+        assert window_rdd.fieldNames == geometry_rdd.fieldNames
+        assert 0 < len(geometries) < geometry_rdd.rawSpatialRDD.count()
+        assert sorted(geo_data.userData for geo_data in geometries) == sorted(geo_data.userData for geo_data in expected)
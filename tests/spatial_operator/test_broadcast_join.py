@@ -0,0 +1,49 @@
+import os
+
+from geo_pyspark.core.enums import FileDataSplitter, GridType
+from geo_pyspark.core.spatialOperator import JoinQuery
+from geo_pyspark.register.java_libs import GeoSparkLib
+from tests.spatial_operator.test_join_base import TestJoinBase
+from tests.test_base import skip_without_libs
+from tests.tools import tests_path, create_area_lm_point_rdd
+
+query_polygon_set = os.path.join(tests_path, "resources/primaryroads-polygon.csv")
+splitter = FileDataSplitter.CSV
+num_partitions = 11
+
+
+class TestBroadcastJoin(TestJoinBase):
+
+    @skip_without_libs(GeoSparkLib.BroadcastSpatialJoin)
+    def test_broadcast_spatial_join(self):
+        query_rdd = create_area_lm_point_rdd(self.sc, True, num_partitions)
+        spatial_rdd = self.create_polygon_rdd(query_polygon_set, splitter, num_partitions)
+        query_data = {(geo_data.geom.wkt, geo_data.userData) for geo_data in query_rdd.rawSpatialRDD.collect()}
+
+        broadcast_result = JoinQuery.BroadcastSpatialJoin(spatial_rdd, query_rdd, True).collect()
+        self.sanity_check_flat_join_results(broadcast_result)
+
+        assert len(broadcast_result) > 0
+        assert all(left.userData != "" for left, _ in broadcast_result)
+        assert all((left.geom.wkt, left.userData) in query_data for left, _ in broadcast_result)
+
+        self.partition_rdds(query_rdd, spatial_rdd, GridType.KDBTREE, False)
+        result = JoinQuery.SpatialJoinQueryFlat(spatial_rdd, query_rdd, False, True).collect()
+
+        assert len(broadcast_result) == len(result)
+        assert self.flat_join_results_data(broadcast_result) == self.flat_join_results_data(result)
+
+    def test_broadcast_join_is_not_used_by_default(self):
+        query_rdd = create_area_lm_point_rdd(self.sc, True, num_partitions)
+        spatial_rdd = self.create_polygon_rdd(query_polygon_set, splitter, num_partitions)
+
+        assert not JoinQuery._use_broadcast_join(spatial_rdd, query_rdd)
+        assert query_rdd._statistics is None
+
+    def test_broadcast_join_honors_join_flags(self):
+        query_rdd = create_area_lm_point_rdd(self.sc, True, num_partitions)
+        spatial_rdd = self.create_polygon_rdd(query_polygon_set, splitter, num_partitions)
+
+        assert not JoinQuery._use_broadcast_join(spatial_rdd, query_rdd, useIndex=False)
+        assert not JoinQuery._use_broadcast_join(spatial_rdd, query_rdd, referencePointDedup=True)
+        assert query_rdd._statistics is None
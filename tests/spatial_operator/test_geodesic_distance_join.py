@@ -0,0 +1,57 @@
+import os
+
+import numpy as np
+import pytest
+
+from geo_pyspark.core.enums import FileDataSplitter, GridType
+from geo_pyspark.core.spatialOperator import JoinQuery
+from geo_pyspark.register.java_libs import GeoSparkLib
+from tests.spatial_operator.test_join_base import TestJoinBase
+from tests.test_base import skip_without_libs
+from tests.tools import tests_path, create_area_lm_point_rdd
+
+input_location = os.path.join(tests_path, "resources/arealm-small.csv")
+splitter = FileDataSplitter.CSV
+num_partitions = 11
+distance = 5000.0
+earth_radius = 6371008.8
+
+
+def haversine_matrix(points: np.ndarray) -> np.ndarray:
+    longitudes, latitudes = np.radians(points[:, 0]), np.radians(points[:, 1])
+    latitude_delta = latitudes[:, None] - latitudes[None, :]
+    longitude_delta = longitudes[:, None] - longitudes[None, :]
+    a = np.sin(latitude_delta / 2) ** 2 + \
+        np.cos(latitudes)[:, None] * np.cos(latitudes)[None, :] * np.sin(longitude_delta / 2) ** 2
+    return 2 * earth_radius * np.arcsin(np.minimum(1.0, np.sqrt(a)))
+
+
+class TestGeodesicDistanceJoin(TestJoinBase):
+
+    @skip_without_libs(GeoSparkLib.GeodesicDistanceJoin)
+    def test_geodesic_distance_join(self):
+        for grid_type in [GridType.KDBTREE, GridType.QUADTREE, GridType.RTREE]:
+            query_rdd = create_area_lm_point_rdd(self.sc, True, num_partitions)
+            spatial_rdd = self.create_point_rdd(input_location, splitter, num_partitions)
+            spatial_rdd.spatialPartitioning(grid_type)
+
+            result = JoinQuery.GeodesicDistanceJoinQueryFlat(spatial_rdd, query_rdd, distance).collect()
+
+            query_points = query_rdd.rawSpatialRDD.collect()
+            points = np.array([[point.geom.x, point.geom.y] for point in query_points])
+            left_indexes, right_indexes = np.nonzero(haversine_matrix(points) <= distance)
+            expected = sorted(
+                (query_points[left].geom.wkt, query_points[left].userData, query_points[right].geom.wkt)
+                for left, right in zip(left_indexes, right_indexes)
+            )
+
+            assert len(result) == len(expected)
+            assert sorted((left.geom.wkt, left.userData, right.geom.wkt) for left, right in result) == expected
+
+    @skip_without_libs(GeoSparkLib.GeodesicDistanceJoin)
+    def test_geodesic_distance_join_requires_partitioning(self):
+        query_rdd = self.create_point_rdd(input_location, splitter, num_partitions)
+        spatial_rdd = self.create_point_rdd(input_location, splitter, num_partitions)
+
+        with pytest.raises(AttributeError):
+            JoinQuery.GeodesicDistanceJoinQueryFlat(spatial_rdd, query_rdd, distance)
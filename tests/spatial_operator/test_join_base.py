@@ -68,4 +68,9 @@ class TestJoinBase(TestBase):
         for row_data in results:
             assert row_data[0].getUserData() is not None
             assert row_data[1].getUserData() is not None
-            assert row_data[0].geom.intersects(row_data[1].geom)
\ No newline at end of file
+            assert row_data[0].geom.intersects(row_data[1].geom)
+
+    def flat_join_results_data(self, results):
+        return sorted(
+            (left.geom.wkt, left.userData, right.geom.wkt, right.userData) for left, right in results
+        )
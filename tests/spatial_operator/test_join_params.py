@@ -0,0 +1,43 @@
+from geo_pyspark.core.enums import IndexType
+from geo_pyspark.core.enums.join_build_side import JoinBuildSide
+from geo_pyspark.core.spatialOperator.join_params import decide_join
+from geo_pyspark.core.spatial_statistics import PartitionStatsReport, PartitionReport
+
+
+def report(*counts: int) -> PartitionStatsReport:
+    return PartitionStatsReport(
+        [PartitionReport(partition_id, count, None, count, 0) for partition_id, count in enumerate(counts)]
+    )
+
+
+class TestDecideJoin:
+
+    def test_nested_loop_for_tiny_partitions(self):
+        decision = decide_join(report(1, 2), report(2, 1))
+
+        assert not decision.useIndex
+        assert decision.nestedLoopCost == 4
+        assert decision.nestedLoopCost <= decision.indexCost
+        assert decision.reason.startswith("nested loop")
+
+    def test_index_on_left_side(self):
+        decision = decide_join(report(10, 20), report(1000, 2000))
+
+        assert decision.useIndex
+        assert decision.joinBuildSide == JoinBuildSide.LEFT
+        assert decision.indexType == IndexType.RTREE
+        assert decision.indexCost < decision.nestedLoopCost
+
+    def test_index_on_right_side(self):
+        decision = decide_join(report(1000, 2000), report(10, 20))
+
+        assert decision.useIndex
+        assert decision.joinBuildSide == JoinBuildSide.RIGHT
+        assert decision.indexType == IndexType.RTREE
+
+    def test_empty_partitions_are_skipped(self):
+        decision = decide_join(report(0, 1000), report(1000, 0))
+
+        assert not decision.useIndex
+        assert decision.nestedLoopCost == 0
+        assert decision.indexCost == 0
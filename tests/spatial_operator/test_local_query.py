@@ -0,0 +1,58 @@
+import os
+
+from shapely.geometry import Point
+
+from geo_pyspark.core import local
+from geo_pyspark.core.enums import FileDataSplitter, GridType
+from geo_pyspark.core.geom_types import Envelope
+from geo_pyspark.core.local import LocalSpatialRDD
+from geo_pyspark.core.spatialOperator import RangeQuery, KNNQuery, JoinQuery
+from tests.spatial_operator.test_join_base import TestJoinBase
+from tests.tools import tests_path
+
+input_location = os.path.join(tests_path, "resources/arealm-small.csv")
+query_polygon_set = os.path.join(tests_path, "resources/primaryroads-polygon.csv")
+splitter = FileDataSplitter.CSV
+num_partitions = 11
+query_envelope = Envelope(-90.01, -80.01, 30.01, 40.01)
+query_point = Point(-84.01, 34.01)
+
+
+class TestLocalQuery(TestJoinBase):
+
+    def test_spatial_range_query(self):
+        spatial_rdd = self.create_point_rdd(input_location, splitter, num_partitions)
+        local_rdd = LocalSpatialRDD.from_spatial_rdd(spatial_rdd)
+
+        expected = RangeQuery.SpatialRangeQuery(spatial_rdd, query_envelope, False, False).count()
+
+        assert len(local.RangeQuery.SpatialRangeQuery(local_rdd, query_envelope, False, True)) == expected
+        assert len(local.RangeQuery.SpatialRangeQuery(local_rdd, query_envelope, False, False)) == expected
+
+    def test_spatial_knn_query(self):
+        spatial_rdd = self.create_point_rdd(input_location, splitter, num_partitions)
+        local_rdd = LocalSpatialRDD.from_spatial_rdd(spatial_rdd)
+
+        for k in [1, 5, 100]:
+            expected = KNNQuery.SpatialKnnQuery(spatial_rdd, query_point, k, False)
+            result = local.KNNQuery.SpatialKnnQuery(local_rdd, query_point, k, True)
+
+            assert [query_point.distance(geo_data.geom) for geo_data in result] == \
+                sorted(query_point.distance(geo_data.geom) for geo_data in expected)
+
+    def test_spatial_join_query(self):
+        query_rdd = self.create_polygon_rdd(query_polygon_set, splitter, num_partitions)
+        spatial_rdd = self.create_point_rdd(input_location, splitter, num_partitions)
+        local_query_rdd = LocalSpatialRDD.from_spatial_rdd(query_rdd)
+        local_spatial_rdd = LocalSpatialRDD.from_spatial_rdd(spatial_rdd)
+
+        self.partition_rdds(query_rdd, spatial_rdd, GridType.KDBTREE, False)
+        expected = JoinQuery.SpatialJoinQueryFlat(spatial_rdd, query_rdd, False, True).count()
+
+        result = local.JoinQuery.SpatialJoinQueryFlat(local_spatial_rdd, local_query_rdd, True, True)
+        grouped_result = local.JoinQuery.SpatialJoinQuery(local_spatial_rdd, local_query_rdd, False, True)
+
+        self.sanity_check_flat_join_results(result)
+        self.sanity_check_join_results(grouped_result)
+        assert len(result) == expected
+        assert self.count_join_results(grouped_result) == expected
@@ -5,8 +5,10 @@ from geo_pyspark.core.enums import FileDataSplitter, GridType, IndexType
 from geo_pyspark.core.enums.join_build_side import JoinBuildSide
 from geo_pyspark.core.spatialOperator import JoinQuery
 from geo_pyspark.core.spatialOperator.join_params import JoinParams
+from geo_pyspark.register.java_libs import GeoSparkLib
 from tests.spatial_operator.test_join_base import TestJoinBase
-from tests.tools import tests_path
+from tests.test_base import skip_without_libs
+from tests.tools import tests_path, create_area_lm_point_rdd
 
 input_location = os.path.join(tests_path, "resources/arealm-small.csv")
 input_location_query_window = os.path.join(tests_path, "resources/zcta510-small.csv")
@@ -39,6 +41,12 @@ parameters = [
     dict(num_partitions=11, use_legacy_apis=False, grid_type=GridType.KDBTREE),
 ]
 
+reference_point_parameters = [
+    dict(num_partitions=11, use_legacy_apis=False, grid_type=GridType.QUADTREE, use_index=True),
+    dict(num_partitions=11, use_legacy_apis=False, grid_type=GridType.KDBTREE, use_index=True),
+    dict(num_partitions=11, use_legacy_apis=False, grid_type=GridType.KDBTREE, use_index=False),
+]
+
 
 class TestRectangleJoin(TestJoinBase):
     params = {
@@ -50,7 +58,13 @@ class TestRectangleJoin(TestJoinBase):
         "test_quad_tree_with_rectangles": parameters,
         "test_quad_tree_with_polygons": parameters,
         "test_dynamic_r_tree_with_rectangles": parameters,
-        "test_dynamic_r_tree_with_polygons": parameters
+        "test_dynamic_r_tree_with_polygons": parameters,
+        "test_join_ids": parameters,
+        "test_join_chunks": parameters,
+        "test_auto_join_params": parameters,
+        "test_estimate_join_cardinality": parameters,
+        "test_reference_point_dedup": reference_point_parameters,
+        "test_reference_point_dedup_user_data": reference_point_parameters,
     }
 
     def test_nested_loop_with_rectangles(self, num_partitions, grid_type, use_legacy_apis):
@@ -135,3 +149,104 @@ class TestRectangleJoin(TestJoinBase):
         self.sanity_check_flat_join_results(results)
 
         assert expected_count == results.__len__()
+
+    @skip_without_libs(GeoSparkLib.UserDataSerializer)
+    def test_join_ids(self, num_partitions, use_legacy_apis, grid_type):
+        query_rdd = self.create_polygon_rdd(query_polygon_set, splitter, num_partitions)
+        spatial_rdd = self.create_point_rdd(input_location, splitter, num_partitions)
+        self.partition_rdds(query_rdd, spatial_rdd, grid_type, use_legacy_apis)
+
+        result = JoinQuery.SpatialJoinQuery(spatial_rdd, query_rdd, False, True).collect()
+        result_ids = JoinQuery.SpatialJoinQueryIds(spatial_rdd, query_rdd, False, True).collect()
+        assert self.count_join_results(result) == self.count_join_results(result_ids)
+        assert sorted(row[0].getUserData() for row in result) == sorted(row[0] for row in result_ids)
+
+        flat_result = JoinQuery.SpatialJoinQueryFlat(spatial_rdd, query_rdd, False, True).collect()
+        flat_result_ids = JoinQuery.SpatialJoinQueryFlatIds(spatial_rdd, query_rdd, False, True, [0], [0]).collect()
+        assert flat_result.__len__() == flat_result_ids.__len__()
+        assert sorted(row[1].getUserData().split("\t")[0] for row in flat_result) == \
+            sorted(row[1] for row in flat_result_ids)
+
+    @skip_without_libs(GeoSparkLib.ChunkedJoinSerializer)
+    def test_join_chunks(self, num_partitions, use_legacy_apis, grid_type):
+        query_rdd = self.create_polygon_rdd(query_polygon_set, splitter, num_partitions)
+        spatial_rdd = self.create_point_rdd(input_location, splitter, num_partitions)
+        self.partition_rdds(query_rdd, spatial_rdd, grid_type, use_legacy_apis)
+
+        result = JoinQuery.SpatialJoinQuery(spatial_rdd, query_rdd, False, True).collect()
+        chunked_result = JoinQuery.SpatialJoinQuery(spatial_rdd, query_rdd, False, True, maxChunkSize=2).collect()
+
+        self.sanity_check_join_results(chunked_result)
+        assert all(row[1].__len__() <= 2 for row in chunked_result)
+        assert self.count_join_results(result) == self.count_join_results(chunked_result)
+
+    @skip_without_libs(GeoSparkLib.SpatialStatistics)
+    def test_auto_join_params(self, num_partitions, use_legacy_apis, grid_type):
+        query_rdd = self.create_polygon_rdd(query_polygon_set, splitter, num_partitions)
+        spatial_rdd = self.create_point_rdd(input_location, splitter, num_partitions)
+        self.partition_rdds(query_rdd, spatial_rdd, grid_type, use_legacy_apis)
+
+        expected_count = polygon_match_with_original_duplicates_count \
+            if self.expect_to_preserve_original_duplicates(grid_type) else polygon_match_count
+
+        join_params = JoinParams(auto=True)
+        result_rdd = JoinQuery.spatialJoin(query_rdd, spatial_rdd, join_params)
+        results = result_rdd.collect()
+
+        self.sanity_check_flat_join_results(results)
+        assert expected_count == results.__len__()
+        assert join_params.decision is None
+        assert result_rdd.joinDecision is not None
+        assert result_rdd.joinDecision.reason
+        assert query_rdd.partitionStats() is query_rdd.partitionStats()
+
+    @skip_without_libs(GeoSparkLib.ReferencePointJoin)
+    def test_reference_point_dedup(self, num_partitions, use_legacy_apis, grid_type, use_index):
+        query_rdd = self.create_polygon_rdd(query_polygon_set, splitter, num_partitions)
+        spatial_rdd = self.create_point_rdd(input_location, splitter, num_partitions)
+        self.partition_rdds(query_rdd, spatial_rdd, grid_type, use_legacy_apis)
+
+        expected = JoinQuery.SpatialJoinQueryFlat(spatial_rdd, query_rdd, use_index, True).count()
+        flat_result = JoinQuery.SpatialJoinQueryFlat(
+            spatial_rdd, query_rdd, use_index, True, referencePointDedup=True).collect()
+        result = JoinQuery.SpatialJoinQuery(spatial_rdd, query_rdd, use_index, True, referencePointDedup=True).collect()
+
+        self.sanity_check_flat_join_results(flat_result)
+        self.sanity_check_join_results(result)
+        assert expected == len(flat_result)
+        assert expected == self.count_join_results(result)
+
+    @skip_without_libs(GeoSparkLib.ReferencePointJoin)
+    def test_reference_point_dedup_user_data(self, num_partitions, use_legacy_apis, grid_type, use_index):
+        query_rdd = create_area_lm_point_rdd(self.sc, True, num_partitions)
+        spatial_rdd = self.create_polygon_rdd(query_polygon_set, splitter, num_partitions)
+        self.partition_rdds(query_rdd, spatial_rdd, grid_type, use_legacy_apis)
+        query_data = {(geo_data.geom.wkt, geo_data.userData) for geo_data in query_rdd.rawSpatialRDD.collect()}
+
+        expected = JoinQuery.SpatialJoinQueryFlat(spatial_rdd, query_rdd, use_index, True).collect()
+        flat_result = JoinQuery.SpatialJoinQueryFlat(
+            spatial_rdd, query_rdd, use_index, True, referencePointDedup=True).collect()
+        result = JoinQuery.SpatialJoinQuery(spatial_rdd, query_rdd, use_index, True, referencePointDedup=True).collect()
+
+        assert len(flat_result) > 0
+        assert all((left.geom.wkt, left.userData) in query_data for left, _ in flat_result)
+        assert all((left.geom.wkt, left.userData) in query_data for left, _ in result)
+        assert self.flat_join_results_data(flat_result) == self.flat_join_results_data(expected)
+
+    @skip_without_libs(GeoSparkLib.JoinCardinality)
+    def test_estimate_join_cardinality(self, num_partitions, use_legacy_apis, grid_type):
+        query_rdd = self.create_polygon_rdd(query_polygon_set, splitter, num_partitions)
+        spatial_rdd = self.create_point_rdd(input_location, splitter, num_partitions)
+        self.partition_rdds(query_rdd, spatial_rdd, grid_type, use_legacy_apis)
+
+        estimate = JoinQuery.estimateJoinCardinality(spatial_rdd, query_rdd, True, sampleFraction=1.0)
+
+        if self.expect_to_preserve_original_duplicates(grid_type):
+            assert estimate.count == polygon_match_with_original_duplicates_count
+        else:
+            assert estimate.count >= polygon_match_count
+        assert estimate.skew >= 1.0
+
+        sampled_estimate = JoinQuery.estimateJoinCardinality(spatial_rdd, query_rdd, True, sampleFraction=0.5)
+        assert sum(partition.sampled_query_count for partition in sampled_estimate.partitions) < \
+            sum(partition.query_count for partition in sampled_estimate.partitions)
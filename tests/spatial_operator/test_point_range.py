@@ -3,10 +3,13 @@ import os
 import pytest
 
 from geo_pyspark.core.SpatialRDD import PointRDD
-from geo_pyspark.core.enums import IndexType, FileDataSplitter
+from geo_pyspark.core.enums import IndexType, FileDataSplitter, GridType
 from geo_pyspark.core.geom_types import Envelope
 from geo_pyspark.core.spatialOperator import RangeQuery
-from tests.test_base import TestBase
+from geo_pyspark.core.utils import ImportedJvmLib
+from geo_pyspark.register.geo_registrator import PackageImporter
+from geo_pyspark.register.java_libs import GeoSparkLib
+from tests.test_base import TestBase, skip_without_libs
 from tests.tools import tests_path
 
 input_location = os.path.join(tests_path, "resources/arealm-small.csv")
@@ -59,3 +62,51 @@ class TestPointRange(TestBase):
         assert RangeQuery.SpatialRangeQuery(
             spatial_rdd, self.query_envelope, False, False).take(10)[1].\
                    getUserData() is not None
+
+    @skip_without_libs(GeoSparkLib.RangeQueryPruning)
+    def test_spatial_range_query_on_partitioned_rdd(self):
+        spatial_rdd = PointRDD(self.sc, input_location, offset, splitter, False, numPartitions)
+        spatial_rdd.spatialPartitioning(GridType.KDBTREE)
+
+        partition_ids = spatial_rdd.getOverlappingPartitionIds(self.query_envelope)
+        all_partition_ids = spatial_rdd.getOverlappingPartitionIds(Envelope(-180.0, 180.0, -90.0, 90.0))
+        assert 0 < len(partition_ids) < len(all_partition_ids)
+
+        result_size = RangeQuery.\
+            SpatialRangeQuery(spatial_rdd, self.query_envelope, False, False)\
+            .count()
+        assert result_size == 2830
+
+        spatial_rdd.buildIndex(IndexType.RTREE, True)
+        result_size = RangeQuery.\
+            SpatialRangeQuery(spatial_rdd, self.query_envelope, False, True)\
+            .count()
+        assert result_size == 2830
+
+    def test_spatial_range_query_without_pruning_library(self, monkeypatch):
+        assert PackageImporter.is_available(self.sc._jvm, GeoSparkLib.RangeQuery.value)
+        assert not PackageImporter.is_available(self.sc._jvm, "org.imbruced.geo_pyspark.NotExisting")
+
+        monkeypatch.setattr(ImportedJvmLib, "_imported_libs", [
+            lib for lib in ImportedJvmLib._imported_libs if lib != GeoSparkLib.RangeQueryPruning
+        ])
+        spatial_rdd = PointRDD(self.sc, input_location, offset, splitter, False, numPartitions)
+        spatial_rdd.spatialPartitioning(GridType.KDBTREE)
+
+        result_size = RangeQuery.\
+            SpatialRangeQuery(spatial_rdd, self.query_envelope, False, False)\
+            .count()
+        assert result_size == 2830
+
+    @skip_without_libs(GeoSparkLib.PointArraySerializer)
+    def test_spatial_range_query_point_arrays(self):
+        spatial_rdd = PointRDD(self.sc, input_location, offset, splitter, True)
+
+        point_arrays = RangeQuery.\
+            SpatialRangeQueryPointArrays(spatial_rdd, self.query_envelope, False, False, True, 1000)\
+            .collect()
+
+        assert sum(len(point_array) for point_array in point_arrays) == 2830
+        assert all(len(point_array) <= 1000 for point_array in point_arrays)
+        assert point_arrays[0].coordinates.shape[1] == 2
+        assert len(point_arrays[0].userData) == len(point_arrays[0])
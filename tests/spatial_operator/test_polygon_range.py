@@ -4,7 +4,7 @@ import pytest
 from pyspark import StorageLevel
 
 from geo_pyspark.core.SpatialRDD import PolygonRDD
-from geo_pyspark.core.enums import IndexType, FileDataSplitter
+from geo_pyspark.core.enums import IndexType, FileDataSplitter, GridType
 from geo_pyspark.core.geom_types import Envelope
 from geo_pyspark.core.spatialOperator import RangeQuery
 from tests.test_base import TestBase
@@ -44,3 +44,20 @@ class TestPolygonRange(TestBase):
 
         assert RangeQuery.SpatialRangeQuery(
             spatial_rdd, self.query_envelope, False, False).take(10)[0].getUserData() is not None
+
+    def test_spatial_range_query_on_partitioned_rdd(self):
+        for grid_type in [GridType.QUADTREE, GridType.KDBTREE, GridType.EQUALGRID]:
+            spatial_rdd = PolygonRDD(
+                self.sc, input_location, splitter, True, StorageLevel.MEMORY_ONLY
+            )
+            spatial_rdd.spatialPartitioning(grid_type)
+            result_size = RangeQuery.\
+                SpatialRangeQuery(spatial_rdd, self.query_envelope, False, False).count()
+            assert result_size == 704
+
+            result_size = RangeQuery.\
+                SpatialRangeQuery(spatial_rdd, self.query_envelope, True, False).count()
+            assert result_size == RangeQuery.SpatialRangeQuery(
+                PolygonRDD(self.sc, input_location, splitter, True, StorageLevel.MEMORY_ONLY),
+                self.query_envelope, True, False
+            ).count()
@@ -7,9 +7,10 @@ from geo_pyspark.core.SpatialRDD import PointRDD
 from geo_pyspark.core.SpatialRDD.spatial_rdd import SpatialRDD
 from geo_pyspark.core.enums import IndexType, GridType
 from geo_pyspark.core.geom_types import Envelope
+from geo_pyspark.register.java_libs import GeoSparkLib
 from tests.point_properties import input_location, offset, splitter, num_partitions, input_count, input_boundary, \
     transformed_envelope, crs_point_test, crs_envelope, crs_envelope_transformed
-from tests.test_base import TestBase
+from tests.test_base import TestBase, skip_without_libs
 
 
 class TestPointRDD(TestBase):
@@ -70,6 +71,21 @@ class TestPointRDD(TestBase):
                                     "epsg:4326", "epsg:5070")
         self.compare_count(spatial_rdd_copy, 20000, crs_envelope_transformed)
 
+    @skip_without_libs(GeoSparkLib.PointArraySerializer)
+    def test_get_raw_point_arrays(self):
+        spatial_rdd = PointRDD(self.sc, input_location, offset, splitter, True, num_partitions)
+
+        point_arrays = spatial_rdd.getRawPointArrays().collect()
+        geo_data = spatial_rdd.rawSpatialRDD.collect()
+
+        assert sum(len(point_array) for point_array in point_arrays) == input_count
+        assert point_arrays[0].userData is None
+        assert point_arrays[0].x[0] == geo_data[0].geom.x
+        assert point_arrays[0].y[0] == geo_data[0].geom.y
+
+        point_arrays_with_user_data = spatial_rdd.getRawPointArrays(True).collect()
+        assert point_arrays_with_user_data[0].userData[0] == geo_data[0].getUserData()
+
     def test_empty_constructor(self):
         spatial_rdd = PointRDD(
             sparkContext=self.sc,
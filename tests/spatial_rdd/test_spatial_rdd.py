@@ -5,11 +5,14 @@ from pyspark import StorageLevel, RDD
 from shapely.geometry import Point
 
 from geo_pyspark.core.SpatialRDD import PointRDD
+from geo_pyspark.core.SpatialRDD.spatial_rdd import SpatialPartitioner, SpatialRDD
 from geo_pyspark.core.enums import FileDataSplitter, GridType, IndexType
 from geo_pyspark.core.formatMapper.geo_json_reader import GeoJsonReader
 from geo_pyspark.core.geom_types import Envelope
-from tests.test_base import TestBase
-from tests.tools import tests_path
+from geo_pyspark.core.utils import ImportedJvmLib
+from geo_pyspark.register.java_libs import GeoSparkLib
+from tests.test_base import TestBase, skip_without_libs
+from tests.tools import tests_path, create_area_lm_point_rdd
 
 input_file_location = os.path.join(tests_path, "resources/arealm-small.csv")
 crs_test_point = os.path.join(tests_path, "resources/crs-test-point.csv")
@@ -25,21 +28,73 @@ numPartitions = 11
 class TestSpatialRDD(TestBase):
 
     def create_spatial_rdd(self):
-        spatial_rdd = PointRDD(
-            sparkContext=self.sc,
-            InputLocation=input_file_location,
-            Offset=offset,
-            splitter=splitter,
-            carryInputData=True,
-            partitions=numPartitions,
-            newLevel=StorageLevel.MEMORY_ONLY
-        )
-        return spatial_rdd
+        return create_area_lm_point_rdd(self.sc, True, numPartitions)
 
     def test_analyze(self):
         spatial_rdd = self.create_spatial_rdd()
         assert spatial_rdd.analyze()
 
+    @skip_without_libs(GeoSparkLib.SpatialStatistics)
+    def test_analyze_statistics(self):
+        spatial_rdd = self.create_spatial_rdd()
+        spatial_rdd.analyze()
+        statistics = spatial_rdd.statistics
+
+        assert statistics.count == 3000
+        assert statistics.boundary == Envelope(minx=-173.120769, maxx=-84.965961, miny=30.244859, maxy=71.355134)
+        assert len(statistics.partitions) == spatial_rdd.rawSpatialRDD.getNumPartitions()
+        assert spatial_rdd.approximateTotalCount == 3000
+
+        spatial_rdd.analyze()
+        assert spatial_rdd.statistics is statistics
+
+        spatial_rdd.spatialPartitioning(GridType.KDBTREE)
+        partitioned_statistics = spatial_rdd.statistics
+        assert partitioned_statistics is not statistics
+        assert partitioned_statistics.count == 3000
+
+        spatial_rdd.CRSTransform("epsg:4326", "epsg:3857")
+        assert spatial_rdd.statistics is not partitioned_statistics
+
+    def test_analyze_without_statistics_library(self, monkeypatch):
+        monkeypatch.setattr(ImportedJvmLib, "_imported_libs", [
+            lib for lib in ImportedJvmLib._imported_libs if lib != GeoSparkLib.SpatialStatistics
+        ])
+        spatial_rdd = self.create_spatial_rdd()
+
+        assert spatial_rdd.analyze()
+        assert spatial_rdd.statistics.count == 3000
+        assert spatial_rdd.statistics.boundary == spatial_rdd.boundaryEnvelope
+        spatial_rdd.spatialPartitioning(GridType.KDBTREE)
+
+    def test_save_and_load_statistics(self, tmp_path):
+        statistics_location = str(tmp_path / "statistics")
+        spatial_rdd = self.create_spatial_rdd()
+        spatial_rdd.saveStatistics(statistics_location)
+
+        loaded_rdd = self.create_spatial_rdd()
+        loaded_rdd.loadStatistics(statistics_location)
+
+        assert loaded_rdd.statistics == spatial_rdd.statistics
+        assert loaded_rdd.boundaryEnvelope == spatial_rdd.boundaryEnvelope
+        assert loaded_rdd.approximateTotalCount == 3000
+        loaded_rdd.spatialPartitioning(GridType.KDBTREE)
+
+    @skip_without_libs(GeoSparkLib.SpatialStatistics)
+    def test_partition_stats(self):
+        spatial_rdd = self.create_spatial_rdd()
+        raw_report = spatial_rdd.partitionStats()
+        assert len(raw_report.partitions) == spatial_rdd.rawSpatialRDD.getNumPartitions()
+
+        spatial_rdd.spatialPartitioning(GridType.KDBTREE)
+        report = spatial_rdd.partitionStats()
+
+        assert sum(partition.count for partition in report.partitions) == 3000
+        assert all(partition.number_of_vertices == partition.count for partition in report.partitions)
+        assert all(partition.serialized_size > 0 for partition in report.partitions if partition.count > 0)
+        assert report.count_skew >= 1.0
+        assert report.summary()["count"] == 3000
+
     def test_crs_transform(self):
         spatial_rdd = PointRDD(
             sparkContext=self.sc,
@@ -207,6 +262,93 @@ class TestSpatialRDD(TestBase):
 
         print(spatial_rdd.partitionTree)
 
+    @skip_without_libs(GeoSparkLib.PartitionTreeSerializer)
+    def test_partition_tree_find_zone(self):
+        for grid_type in [GridType.QUADTREE, GridType.KDBTREE]:
+            spatial_rdd = self.create_spatial_rdd()
+            spatial_rdd.spatialPartitioning(grid_type)
+            partition_tree = spatial_rdd.partitionTree
+            number_of_grids = spatial_rdd.getPartitioner().jvm_partitioner.getGrids().size()
+
+            assert partition_tree.getTotalNumLeafNode() == number_of_grids
+            assert len(partition_tree.getLeafZones()) == number_of_grids
+            assert isinstance(partition_tree.getAllZones()[0], Envelope)
+
+            for point in spatial_rdd.rawSpatialRDD.map(lambda x: x.geom).take(100):
+                partition_ids = partition_tree.findZone(point)
+                assert len(partition_ids) == 1
+                assert 0 <= partition_ids[0] < number_of_grids
+
+    @skip_without_libs(GeoSparkLib.SpatialPartitionerSerializer)
+    def test_save_and_load_partitioner(self, tmp_path):
+        partitioner_location = str(tmp_path / "partitioner.bin")
+        for grid_type in [GridType.QUADTREE, GridType.KDBTREE, GridType.EQUALGRID]:
+            spatial_rdd = self.create_spatial_rdd()
+            spatial_rdd.spatialPartitioning(grid_type)
+            spatial_rdd.getPartitioner().save(partitioner_location)
+
+            loaded_partitioner = SpatialPartitioner.load(partitioner_location)
+            assert loaded_partitioner.name == spatial_rdd.getPartitioner().name
+
+            other_spatial_rdd = self.create_spatial_rdd()
+            other_spatial_rdd.spatialPartitioning(loaded_partitioner)
+
+            assert other_spatial_rdd.getPartitioner().jvm_partitioner.numPartitions() == \
+                spatial_rdd.getPartitioner().jvm_partitioner.numPartitions()
+            assert other_spatial_rdd.countWithoutDuplicatesSPRDD() == spatial_rdd.countWithoutDuplicatesSPRDD()
+
+    @skip_without_libs(GeoSparkLib.IndexedRDDPersistence)
+    def test_save_and_load_indexed(self, tmp_path):
+        indexed_location = str(tmp_path / "indexed")
+        spatial_rdd = self.create_spatial_rdd()
+        spatial_rdd.spatialPartitioning(GridType.KDBTREE)
+        spatial_rdd.buildIndex(IndexType.RTREE, True)
+        spatial_rdd.saveIndexed(indexed_location)
+
+        loaded_rdd = SpatialRDD.loadIndexed(self.sc, indexed_location)
+
+        assert loaded_rdd.getPartitioner().name == "KDBTreePartitioner"
+        assert loaded_rdd.jvm_indexed_rdd.j_indexed_rdd is not None
+        assert loaded_rdd.countWithoutDuplicatesSPRDD() == spatial_rdd.countWithoutDuplicatesSPRDD()
+        assert loaded_rdd.rawSpatialRDD.count() == 3000
+        loaded_rdd.analyze()
+        assert loaded_rdd.approximateTotalCount == 3000
+
+        indexed_raw_location = str(tmp_path / "indexed_raw")
+        raw_rdd = self.create_spatial_rdd()
+        raw_rdd.buildIndex(IndexType.QUADTREE, False)
+        raw_rdd.saveIndexed(indexed_raw_location)
+
+        loaded_raw_rdd = SpatialRDD.loadIndexed(self.sc, indexed_raw_location)
+        assert loaded_raw_rdd.jvm_indexed_raw_rdd.j_indexed_raw_rdd is not None
+        assert loaded_raw_rdd.rawSpatialRDD.count() == 3000
+
+    @skip_without_libs(GeoSparkLib.PartitionedDataset)
+    def test_save_and_load_partitioned(self, tmp_path):
+        partitioned_location = str(tmp_path / "partitioned")
+        spatial_rdd = self.create_spatial_rdd()
+        spatial_rdd.spatialPartitioning(GridType.KDBTREE)
+        spatial_rdd.savePartitioned(partitioned_location)
+
+        manifest = SpatialRDD.readManifest(self.sc, partitioned_location)
+        assert manifest.count == 3000
+        assert manifest.boundary == Envelope(minx=-173.120769, maxx=-84.965961, miny=30.244859, maxy=71.355134)
+
+        loaded_rdd = SpatialRDD.loadPartitioned(self.sc, partitioned_location)
+        assert loaded_rdd.rawSpatialRDD.count() == 3000
+        assert loaded_rdd.approximateTotalCount == 3000
+
+        query_window = Envelope(-90.01, -80.01, 30.01, 40.01)
+        expected = [
+            geo_data for geo_data in spatial_rdd.rawSpatialRDD.collect()
+            if geo_data.geom.intersects(query_window)
+        ]
+        window_rdd = SpatialRDD.loadPartitioned(self.sc, partitioned_location, query_window)
+        geometries = window_rdd.rawSpatialRDD.collect()
+
+        assert len(geometries) == len(expected)
+        assert sorted(geo_data.userData for geo_data in geometries) == sorted(geo_data.userData for geo_data in expected)
+
     def test_raw_spatial_rdd(self):
         pass
 
@@ -1,3 +1,4 @@
+import gzip
 import os
 import shutil
 
@@ -5,10 +6,12 @@ import pytest
 from pyspark import StorageLevel
 
 from geo_pyspark.core.SpatialRDD import PointRDD
+from geo_pyspark.core.SpatialRDD.spatial_rdd import SpatialRDD
 from geo_pyspark.core.enums import FileDataSplitter
 from geo_pyspark.core.geom_types import Envelope
-from tests.test_base import TestBase
-from tests.tools import tests_path
+from geo_pyspark.register.java_libs import GeoSparkLib
+from tests.test_base import TestBase, skip_without_libs
+from tests.tools import tests_path, create_area_lm_point_rdd
 
 wkb_folder = "wkb"
 wkt_folder = "wkt"
@@ -49,6 +52,15 @@ def remove_directory(path: str) -> bool:
     return True
 
 
+def read_part_files(path: str) -> bytes:
+    content = b""
+    for name in sorted(name for name in os.listdir(path) if name.startswith("part-")):
+        with open(os.path.join(path, name), "rb") as part_file:
+            data = part_file.read()
+        content += gzip.decompress(data) if name.endswith(".gz") else data
+    return content
+
+
 @pytest.fixture
 def remove_wkb_directory():
     remove_directory(test_save_as_wkb_with_data)
@@ -79,3 +91,48 @@ class TestSpatialRDDWriter(TestBase):
         )
 
         assert result_wkb.rawSpatialRDD.count() == spatial_rdd.rawSpatialRDD.count()
+
+    @skip_without_libs(GeoSparkLib.SpatialRDDWriter)
+    def test_save_as_compressed_wkt(self, tmp_path):
+        test_save_as_compressed_wkt = str(tmp_path / "testSaveAsCompressedWKT")
+        spatial_rdd = create_area_lm_point_rdd(self.sc, True, numPartitions)
+        spatial_rdd.saveAsWKT(test_save_as_compressed_wkt, codec="gzip")
+
+        assert any(name.endswith(".gz") for name in os.listdir(test_save_as_compressed_wkt))
+
+        result_wkt = PointRDD(
+            sparkContext=self.sc,
+            InputLocation=test_save_as_compressed_wkt,
+            Offset=0,
+            splitter=FileDataSplitter.WKT,
+            carryInputData=True,
+            partitions=numPartitions,
+            newLevel=StorageLevel.MEMORY_ONLY
+        )
+        assert result_wkt.rawSpatialRDD.count() == inputCount
+
+    @skip_without_libs(GeoSparkLib.SpatialRDDWriter)
+    def test_compressed_output_matches_geospark_output(self, tmp_path):
+        spatial_rdd = create_area_lm_point_rdd(self.sc, True, numPartitions)
+
+        for save in ["saveAsWKT", "saveAsWKB", "saveAsGeoJSON"]:
+            plain_location = str(tmp_path / f"{save}Plain")
+            compressed_location = str(tmp_path / f"{save}Compressed")
+            getattr(spatial_rdd, save)(plain_location)
+            getattr(spatial_rdd, save)(compressed_location, codec="gzip")
+
+            assert read_part_files(compressed_location) == read_part_files(plain_location)
+
+    @skip_without_libs(GeoSparkLib.SpatialRDDWriter)
+    def test_save_as_wkb_sequence_file(self, tmp_path):
+        test_save_as_wkb_sequence_file = str(tmp_path / "testSaveAsWKBSequenceFile")
+        spatial_rdd = create_area_lm_point_rdd(self.sc, True, numPartitions)
+        spatial_rdd.saveAsWKBSequenceFile(test_save_as_wkb_sequence_file, codec="gzip")
+
+        loaded_rdd = SpatialRDD.loadWKBSequenceFile(self.sc, test_save_as_wkb_sequence_file)
+        expected = spatial_rdd.rawSpatialRDD.collect()
+        loaded = loaded_rdd.rawSpatialRDD.collect()
+
+        assert len(loaded) == inputCount
+        assert sorted((geo_data.geom.wkt, geo_data.userData) for geo_data in loaded) == \
+            sorted((geo_data.geom.wkt, geo_data.userData) for geo_data in expected)
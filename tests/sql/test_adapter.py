@@ -11,11 +11,12 @@ from geo_pyspark.core.enums import FileDataSplitter, GridType, IndexType
 from geo_pyspark.core.formatMapper.shapefileParser.shape_file_reader import ShapefileReader
 from geo_pyspark.core.spatialOperator import JoinQuery
 from geo_pyspark.utils.adapter import Adapter
+from geo_pyspark.register.java_libs import GeoSparkLib
 from tests.data import geojson_input_location, shape_file_with_missing_trailing_input_location, \
     geojson_id_input_location
 from tests.data import shape_file_input_location, area_lm_point_input_location
 from tests.data import mixed_wkt_geometry_input_location
-from tests.test_base import TestBase
+from tests.test_base import TestBase, skip_without_libs
 
 
 class TestAdapter(TestBase):
@@ -315,3 +316,36 @@ class TestAdapter(TestBase):
 
         assert spatial_df.columns == ["geometry", *spatial_columns]
         assert spatial_df.count() == 1001
+
+    @skip_without_libs(GeoSparkLib.PairRDDAdapter)
+    def test_join_result_to_dataframe_on_jvm(self):
+        point_csv_df = self.spark.read.format("csv").option("delimiter", ",").option("header", "false").load(
+            area_lm_point_input_location)
+        point_csv_df.createOrReplaceTempView("pointtable")
+        point_df = self.spark.sql(
+            "select ST_Point(cast(pointtable._c0 as Decimal(24,20)),cast(pointtable._c1 as Decimal(24,20))) as arealandmark from pointtable")
+        point_rdd = Adapter.toSpatialRdd(point_df, "arealandmark")
+        point_rdd.analyze()
+
+        polygon_wkt_df = self.spark.read.format("csv").option("delimiter", "\t").option("header", "false").load(
+            mixed_wkt_geometry_input_location)
+        polygon_wkt_df.createOrReplaceTempView("polygontable")
+        polygon_df = self.spark.sql("select ST_GeomFromWKT(polygontable._c0) as usacounty from polygontable")
+        polygon_rdd = Adapter.toSpatialRdd(polygon_df, "usacounty")
+        polygon_rdd.analyze()
+
+        point_rdd.spatialPartitioning(GridType.KDBTREE)
+        polygon_rdd.spatialPartitioning(point_rdd.getPartitioner())
+
+        join_result = JoinQuery.SpatialJoinQueryFlat(point_rdd, polygon_rdd, False, True)
+
+        jvm_df = Adapter.toDf(join_result, self.spark)
+        python_df = Adapter.toDf(join_result.map(lambda pair: pair), self.spark)
+
+        assert jvm_df.columns == python_df.columns
+        assert jvm_df.schema.fields[0].dataType.typeName() == python_df.schema.fields[0].dataType.typeName()
+        assert jvm_df.count() == python_df.count()
+        assert sorted(row[0].wkt for row in jvm_df.collect()) == sorted(row[0].wkt for row in python_df.collect())
+
+        named_df = Adapter.toDf(join_result, ["abc", "def"], list(), self.spark)
+        assert named_df.columns == ["geom_1", "abc", "def", "geom_2"]
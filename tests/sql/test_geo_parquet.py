@@ -0,0 +1,45 @@
+from geo_pyspark.core.geom_types import Envelope
+from geo_pyspark.register.java_libs import GeoSparkLib
+from geo_pyspark.sql.geo_parquet import GeoParquet
+from tests.data import csv_polygon_input_location
+from tests.test_base import TestBase, skip_without_libs
+
+
+class TestGeoParquet(TestBase):
+
+    def polygon_df(self):
+        self.spark.read.format("csv").option("delimiter", ",").option("header", "false").\
+            load(csv_polygon_input_location).createOrReplaceTempView("polygontable")
+        return self.spark.sql(
+            "select _c0 as id, ST_PolygonFromEnvelope(cast(polygontable._c0 as Decimal(24,20)),cast(polygontable._c1 as Decimal(24,20)), cast(polygontable._c2 as Decimal(24,20)), cast(polygontable._c3 as Decimal(24,20))) as geometry from polygontable")
+
+    @skip_without_libs(GeoSparkLib.GeoParquet, GeoSparkLib.SpaceFillingCurve)
+    def test_write_and_read(self, tmp_path):
+        parquet_location = str(tmp_path / "geo_parquet")
+        polygon_df = self.polygon_df()
+        GeoParquet.write(polygon_df, parquet_location, "geometry")
+
+        stored_df = self.spark.read.parquet(parquet_location)
+        assert set(stored_df.columns) == {"id", "geometry", "xmin", "ymin", "xmax", "ymax"}
+        assert GeoParquet.bbox(self.spark, parquet_location) is not None
+
+        loaded_df = GeoParquet.read(self.spark, parquet_location)
+        assert loaded_df.columns == ["id", "geometry"]
+        assert loaded_df.count() == polygon_df.count()
+        assert sorted(row.geometry.wkt for row in loaded_df.collect()) == \
+            sorted(row.geometry.wkt for row in polygon_df.collect())
+
+    @skip_without_libs(GeoSparkLib.GeoParquet, GeoSparkLib.SpaceFillingCurve)
+    def test_read_with_query_window(self, tmp_path):
+        parquet_location = str(tmp_path / "geo_parquet")
+        polygon_df = self.polygon_df()
+        polygon_df.createOrReplaceTempView("polygondf")
+        GeoParquet.write(polygon_df, parquet_location, "geometry")
+
+        expected = self.spark.sql(
+            "select * from polygondf where ST_Intersects(geometry, ST_PolygonFromEnvelope(100.0, 200.0, 300.0, 400.0))"
+        ).count()
+
+        window_df = GeoParquet.read(self.spark, parquet_location, Envelope(100.0, 300.0, 200.0, 400.0))
+        assert window_df.count() == expected
+        assert GeoParquet.read(self.spark, parquet_location, Envelope(5000.0, 5001.0, 5000.0, 5001.0)).count() == 0
@@ -0,0 +1,60 @@
+from pyspark.sql.functions import col, expr
+from shapely.geometry import Point
+
+from geo_pyspark.sql import polygon_lookup
+from geo_pyspark.sql.polygon_lookup import PolygonLookup
+from tests.data import mixed_wkt_geometry_input_location, area_lm_point_input_location
+from tests.test_base import TestBase
+
+
+class TestPolygonLookup(TestBase):
+
+    def test_polygon_lookup_udf(self):
+        polygon_df = self.spark.read.format("csv").option("delimiter", "\t").option("header", "false").\
+            load(mixed_wkt_geometry_input_location).\
+            select(expr("ST_GeomFromWKT(_c0)").alias("geometry"), expr("concat(_c1, _c2)").alias("county_id"))
+        point_df = self.spark.read.format("csv").option("delimiter", ",").option("header", "false").\
+            load(area_lm_point_input_location).\
+            select(col("_c0").cast("double").alias("x"), col("_c1").cast("double").alias("y"))
+
+        lookup = PolygonLookup.from_dataframe(polygon_df, "geometry", "county_id")
+        tagged_df = point_df.withColumn("county_id", lookup.udf()(col("x"), col("y")))
+
+        polygons = [(row.county_id, row.geometry) for row in polygon_df.collect()]
+        points = [(row.x, row.y) for row in point_df.collect()]
+        expected = lookup.lookup([x for x, _ in points], [y for _, y in points])
+
+        assert tagged_df.count() == len(points)
+        assert sorted(row.county_id for row in tagged_df.collect() if row.county_id is not None) == \
+            sorted(polygon_id for polygon_id in expected if polygon_id is not None)
+        assert all(
+            any(polygon_id == county_id and geometry.contains(Point(x, y)) for county_id, geometry in polygons)
+            for (x, y), polygon_id in zip(points[:200], expected[:200]) if polygon_id is not None
+        )
+
+    def test_polygon_lookup_id_type_and_eviction(self):
+        polygon_df = self.spark.read.format("csv").option("delimiter", "\t").option("header", "false").\
+            load(mixed_wkt_geometry_input_location).\
+            select(expr("ST_GeomFromWKT(_c0)").alias("geometry"), expr("cast(concat(_c1, _c2) as int)").alias("county_id"))
+        point_df = self.spark.read.format("csv").option("delimiter", ",").option("header", "false").\
+            load(area_lm_point_input_location).\
+            select(col("_c0").cast("double").alias("x"), col("_c1").cast("double").alias("y"))
+
+        lookup = PolygonLookup.from_dataframe(polygon_df, "geometry", "county_id")
+        tagged_df = point_df.withColumn("county_id", lookup.udf()(col("x"), col("y")))
+
+        assert tagged_df.schema["county_id"].dataType == polygon_df.schema["county_id"].dataType
+        assert all(isinstance(row.county_id, int) for row in tagged_df.collect() if row.county_id is not None)
+
+        lookup.index()
+        lookup.unpersist()
+        assert lookup._key not in polygon_lookup._INDEXES
+
+        lookups = [PolygonLookup.from_dataframe(polygon_df, "geometry", "county_id")
+                   for _ in range(polygon_lookup.MAX_CACHED_INDEXES + 1)]
+        for other_lookup in lookups:
+            other_lookup.index()
+        assert len(polygon_lookup._INDEXES) == polygon_lookup.MAX_CACHED_INDEXES
+        assert lookups[0]._key not in polygon_lookup._INDEXES
+        for other_lookup in lookups:
+            other_lookup.destroy()
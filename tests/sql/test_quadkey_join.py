@@ -0,0 +1,46 @@
+from tests.data import csv_polygon_input_location, csv_point_input_location, overlap_polygon_input_location
+from tests.test_base import TestBase, skip_without_libs
+
+from geo_pyspark.register.java_libs import GeoSparkLib
+from geo_pyspark.sql.quadkey_join import QuadKeyJoin
+
+
+class TestQuadKeyJoin(TestBase):
+
+    def polygon_df(self, location: str):
+        self.spark.read.format("csv").option("delimiter", ",").option("header", "false").load(location).\
+            createOrReplaceTempView("polygontable")
+        return self.spark.sql(
+            "select ST_PolygonFromEnvelope(cast(polygontable._c0 as Decimal(24,20)),cast(polygontable._c1 as Decimal(24,20)), cast(polygontable._c2 as Decimal(24,20)), cast(polygontable._c3 as Decimal(24,20))) as polygonshape from polygontable")
+
+    def point_df(self):
+        self.spark.read.format("csv").option("delimiter", ",").option("header", "false").load(csv_point_input_location).\
+            createOrReplaceTempView("pointtable")
+        return self.spark.sql(
+            "select ST_Point(cast(pointtable._c0 as Decimal(24,20)),cast(pointtable._c1 as Decimal(24,20))) as pointshape from pointtable")
+
+    @skip_without_libs(GeoSparkLib.QuadKeyJoin)
+    def test_st_contains_join(self):
+        join_df = QuadKeyJoin.join(
+            self.polygon_df(csv_polygon_input_location), "polygonshape", self.point_df(), "pointshape",
+            "ST_Contains", level=8
+        )
+
+        assert join_df.columns == ["polygonshape", "pointshape"]
+        assert join_df.count() == 1000
+
+    @skip_without_libs(GeoSparkLib.QuadKeyJoin)
+    def test_st_intersects_join_of_polygons_is_deduplicated(self):
+        polygon_df = self.polygon_df(csv_polygon_input_location)
+        overlap_df = self.polygon_df(overlap_polygon_input_location).\
+            withColumnRenamed("polygonshape", "overlapshape")
+        polygon_df.createOrReplaceTempView("polygondf")
+        overlap_df.createOrReplaceTempView("overlapdf")
+
+        expected = self.spark.sql(
+            "select * from polygondf, overlapdf where ST_Intersects(polygondf.polygonshape, overlapdf.overlapshape)"
+        ).count()
+
+        for level in [0, 6, 12]:
+            join_df = QuadKeyJoin.join(polygon_df, "polygonshape", overlap_df, "overlapshape", "ST_Intersects", level)
+            assert join_df.count() == expected
@@ -0,0 +1,67 @@
+import numpy as np
+from pyspark.sql.functions import col
+
+from geo_pyspark.core.enums import GridType
+from geo_pyspark.core.geom_types import Envelope
+from geo_pyspark.core.space_filling_curve import hilbert_key, zorder_key
+from geo_pyspark.core.utils import ImportedJvmLib
+from geo_pyspark.register import GeoSparkRegistrator
+from geo_pyspark.register.java_libs import GeoSparkLib
+from tests.data import area_lm_point_input_location
+from tests.test_base import TestBase, skip_without_libs
+from tests.tools import create_area_lm_point_rdd
+
+extent = Envelope(-180.0, 180.0, -90.0, 90.0)
+
+
+class TestSpaceFillingCurve(TestBase):
+
+    @skip_without_libs(GeoSparkLib.SpaceFillingCurve)
+    def test_sql_keys_match_numpy_keys(self):
+        point_df = self.spark.read.format("csv").option("delimiter", ",").option("header", "false").\
+            load(area_lm_point_input_location).\
+            select(col("_c0").cast("double").alias("x"), col("_c1").cast("double").alias("y"))
+        point_df.createOrReplaceTempView("points")
+
+        rows = self.spark.sql(
+            "SELECT x, y, "
+            "ST_HilbertKey(ST_Point(CAST(x AS Decimal(24, 20)), CAST(y AS Decimal(24, 20))), 16, -180.0, 180.0, -90.0, 90.0) AS hilbert, "
+            "ST_ZOrderKey(ST_Point(CAST(x AS Decimal(24, 20)), CAST(y AS Decimal(24, 20))), 16, -180.0, 180.0, -90.0, 90.0) AS zorder "
+            "FROM points LIMIT 1000"
+        ).collect()
+
+        x = np.array([row.x for row in rows])
+        y = np.array([row.y for row in rows])
+
+        assert [row.hilbert for row in rows] == hilbert_key(x, y, extent, 16).tolist()
+        assert [row.zorder for row in rows] == zorder_key(x, y, extent, 16).tolist()
+
+    def test_register_without_helper_functions(self, monkeypatch):
+        helper_libs = [GeoSparkLib.SpaceFillingCurve, GeoSparkLib.QuadKeyJoin, GeoSparkLib.GeoParquet]
+        monkeypatch.setattr(ImportedJvmLib, "_imported_libs", [
+            lib for lib in ImportedJvmLib._imported_libs if lib not in helper_libs
+        ])
+
+        GeoSparkRegistrator.register(self.spark)
+        assert self.spark.sql("SELECT ST_AsText(ST_GeomFromWKT('POINT (1 2)'))").collect()[0][0] == "POINT (1 2)"
+
+    @skip_without_libs(GeoSparkLib.SpaceFillingCurve)
+    def test_sort_within_partitions(self):
+        spatial_rdd = create_area_lm_point_rdd(self.sc)
+        spatial_rdd.spatialPartitioning(GridType.KDBTREE)
+        number_of_partitions = spatial_rdd.spatialPartitionedRDD().getNumPartitions()
+
+        assert spatial_rdd.sortWithinPartitions("hilbert", 16)
+
+        partitions = spatial_rdd.partitionStats().partitions
+        assert len(partitions) == number_of_partitions
+        assert sum(partition.count for partition in partitions) == 3000
+
+        raw_rdd = create_area_lm_point_rdd(self.sc)
+        raw_rdd.sortWithinPartitions("zorder", 12)
+        boundary = raw_rdd.statistics.boundary
+        for partition in raw_rdd.rawSpatialRDD.glom().collect():
+            x = np.array([geo_data.geom.x for geo_data in partition])
+            y = np.array([geo_data.geom.y for geo_data in partition])
+            keys = zorder_key(x, y, boundary, 12)
+            assert (np.diff(keys) >= 0).all()
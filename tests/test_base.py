@@ -1,6 +1,11 @@
+from functools import wraps
+
+import pytest
 from pyspark.sql import SparkSession
 
+from geo_pyspark.core.utils import ImportedJvmLib
 from geo_pyspark.register import upload_jars, GeoSparkRegistrator
+from geo_pyspark.register.java_libs import GeoSparkLib
 from geo_pyspark.utils import KryoSerializer, GeoSparkKryoRegistrator
 from geo_pyspark.utils.decorators import classproperty
 
@@ -30,3 +35,18 @@ class TestBase:
             setattr(self, "__sc", self.spark._sc)
         return getattr(self, "__sc")
 
+
+def skip_without_libs(*libraries: GeoSparkLib):
+    """
+    Skips test when classes it depends on are not shipped in installed geo_wrapper jar.
+    """
+    def decorator(test):
+        @wraps(test)
+        def run_test(self, *args, **kwargs):
+            TestBase.spark
+            missing = [library.name for library in libraries if not ImportedJvmLib.has_library(library)]
+            if missing:
+                pytest.skip(f"{', '.join(missing)} not available in installed jar")
+            return test(self, *args, **kwargs)
+        return run_test
+    return decorator
@@ -1,10 +1,26 @@
 from os import path
 
+from pyspark import SparkContext, StorageLevel
 from shapely.geometry import Point
 
+from geo_pyspark.core.SpatialRDD import PointRDD
 from geo_pyspark.core.data import GeoData
+from geo_pyspark.core.enums import FileDataSplitter
 
 tests_path = path.abspath(path.dirname(__file__))
+area_lm_point_location = path.join(tests_path, "resources/arealm-small.csv")
+
+
+def create_area_lm_point_rdd(sc: SparkContext, carryInputData: bool = True, partitions: int = 11) -> PointRDD:
+    return PointRDD(
+        sparkContext=sc,
+        InputLocation=area_lm_point_location,
+        Offset=1,
+        splitter=FileDataSplitter.CSV,
+        carryInputData=carryInputData,
+        partitions=partitions,
+        newLevel=StorageLevel.MEMORY_ONLY
+    )
 
 
 def distance_sorting_functions(geo_data: GeoData, query_point: Point):